@@ -444,6 +444,7 @@ from tkinter import ttk
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog, scrolledtext
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import json
 import time
@@ -453,6 +454,10 @@ import sqlite3
 import threading
 import queue
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter, itemgetter
+from collections import OrderedDict, deque
+from functools import lru_cache, partial
 import base64
 import hmac
 import hashlib
@@ -467,25 +472,56 @@ from typing import Dict, List, Optional, Tuple, Any
 import discogs_client
 from requests_toolbelt.multipart.encoder import MultipartEncoder # Import for manual multipart construction
 
-# Phase 1: Image Workflow Imports
+# Phase 1: Image Workflow Imports (Pillow drives the image previews and QR scanning)
 try:
-    import qrcode
     from PIL import Image, ImageTk
-    QR_LIBRARIES_AVAILABLE = True
 except ImportError:
-    qrcode = None
     Image = None
     ImageTk = None
-    QR_LIBRARIES_AVAILABLE = False
 
-# Phase 2: QR Decoding Imports
+
+# QR encode/decode libraries are only needed by the QR features, so they are
+# imported on first use rather than at startup; the result is memoized.
+@lru_cache(maxsize=None)
+def _qr_encoder():
+    """segno if installed (preferred), else the qrcode package, else None."""
+    try:
+        import segno
+        return segno
+    except ImportError:
+        pass
+    try:
+        import qrcode
+        return qrcode
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _qr_decoder():
+    """pyzbar's (decode, ZBarSymbol), or None if pyzbar/zbar or Pillow is missing."""
+    if Image is None:
+        return None
+    try:
+        from pyzbar.pyzbar import decode, ZBarSymbol
+    except ImportError:
+        return None
+    return decode, ZBarSymbol
+
+# Optional fast JSON encoding/decoding for stored lister payloads
 try:
-    from pyzbar.pyzbar import decode as qr_decode, ZBarSymbol
-    QR_DECODER_AVAILABLE = True
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
 except ImportError:
-    qr_decode = None
-    ZBarSymbol = None
-    QR_DECODER_AVAILABLE = False
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        # Compact separators, matching orjson's output
+        return json.dumps(obj, separators=(",", ":"))
 
 # Configure logging
 logging.basicConfig(
@@ -1007,6 +1043,158 @@ except Exception:
 
 
 
+# Columns returned by _get_inventory_record (everything DatabaseManager creates)
+_INVENTORY_RECORD_COLUMNS = (
+    "id", "sku", "artist", "title", "cat_no", "year", "format",
+    "media_condition", "sleeve_condition", "price", "status",
+    "discogs_release_id", "discogs_listing_id", "ebay_listing_id",
+    "date_added", "last_modified", "last_sync_time", "lister_payload",
+    "notes", "description", "shipping_option", "barcode", "genre",
+    "new_used", "listing_title", "matrix_runout", "condition_tags",
+    "ebay_item_draft_id", "ebay_updated_at", "discogs_updated_at", "inv_updated_at",
+)
+_INVENTORY_RECORD_SQL = f"SELECT {', '.join(_INVENTORY_RECORD_COLUMNS)} FROM inventory WHERE sku = ?"
+
+# Row insert used when adding releases from the collection; rows are positional
+# tuples in _INSERT_INVENTORY_COLUMNS order (cheapest bind path for executemany)
+_INSERT_INVENTORY_COLUMNS = (
+    "sku", "artist", "title", "cat_no", "year", "format", "media_condition",
+    "sleeve_condition", "price", "status", "discogs_release_id", "notes",
+    "barcode", "matrix_runout", "date_added", "last_modified", "inv_updated_at", "lister_payload",
+)
+_INSERT_INVENTORY_SQL = (
+    f"INSERT INTO inventory ({', '.join(_INSERT_INVENTORY_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_INSERT_INVENTORY_COLUMNS))})"
+)
+
+# Lister save statements (named parameters bound from the save_to_inventory dict)
+_SAVE_INVENTORY_UPDATE_SQL = """UPDATE inventory SET artist = :artist, title = :title, cat_no = :cat_no, year = :year, format = :format,
+        media_condition = :media_condition, sleeve_condition = :sleeve_condition, price = :price,
+        discogs_release_id = :discogs_release_id, notes = :notes, description = :description,
+        shipping_option = :shipping_option, barcode = :barcode, genre = :genre, new_used = :new_used,
+        listing_title = :listing_title, matrix_runout = :matrix_runout, condition_tags = :condition_tags,
+        last_modified = :last_modified, inv_updated_at = :inv_updated_at, lister_payload = :lister_payload WHERE sku = :sku"""
+_SAVE_INVENTORY_INSERT_SQL = """INSERT INTO inventory (sku, artist, title, cat_no, year, format, media_condition,
+        sleeve_condition, price, status, discogs_release_id, notes, description, shipping_option, barcode, genre, new_used,
+        listing_title, matrix_runout, condition_tags, date_added, last_modified, inv_updated_at, lister_payload
+        ) VALUES (:sku, :artist, :title, :cat_no, :year, :format, :media_condition,
+        :sleeve_condition, :price, :status, :discogs_release_id, :notes, :description, :shipping_option, :barcode, :genre, :new_used,
+        :listing_title, :matrix_runout, :condition_tags, :date_added, :last_modified, :inv_updated_at, :lister_payload)"""
+_UPDATE_INVENTORY_STATUS_SQL = "UPDATE inventory SET status = ?, last_modified = ? WHERE sku = ?"
+_SET_EBAY_LISTING_ID_SQL = "UPDATE inventory SET ebay_listing_id = ?, ebay_updated_at = ? WHERE sku = ?"
+_IMPORT_DISCOGS_LISTING_SQL = """INSERT OR IGNORE INTO inventory (sku, artist, title, cat_no, media_condition, sleeve_condition, price, status,
+        discogs_release_id, discogs_listing_id, date_added, last_modified) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_UTC = datetime.timezone.utc
+
+_PREVIEW_CACHE_SIZE = 64  # composed image previews kept in the lister's LRU
+
+# append_log stamps every line; the "[HH:MM:SS]" string only changes once a second
+_log_stamp = [None, ""]
+
+
+def _log_timestamp():
+    sec = int(time.time())
+    if sec != _log_stamp[0]:
+        _log_stamp[0] = sec
+        _log_stamp[1] = time.strftime("[%H:%M:%S]", time.localtime(sec))
+    return _log_stamp[1]
+
+
+def _qr_matrix(data, border=4):
+    """QR module rows for data (truthy = dark), quiet-zone border included."""
+    encoder = _qr_encoder()
+    if encoder.__name__ == "segno":
+        return list(encoder.make_qr(data, error='m').matrix_iter(scale=1, border=border))
+    qr = encoder.QRCode(version=1, border=border)
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr.get_matrix()
+
+
+def _qr_photo_image(master, data, scale=10, border=4):
+    """Render a QR code straight into a tk.PhotoImage (one put() per module row, no PIL)."""
+    matrix = _qr_matrix(data, border)
+    size = len(matrix) * scale
+    photo = tk.PhotoImage(master=master, width=size, height=size)
+    for y, row in enumerate(matrix):
+        line = "{" + " ".join("#000000" if dark else "#ffffff" for dark in row for _ in range(scale)) + "}"
+        photo.put(" ".join([line] * scale), to=(0, y * scale))
+    return photo
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_ts(value):
+    """Parse a stored ISO timestamp (a trailing 'Z' is read as UTC). Raises ValueError."""
+    s = str(value)
+    return datetime.datetime.fromisoformat(s[:-1] + '+00:00' if s.endswith('Z') else s)
+
+
+@lru_cache(maxsize=16384)
+def _format_inventory_date(value):
+    """ISO timestamp from the inventory table -> "YYYY-MM-DD HH:MM" for display."""
+    s = str(value)
+    # Stored values are ISO strings; the wall-clock digits can be sliced out directly
+    if len(s) >= 16 and s[4] == '-' and s[10] in ' T' and s[13] == ':':
+        return s[:10] + ' ' + s[11:16]
+    try:
+        return _parse_iso_ts(s).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
+        return value
+
+
+@lru_cache(maxsize=256)
+def _ebay_condition_category(media_condition, fmt):
+    """(condition enum, numeric condition ID, category ID) for a media grade and format."""
+    return (
+        EBAY_INVENTORY_CONDITION_MAP.get(media_condition, "USED_GOOD"),
+        EBAY_CONDITION_MAP_NUMERIC.get(media_condition, "3000"),
+        EBAY_VINYL_CATEGORIES.get(fmt, "176985"),
+    )
+
+# Image extensions picked up from the staging folder (the root scan also accepts HEIC)
+_STAGED_IMAGE_EXTS = ('.png', '.jpg', '.jpeg')
+_STAGED_ROOT_IMAGE_EXTS = _STAGED_IMAGE_EXTS + ('.heic',)
+# Staged photos are shrunk to this bound before QR scanning (QR decoding is scale-invariant)
+_QR_SCAN_SIZE = (800, 800)
+# After a local inventory edit wakes auto-sync, wait this long so a burst of edits syncs once
+_AUTO_SYNC_SETTLE_SECONDS = 15
+# Local statuses Discogs accepts as-is when pushing; anything else is sent as Draft
+_LOCAL_TO_DISCOGS_STATUS = {'For Sale': 'For Sale', 'Sold': 'Sold'}
+
+
+
+def _copy_image_file(src, dst):
+    """copy2() semantics (data + timestamps) via the OS's native copy.
+
+    On Linux/macOS shutil.copy2 already goes through sendfile/fcopyfile; on Windows
+    before 3.14 it falls back to a Python read/write loop, so call CopyFileW directly.
+    """
+    if sys.platform == "win32" and sys.version_info < (3, 14):
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            return
+    shutil.copy2(src, dst)
+
+
+# ASCII-only lowercase table for byte-level collection filtering
+_ASCII_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+
+# Shared read-only fallback for missing nested dicts (avoids a fresh {} per row)
+_EMPTY = {}
+
+# Discogs disambiguation suffix on artist names, e.g. "Nirvana (2)"
+_DISCOGS_ARTIST_NUM_RE = re.compile(r'\s*\(\d+\)$')
+
+
+def _join_names(entries, sep=", "):
+    """Join the "name" fields of Discogs artist/label/format dicts."""
+    names = [e.get("name", "") for e in entries or ()]
+    if len(names) == 1:
+        return names[0]
+    return sep.join(names)
+
 class VinylToolApp:
     
 
@@ -1118,6 +1306,11 @@ class VinylToolApp:
             pass
         return None
 
+    # Lister form fields by widget kind, used when serializing the form
+    _FORM_ENTRY_FIELDS = ("artist", "title", "cat_no", "year", "condition_tags", "barcode", "listing_title")
+    _FORM_CHOICE_FIELDS = ("format", "genre", "media_condition", "sleeve_condition", "shipping_option", "new_used")
+    _FORM_TEXT_FIELDS = ("condition_notes", "matrix_runout")
+
     def get_current_lister_listing_data(self) -> dict:
         """Gather listing data from the Lister UI (best-effort)."""
         d = {}
@@ -1125,13 +1318,14 @@ class VinylToolApp:
             d["sku"] = self.sku_display_var.get().strip()
         except Exception:
             pass
+        entries = self.entries
         def ge(key):
             try:
-                return self.entries[key].get().strip()
+                return entries[key].get().strip()
             except Exception:
                 return ""
-        d["artist"] = ge("Artist")
-        d["release_title"] = ge("Title")
+        d["artist"] = artist = ge("Artist")
+        d["release_title"] = release_title = ge("Title")
         d["format"] = ge("Format")
         d["cat_no"] = ge("Cat No")
         d["year"] = ge("Year")
@@ -1156,8 +1350,8 @@ class VinylToolApp:
         except Exception:
             pass
         d["categoryId"] = "176985"
-        t = " ".join([d.get("artist",""), "-", d.get("release_title","")]).strip(" -")
-        d["title"] = (t or "Untitled")[:80]
+        t = f"{artist} - {release_title}".strip(" -")
+        d["title"] = t[:80] if t else "Untitled"
         return d
 
     def save_to_ebay_drafts(self, listing_data: dict = None):
@@ -1177,24 +1371,31 @@ class VinylToolApp:
             self.append_log(f"[draft] Error: {e}", "red")
             return {"success": False, "error": str(e)}
 
+    def save_many_to_ebay(self, listing_data_list: list):
+        """Create/replace many eBay inventory items using bulk requests (25 per call)."""
+        try:
+            results = self.ebay_api.bulk_create_or_replace_inventory_items(listing_data_list)
+        except Exception as e:
+            logger.error(f"Bulk eBay inventory upsert failed: {e}")
+            self.append_log(f"[bulk] Error: {e}", "red")
+            return []
+        ok = sum(1 for r in results if r.get("success"))
+        for r in results:
+            if not r.get("success"):
+                self.append_log(f"[bulk] SKU {r.get('sku')}: {r.get('error') or r.get('statusCode')}", "red")
+        self.append_log(f"[bulk] Saved {ok}/{len(results)} eBay inventory item(s)", "green" if ok == len(results) else "orange")
+        return results
+
     def _install_lister_draft_live_buttons(self):
-        import tkinter as tk
-        parent = getattr(self, "lister_controls_frame", None) or getattr(self, "lister_tab", None) or getattr(self, "root", None)
-        if not parent:
-            return
         # Remove the separate "Save to eBay Drafts" button.  Drafts are no longer
         # supported; listings will be published live via the existing publish
-        # button in the inventory tab.  We simply rename any existing Publish
-        # button to make its purpose clear.  No new button is created here.
+        # button.  We simply rename that button (kept as list_on_ebay_button
+        # when the Lister tab is built) to make its purpose clear.
+        btn = getattr(self, "list_on_ebay_button", None)
+        if btn is None:
+            return
         try:
-            for child in parent.winfo_children():
-                try:
-                    txt = child.cget("text")
-                    # Rename any legacy Publish button to indicate a live publish
-                    if isinstance(txt, str) and ("Publish" in txt and "eBay" in txt):
-                        child.configure(text="Publish Live to eBay")
-                except Exception:
-                    continue
+            btn.configure(text="Publish Live to eBay")
         except Exception:
             pass
     # Main application class with complete functionality
@@ -1212,15 +1413,45 @@ class VinylToolApp:
         # Instance variables
         self.entries = {}
         self.current_release_id = None
+        self._last_release_data = None  # full release applied to the lister; reused by build_description
+        self._loaded_payload = None  # form payload as loaded for editing; unchanged saves are skipped
         self.current_tracklist_lines = []
         self.image_paths = []
+        self._image_basenames = []  # parallel to image_paths; rebuilt by _update_image_listbox
+        self._preview_cache = OrderedDict()  # (path, mtime, size) -> composed PIL preview; LRU, max _PREVIEW_CACHE_SIZE
+        self._preview_photo = None  # single PhotoImage reused for every preview via paste()
+        self._preview_bg = None  # preview label background as an RGB tuple
+        self._preview_pixel_size = (200, 200)  # fixed preview area in pixels
+        # Interactive preview decodes; only the latest request matters, so two workers suffice
+        self._preview_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="preview")
+        # Import prewarming gets its own pool so a clicked preview never queues behind a batch
+        # (JPEG decode releases the GIL); one core is left for the interactive decode
+        self._prewarm_pool = ThreadPoolExecutor(max_workers=max(1, min(4, (os.cpu_count() or 2) - 1)),
+                                                thread_name_prefix="preview-prewarm")
+        self._pending_preview_future = None  # latest decode; older results are dropped
+        self._preview_after_id = None  # pending debounced preview update
+        self._current_preview_path = None  # (path, mtime) of the image shown in the preview label
         self.editing_sku = None
         self.temporary_sku = None # For new items before they are saved
         self.sku_display_var = tk.StringVar() # For the read-only SKU display
         self.image_staging_path_var = tk.StringVar() # For settings tab
         self.inventory_sort_column = "id"
         self.inventory_sort_direction = "DESC"
+        self._inventory_row_values = {}  # sku (tree iid) -> displayed values tuple
+        self._inventory_order = []  # skus of the loaded pages, in sort order
+        self.inventory_page = 0  # last page loaded into the inventory tree
+        self._inventory_has_more = False  # the query matched more rows than are loaded
+        self._inventory_loading_more = False
+        self._inventory_search_term = ""  # search the loaded pages were fetched with
+        self._inventory_last_key = None  # (sort value, id) of the last loaded row; the next page starts after it
+        self._inventory_search_after_id = None  # pending debounced search
         self.discogs_search_results = []
+        self._discogs_result_iids = {}  # id(result dict) -> discogs_tree iid
+        self._discogs_result_blobs = {}  # id(result dict) -> lowercased "artist title catno year" for the filter
+        self._discogs_sort_keys = {}  # id(result dict) -> (artist, title, year) keys for column sorts
+        self._discogs_filter_after_id = None  # pending debounced filter refresh
+        self._discogs_search_params = None  # params of the displayed search; "Load more" asks for the next page
+        self._discogs_search_page = 0
         self.discogs_sort_column = "Year"
         self.discogs_sort_direction = "DESC"
         self.app_is_closing = False
@@ -1233,11 +1464,22 @@ class VinylToolApp:
         self.last_successful_sync_time = self.config.get("last_successful_sync_time", None)
         self.auto_sync_thread = None
         self.auto_sync_stop_event = threading.Event()
+        self._sync_trigger_event = threading.Event()  # set by local edits to run auto-sync early
+        self._config_save_after_id = None  # pending debounced config.json write
         self.sync_log = []
+        self._sync_log_pending = deque()  # messages waiting for the next sync-log flush
+        self._sync_log_flush_scheduled = False
         
         # Status mapping
         self.status_mappings = self._load_status_mappings()
         self.status_mapping_vars = {}
+        self._status_mapping_widgets = {}  # discogs status -> Combobox, built once
+        self._status_mapping_table = None
+        # Sales History widgets are built lazily; remember what connection checks enabled
+        self.check_sales_button = None
+        self.check_ebay_sales_button = None
+        self._discogs_sales_ready = False
+        self._ebay_sales_ready = False
         
         # Collection state
         self._collection_state = {
@@ -1245,12 +1487,39 @@ class VinylToolApp:
             "folder_id": None,
             "page": 1,
             "pages": 1,
-            "per_page": 100,
+            "per_page": 250,  # releases per Discogs request (API maximum)
+            "view_size": 100,  # rows per page shown in the tree
             "items": [],
             "filter": ""
         }
         
         self._discogs_field_ids = None  # cache for Discogs custom field IDs
+        self._collection_page_cache = {}  # (folder_id, page) -> (items, pages); prefetched, max 3
+        self._collection_remote_cache = {}  # (folder_id, page, per_page) -> (releases, total); max 4
+        self._collection_remote_lock = threading.Lock()
+        self._collection_label_to_id = {}  # combobox label -> folder id
+        self._collection_id_to_name = {}  # folder id -> folder name
+        self._render_seq = 0  # latest-wins token for collection renders
+        self._collection_menu = None  # context menu, built on first right-click
+        self._collection_menu_release_indices = ()  # entries enabled only with a release id
+        self._inflight = {}  # action name -> token of the request currently in flight
+        self._busy_count = 0  # background jobs showing the busy cursor; cleared when it drops to 0
+        self._log_pending = deque()  # (message, color) waiting for the next publish-log flush
+        self._log_flush_scheduled = False
+        # Shared worker pool for Discogs/eBay calls triggered from buttons, menus and dialogs
+        self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="discogs-io")
+        # Single writer thread: SQLite takes one writer at a time, so writes queue here off the Tk thread
+        self._db_write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        self._db_write_pending = set()  # writes not yet committed; on_closing waits for these
+        # One long-lived worker for button-triggered API fetches (sales, import, sync, price
+        # suggestions): repeated clicks queue up instead of each starting another thread
+        self._api_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-worker")
+        
+        # Pooled HTTP session for direct Discogs API calls (collection paging)
+        self._discogs_session = requests.Session()
+        self._discogs_session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        )
         # Setup GUI
         self._load_geometry()
         self._setup_gui()
@@ -1259,6 +1528,7 @@ class VinylToolApp:
         # Initialize views
         self.populate_inventory_view()
         self.image_staging_path_var.set(self.config.get("image_staging_path", ""))
+        self._staging_initialdir = self.config.get("image_staging_path") or os.path.expanduser("~")
         
         # Initialize connections
         self._update_connection_status()
@@ -1295,11 +1565,46 @@ class VinylToolApp:
         """Reset status mappings to defaults"""
         if messagebox.askyesno("Reset Mappings", "Reset all status mappings to defaults?"):
             self.status_mappings = DEFAULT_STATUS_MAPPINGS.copy()
-            for discogs_status, var in self.status_mapping_vars.items():
-                if discogs_status in self.status_mappings:
-                    var.set(self.status_mappings[discogs_status])
+            self._rebuild_status_mapping_rows()
             self.log_sync_activity("Status mappings reset to defaults")
     
+    def _rebuild_status_mapping_rows(self):
+        """Sync the mapping table with self.status_mappings, creating widgets only for new statuses."""
+        frame = self._status_mapping_table
+        if frame is None:
+            return
+        widgets = self._status_mapping_widgets
+        new_rows = [status for status in DEFAULT_STATUS_MAPPINGS if status not in widgets]
+        # Hide the table while adding rows so the grid is laid out once
+        pack_info = frame.pack_info() if new_rows and frame.winfo_manager() == "pack" else None
+        if pack_info:
+            frame.pack_forget()
+        for i, (discogs_status, default_local_status) in enumerate(DEFAULT_STATUS_MAPPINGS.items(), 1):
+            value = self.status_mappings.get(discogs_status, default_local_status)
+            if discogs_status in widgets:
+                self.status_mapping_vars[discogs_status].set(value)
+                continue
+            tk.Label(frame, text=discogs_status, font=("Helvetica", 11)).grid(row=i, column=0, padx=10, pady=3, sticky="w")
+            tk.Label(frame, text="→", font=("Helvetica", 11)).grid(row=i, column=1, padx=5, pady=3)
+            
+            var = tk.StringVar(value=value)
+            self.status_mapping_vars[discogs_status] = var
+            
+            combo = ttk.Combobox(frame, textvariable=var, values=LOCAL_STATUSES, 
+                                 state="readonly", width=15)
+            combo.grid(row=i, column=2, padx=10, pady=3, sticky="w")
+            widgets[discogs_status] = combo
+        if pack_info:
+            frame.pack(**pack_info)
+
+    def _snapshot_form(self) -> dict:
+        """Read every lister field once into a plain dict (entries/text stripped, choices as-is)."""
+        entries = self.entries
+        snap = {k: entries[k].get().strip() for k in self._FORM_ENTRY_FIELDS}
+        snap.update({k: entries[k].get() for k in self._FORM_CHOICE_FIELDS})
+        snap.update({k: entries[k].get("1.0", "end-1c").strip() for k in self._FORM_TEXT_FIELDS})
+        return snap
+
     def _serialize_form_to_payload(self):
         """
         Collect all lister fields + images into a JSON-serializable dict.
@@ -1310,27 +1615,11 @@ class VinylToolApp:
         except Exception:
             price_v = 0.0
         
-        payload = {
-            "artist": self.entries["artist"].get().strip(),
-            "title": self.entries["title"].get().strip(),
-            "cat_no": self.entries["cat_no"].get().strip(),
-            "year": self.entries["year"].get().strip(),
-            "format": self.entries["format"].get(),
-            "genre": self.entries["genre"].get(),
-            "media_condition": self.entries["media_condition"].get(),
-            "sleeve_condition": self.entries["sleeve_condition"].get(),
-            "price": price_v,
-            "condition_notes": self.entries["condition_notes"].get("1.0", "end-1c").strip(),
-            "matrix_runout": self.entries["matrix_runout"].get("1.0", "end-1c").strip(),
-            "condition_tags": self.entries["condition_tags"].get().strip(),
-            "description": self.full_desc.get("1.0", "end-1c").strip(),
-            "shipping_option": self.entries["shipping_option"].get(),
-            "barcode": self.entries["barcode"].get().strip(),
-            "new_used": self.entries["new_used"].get(),
-            "listing_title": self.entries["listing_title"].get().strip(),
-            "discogs_release_id": self.current_release_id,
-            "images": list(self.image_paths),
-        }
+        payload = self._snapshot_form()
+        payload["price"] = price_v
+        payload["description"] = self.full_desc.get("1.0", "end-1c").strip()
+        payload["discogs_release_id"] = self.current_release_id
+        payload["images"] = list(self.image_paths)
         return payload
     
     def _apply_payload_to_form(self, payload: dict):
@@ -1390,71 +1679,115 @@ class VinylToolApp:
         # Release ID
         self.current_release_id = payload.get("discogs_release_id")
     
-    def _get_inventory_record(self, sku: str) -> dict:
-        """Load DB row and merge lister_payload JSON over flat columns."""
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM inventory WHERE sku = ?", (sku,))
-            rec = cursor.fetchone()
-            if not rec:
-                return {}
-            d = dict(rec)
-            has_payload = False
+    def _get_inventory_rows(self, skus, columns=("sku", "discogs_listing_id")) -> dict:
+        """Fetch flat columns for many SKUs in one query per 500; returns {sku: row dict}."""
+        rows = {}
+        sql = f"SELECT {', '.join(columns)} FROM inventory WHERE sku IN "
+        with self.db.read_connection() as conn:
+            for start in range(0, len(skus), 500):
+                chunk = skus[start:start + 500]
+                for rec in conn.execute(sql + f"({','.join('?' * len(chunk))})", chunk):
+                    rows[rec["sku"]] = dict(rec)
+        return rows
+
+    def _get_inventory_record(self, sku: str, include_payload: bool = True) -> dict:
+        """Load DB row and merge lister_payload JSON over flat columns.
+        
+        Pass include_payload=False when only flat columns (listing IDs etc.)
+        are needed; this skips the JSON parse and the Discogs fallback.
+        """
+        with self.db.read_connection() as conn:
+            rec = conn.execute(_INVENTORY_RECORD_SQL, (sku,)).fetchone()
+        if not rec:
+            return {}
+        d = dict(rec)
+        if not include_payload:
+            return d
+        return self._merge_lister_payload(d)
+
+    def _get_inventory_records(self, skus) -> dict:
+        """_get_inventory_record for a whole selection, with one IN query per 500 SKUs."""
+        rows = self._get_inventory_rows(skus, columns=_INVENTORY_RECORD_COLUMNS)
+        return {sku: self._merge_lister_payload(d) for sku, d in rows.items()}
+
+    def _merge_lister_payload(self, d: dict) -> dict:
+        """Overlay the stored lister_payload (or, failing that, Discogs release data) on a flat row."""
+        has_payload = False
+        try:
+            if d.get("lister_payload"):
+                p = _json_loads(d["lister_payload"])
+                if isinstance(p, dict) and p:
+                    has_payload = True
+                    d.update({k: v for k, v in p.items() if v not in (None, "", [])})
+        except (json.JSONDecodeError, TypeError):
+            pass
+        if not has_payload and d.get("discogs_release_id"):
             try:
-                if d.get("lister_payload"):
-                    p = json.loads(d["lister_payload"])
-                    if isinstance(p, dict) and p:
-                        has_payload = True
-                        for k, v in p.items():
-                            if v not in (None, "", []):
-                                d[k] = v
-            except (json.JSONDecodeError, TypeError):
+                full_release = self.discogs_api.get_release(d["discogs_release_id"])
+                if full_release:
+                    barcode, cat_no = self._extract_barcode_and_cat_no(full_release)
+                    matrix_info = self._extract_matrix_info(full_release)
+                    if not d.get("barcode") and barcode:
+                        d["barcode"] = barcode
+                    if not d.get("cat_no") and cat_no:
+                        d["cat_no"] = cat_no
+                    if not d.get("matrix_runout") and matrix_info:
+                        d["matrix_runout"] = matrix_info
+                    if not d.get("year"):
+                        d["year"] = str(full_release.get("year", ""))
+                    if not d.get("format"):
+                        formats = full_release.get("formats", [])
+                        if formats:
+                            d["format"] = formats[0].get("name", "LP")
+            except Exception:
                 pass
-            if not has_payload and d.get("discogs_release_id"):
-                try:
-                    full_release = self.discogs_api.get_release(d["discogs_release_id"])
-                    if full_release:
-                        barcode, cat_no = self._extract_barcode_and_cat_no(full_release)
-                        matrix_info = self._extract_matrix_info(full_release)
-                        if not d.get("barcode") and barcode:
-                            d["barcode"] = barcode
-                        if not d.get("cat_no") and cat_no:
-                            d["cat_no"] = cat_no
-                        if not d.get("matrix_runout") and matrix_info:
-                            d["matrix_runout"] = matrix_info
-                        if not d.get("year"):
-                            d["year"] = str(full_release.get("year", ""))
-                        if not d.get("format"):
-                            formats = full_release.get("formats", [])
-                            if formats:
-                                d["format"] = formats[0].get("name", "LP")
-                except Exception:
-                    pass
-            return d
+        return d
     
     def _load_geometry(self):
         """Load saved window geometry"""
+        self._geom_path = os.path.join(os.path.dirname(__file__), "geometry.conf")
+        self._geom_saved = None
         try:
-            geometry_path = os.path.join(os.path.dirname(__file__), "geometry.conf")
-            with open(geometry_path, "r") as f:
-                self.root.geometry(f.read())
+            with open(self._geom_path, "r") as f:
+                self._geom_saved = f.read().strip()
+            self.root.geometry(self._geom_saved)
         except FileNotFoundError:
             self.root.geometry("1900x1000")
     
     def on_closing(self):
         """Handle application closing"""
+        if self.app_is_closing:
+            return  # already waiting for queued saves
         self.app_is_closing = True
         if self.auto_sync_enabled:
             self.stop_auto_sync()
+        if self._config_save_after_id:
+            self.root.after_cancel(self._config_save_after_id)
+            self._flush_config()
         
-        # Save window geometry
+        # Save window geometry (skip the write if nothing moved)
         try:
-            geometry_path = os.path.join(os.path.dirname(__file__), "geometry.conf")
-            with open(geometry_path, "w") as f:
-                f.write(self.root.geometry())
+            geometry = self.root.geometry()
+            if geometry != self._geom_saved:
+                with open(self._geom_path, "w") as f:
+                    f.write(geometry)
+                self._geom_saved = geometry
         except Exception as e:
             logger.warning(f"Could not save window geometry: {e}")
         
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._preview_pool.shutdown(wait=False, cancel_futures=True)
+        self._prewarm_pool.shutdown(wait=False, cancel_futures=True)
+        self._api_pool.shutdown(wait=False, cancel_futures=True)
+        # Let queued saves commit, but keep the event loop running while they do: blocking
+        # here would deadlock any writer thread that is waiting on a Tk call
+        self._db_write_pool.shutdown(wait=False)
+        self._destroy_when_writes_done()
+
+    def _destroy_when_writes_done(self):
+        if any(not f.done() for f in list(self._db_write_pending)):
+            self.root.after(50, self._destroy_when_writes_done)
+            return
         self.root.destroy()
     
     def _setup_gui(self):
@@ -1536,7 +1869,7 @@ class VinylToolApp:
         self.collection_refresh_btn = ttk.Button(
             top, 
             text="Refresh", 
-            command=self._refresh_collection
+            command=self._reload_collection
         )
         self.collection_refresh_btn.pack(side="left", padx=(6, 0))
         
@@ -1575,17 +1908,21 @@ class VinylToolApp:
         def _sort_by(col):
             st = self._collection_state
             items = st.get("items", [])
+            # Sort keys are precomputed per item by _index_collection_item
+            for it in items:
+                if "_sort_artist" not in it:
+                    self._index_collection_item(it)
             keymap = {
-                "added":   lambda it: (it.get("date_added") or ""),
-                "artist":  lambda it: " ".join(a.get("name","") for a in it.get("basic_information",{}).get("artists",[])).lower(),
-                "title":   lambda it: (it.get("basic_information",{}).get("title","") or "").lower(),
-                "labels":  lambda it: " ".join(l.get("name","") for l in it.get("basic_information",{}).get("labels",[])).lower(),
-                "catno":   lambda it: (it.get("basic_information",{}).get("labels",[{}])[0].get("catno","") or it.get("basic_information",{}).get("catno","") or "").lower(),
-                "formats": lambda it: " ".join(f.get("name","") for f in it.get("basic_information",{}).get("formats",[])).lower(),
-                "year":    lambda it: it.get("basic_information",{}).get("year") or 0,
-                "rating":  lambda it: it.get("rating") or 0,
-                "instance":lambda it: it.get("id") or 0,
-                "release": lambda it: it.get("basic_information",{}).get("id") or 0,
+                "added":   itemgetter("_sort_added"),
+                "artist":  itemgetter("_sort_artist"),
+                "title":   itemgetter("_sort_title"),
+                "labels":  itemgetter("_sort_labels"),
+                "catno":   itemgetter("_sort_catno"),
+                "formats": itemgetter("_sort_formats"),
+                "year":    itemgetter("_sort_year"),
+                "rating":  itemgetter("_sort_rating"),
+                "instance":itemgetter("_sort_instance"),
+                "release": itemgetter("_sort_release"),
                 "folder":  lambda it: st.get("folder_name","").lower()
             }
             key = keymap.get(col)
@@ -1632,32 +1969,28 @@ class VinylToolApp:
     def _discogs_api_request(self, url, params=None):
         """Fetch Discogs JSON using personal token if available (no OAuth secret)."""
         from vinyltool.core.config import Config
-        import urllib.request, urllib.parse, json
     
         cfg = Config().load()
         token = cfg.get("discogs_token") or ""
         ua = cfg.get("discogs_user_agent") or "VinylTool/1.0"
     
-        # build URL with params
-        if params:
-            sep = "&" if "?" in url else "?"
-            url = url + sep + urllib.parse.urlencode(params)
-    
         # Prefer Authorization header; Discogs supports 'Discogs token=...'
-        req = urllib.request.Request(url, headers={"User-Agent": ua})
+        headers = {"User-Agent": ua}
         if token:
-            req.add_header("Authorization", f"Discogs token={token}")
+            headers["Authorization"] = f"Discogs token={token}"
     
+        text = None
         try:
-            with urllib.request.urlopen(req, timeout=30) as r:
-                data = r.read()
-                text = data.decode("utf-8", "ignore")
-                if not text.strip():
-                    raise ValueError("Empty response from Discogs API")
-                return json.loads(text)
+            # Pooled session keeps the TLS connection alive across page fetches
+            r = self._discogs_session.get(url, params=params or None, headers=headers, timeout=30)
+            r.raise_for_status()
+            text = r.content.decode("utf-8", "ignore")
+            if not text.strip():
+                raise ValueError("Empty response from Discogs API")
+            return json.loads(text)
         except json.JSONDecodeError as e:
             logger.error("[collection] JSON decode error from %s: %s", url, e)
-            logger.error("[collection] Response text (first 200 chars): %s", text[:200] if 'text' in locals() else 'N/A')
+            logger.error("[collection] Response text (first 200 chars): %s", text[:200] if text is not None else 'N/A')
             raise
         except Exception as e:
             logger.error("[collection] API request error for %s: %s", url, e)
@@ -1679,26 +2012,49 @@ class VinylToolApp:
                     self.safe_after(0, lambda: self._set_collection_error("Discogs not connected"))
                     return
                 
-                user = self.discogs_api.client.identity()
-                data = user.collection_folders
+                def fetch_folders():
+                    user = self.discogs_api.client.identity()
+                    return [{"id": f.id, "name": f.name, "count": f.count} for f in user.collection_folders]
                 
-                folders = []
-                for f in data:
-                    folders.append({
-                        "id": f.id,
-                        "name": f.name, 
-                        "count": f.count
-                    })
+                # Folder 0 ("All") always exists on Discogs, so its first page can be
+                # fetched alongside the folder list instead of after it.
+                view_size = self._collection_state.get("view_size", 100)
+                need_fields = not getattr(self, "_discogs_field_ids", None)
+                with ThreadPoolExecutor(max_workers=3) as pool:
+                    folders_future = pool.submit(fetch_folders)
+                    page_future = pool.submit(self._fetch_collection_page, username, 0, 1, view_size)
+                    fields_future = pool.submit(self._discogs_fetch_collection_fields) if need_fields else None
+                    folders = folders_future.result()
+                    try:
+                        first_page = page_future.result()
+                    except Exception as e:
+                        logger.debug("[collection] initial page fetch failed: %s", e)
+                        first_page = None
+                    # Cache custom field IDs once (non-fatal if this fails)
+                    if fields_future is not None:
+                        try:
+                            self._discogs_field_ids = fields_future.result() or {}
+                        except Exception:
+                            self._discogs_field_ids = getattr(self, "_discogs_field_ids", {}) or {}
                 
                 def update_ui():
                     self._collection_state["folders"] = folders
                     labels = [f"{f['name']} ({f['count']})" for f in folders]
+                    self._collection_label_to_id = {label: f["id"] for label, f in zip(labels, folders)}
+                    self._collection_id_to_name = {f["id"]: f["name"] for f in folders}
                     self.collection_folder_combo["values"] = labels
                     
                     if folders:
                         self.collection_folder_var.set(labels[0])
                         self._collection_state["folder_id"] = folders[0]["id"]
-                        self._refresh_collection()
+                        self._collection_state["page"] = 1
+                        if first_page is not None and folders[0]["id"] == 0:
+                            self._collection_state["items"], self._collection_state["pages"] = first_page
+                            self._collection_state["folder_name"] = folders[0]["name"]
+                            self._render_collection_tree()
+                            self._prefetch_collection_page(0, 2)
+                        else:
+                            self._refresh_collection()
                     else:
                         self.collection_folder_var.set("No folders found")
                 
@@ -1720,13 +2076,7 @@ class VinylToolApp:
     def _on_folder_change(self, event=None):
         """Handle folder selection change"""
         chosen = self.collection_folder_var.get()
-        
-        # Find folder ID
-        folder_id = None
-        for f in self._collection_state["folders"]:
-            if f"{f['name']} ({f['count']})" == chosen:
-                folder_id = f["id"]
-                break
+        folder_id = self._collection_label_to_id.get(chosen)
         
         if folder_id is not None:
             self._collection_state["folder_id"] = folder_id
@@ -1736,7 +2086,18 @@ class VinylToolApp:
     def _on_filter_change(self, event=None):
         """Handle filter text change"""
         self._collection_state["filter"] = self.collection_filter_var.get().strip()
-        self._render_collection_tree()
+        self._schedule_collection_render(150)
+    
+    def _schedule_collection_render(self, delay=0):
+        """Queue a collection render; renders superseded before they run are dropped."""
+        self._render_seq += 1
+        seq = self._render_seq
+        
+        def render_if_latest():
+            if seq == self._render_seq:
+                self._render_collection_tree()
+        
+        self.safe_after(delay, render_if_latest)
     
     def _collection_prev_page(self):
         """Go to previous page"""
@@ -1746,65 +2107,110 @@ class VinylToolApp:
     
     def _collection_next_page(self):
         """Go to next page"""
-        if self._collection_state["page"] < self._collection_state.get("pages", 1):
-            self._collection_state["page"] += 1
-            self._refresh_collection()
-    def _refresh_collection(self):
-        """Refresh collection data using direct API calls."""
+        state = self._collection_state
+        if state["page"] < state.get("pages", 1):
+            state["page"] += 1
+            cached = self._collection_page_cache.pop((state.get("folder_id"), state["page"]), None)
+            if cached is None:
+                self._refresh_collection()
+                return
+            # Prefetched page: swap items in instantly and keep reading ahead
+            state["items"], state["pages"] = cached
+            self._render_collection_tree()
+            self._prefetch_collection_page(state.get("folder_id"), state["page"] + 1)
+    
+    def _fetch_collection_page(self, username, folder_id, page, view_size=100):
+        """Fetch one view page of a collection folder. Returns (items, pages).
+        
+        Discogs is queried per_page (250) releases at a time and view pages are
+        sliced out of those responses, so most page turns need no request.
+        """
+        per_page = self._collection_state.get("per_page", 250)
+        start = (page - 1) * view_size
+        end = start + view_size
+        # Stop at the folder's size so the last view page never asks for a
+        # remote page past the end; the first response's total corrects a stale count
+        known = next((f.get("count") for f in self._collection_state.get("folders") or ()
+                      if f.get("id") == folder_id), None)
+        if known:
+            end = max(start + 1, min(end, known))
+        items, total = [], 0
+        remote_page = start // per_page + 1
+        while True:
+            remote_items, total = self._fetch_collection_remote_page(username, folder_id, remote_page, per_page)
+            offset = (remote_page - 1) * per_page
+            items.extend(remote_items[max(0, start - offset):max(0, end - offset)])
+            end = min(end, total)
+            if len(remote_items) < per_page or offset + per_page >= end:
+                break
+            remote_page += 1
+        pages = max(1, -(-total // view_size))
+        return items, pages
+    
+    def _fetch_collection_remote_page(self, username, folder_id, remote_page, per_page):
+        """Fetch (or reuse) one Discogs page of a folder. Returns (items, total_items)."""
+        key = (folder_id, remote_page, per_page)
+        cached = self._collection_remote_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        url = f"https://api.discogs.com/users/{username}/collection/folders/{folder_id}/releases"
+        params = {"page": remote_page, "per_page": per_page, "sort": "added", "sort_order": "desc"}
+
+        data = self._discogs_api_request(url, params) or {}
+        items = (data.get("releases") or []) if isinstance(data, dict) else []
+        try:
+            total = int((data.get("pagination", {}) or {}).get("items", 0) or 0)
+        except Exception:
+            total = 0
+        total = total or (remote_page - 1) * per_page + len(items)
+        # Precompute filter/sort keys here, on the worker thread
+        for item in items:
+            self._index_collection_item(item)
+        
+        with self._collection_remote_lock:
+            cache = self._collection_remote_cache
+            cache[key] = (items, total)
+            while len(cache) > 4:
+                cache.pop(next(iter(cache)))
+        return items, total
+    
+    def _prefetch_collection_page(self, folder_id, page):
+        """Fetch a collection page in the background into the bounded page cache."""
+        if folder_id is None or page > self._collection_state.get("pages", 1):
+            return
+        key = (folder_id, page)
+        if key in self._collection_page_cache:
+            return
+        view_size = self._collection_state.get("view_size", 100)
+
         def worker():
             try:
                 token, username = self._get_discogs_credentials()
                 if not (token and username):
-                    self.safe_after(0, lambda: self._set_collection_error("Discogs credentials not configured"))
                     return
+                result = self._fetch_collection_page(username, folder_id, page, view_size)
+            except Exception as e:
+                logger.debug("[collection] prefetch of page %s failed: %s", page, e)
+                return
 
-                # Cache custom field IDs once (non-fatal if this fails)
-                try:
-                    if not getattr(self, "_discogs_field_ids", None):
-                        ids = self._discogs_fetch_collection_fields()
-                        self._discogs_field_ids = ids or {}
-                except Exception:
-                    self._discogs_field_ids = getattr(self, "_discogs_field_ids", {}) or {}
-
-                folder_id = self._collection_state.get("folder_id")
-                if folder_id is None:
-                    return
-
-                page = self._collection_state.get("page", 1)
-                per_page = self._collection_state.get("per_page", 100)
-
-                url = f"https://api.discogs.com/users/{username}/collection/folders/{folder_id}/releases"
-                params = {"page": page, "per_page": per_page, "sort": "added", "sort_order": "desc"}
+            def store():
+                cache = self._collection_page_cache
+                cache[key] = result
+                while len(cache) > 3:
+                    cache.pop(next(iter(cache)))
 
-                data = self._discogs_api_request(url, params) or {}
-                items = (data.get("releases") or []) if isinstance(data, dict) else []
-                try:
-                    pages = int((data.get("pagination", {}) or {}).get("pages", 1) or 1)
-                except Exception:
-                    pages = 1
-
-                folder_name = ""
-                try:
-                    for f in self._collection_state.get("folders", []):
-                        if f.get("id") == folder_id:
-                            folder_name = f.get("name", "")
-                            break
-                except Exception:
-                    folder_name = ""
+            self.safe_after(0, store)
 
-                def update_ui():
-                    self._collection_state["items"] = items
-                    self._collection_state["pages"] = pages
-                    self._collection_state["folder_name"] = folder_name
-                    self._render_collection_tree()
-
-                self.safe_after(0, update_ui)
+        threading.Thread(target=worker, daemon=True).start()
 
-            except Exception as e:
-                self.safe_after(0, lambda: self._set_collection_error(f"Failed to refresh collection: {e}"))
+    def _reload_collection(self):
+        """Drop cached Discogs pages and refresh the current page."""
+        with self._collection_remote_lock:
+            self._collection_remote_cache.clear()
+        self._collection_page_cache.clear()
+        self._refresh_collection()
 
-        import threading
-        threading.Thread(target=worker, daemon=True).start()
     def _refresh_collection(self):
         """Refresh collection data using direct API calls."""
         def worker():
@@ -1827,66 +2233,79 @@ class VinylToolApp:
                     return
 
                 page = self._collection_state.get("page", 1)
-                per_page = self._collection_state.get("per_page", 100)
-
-                url = f"https://api.discogs.com/users/{username}/collection/folders/{folder_id}/releases"
-                params = {"page": page, "per_page": per_page, "sort": "added", "sort_order": "desc"}
+                view_size = self._collection_state.get("view_size", 100)
 
-                data = self._discogs_api_request(url, params) or {}
-                items = (data.get("releases") or []) if isinstance(data, dict) else []
-                try:
-                    pages = int((data.get("pagination", {}) or {}).get("pages", 1) or 1)
-                except Exception:
-                    pages = 1
+                items, pages = self._fetch_collection_page(username, folder_id, page, view_size)
 
-                folder_name = ""
-                try:
-                    for f in self._collection_state.get("folders", []):
-                        if f.get("id") == folder_id:
-                            folder_name = f.get("name", "")
-                            break
-                except Exception:
-                    folder_name = ""
+                folder_name = self._collection_id_to_name.get(folder_id, "")
 
                 def update_ui():
                     self._collection_state["items"] = items
                     self._collection_state["pages"] = pages
                     self._collection_state["folder_name"] = folder_name
-                    self._render_collection_tree()
+                    self._schedule_collection_render()
+                    # Drop any stale copy and read the next page ahead
+                    self._collection_page_cache.pop((folder_id, page + 1), None)
+                    self._prefetch_collection_page(folder_id, page + 1)
 
                 self.safe_after(0, update_ui)
 
             except Exception as e:
                 self.safe_after(0, lambda: self._set_collection_error(f"Failed to refresh collection: {e}"))
 
-        import threading
         threading.Thread(target=worker, daemon=True).start()
 
+    @classmethod
+    def _index_collection_item(cls, item):
+        """Precompute the filter key and per-column sort keys of a collection item."""
+        bi = item.get("basic_information", {})
+        labels = bi.get("labels") or [{}]
+        item["_search"] = cls._collection_search_key(item)
+        item["_sort_added"] = item.get("date_added") or ""
+        item["_sort_artist"] = " ".join(a.get("name", "") for a in bi.get("artists", [])).lower()
+        item["_sort_title"] = (bi.get("title", "") or "").lower()
+        item["_sort_labels"] = " ".join(l.get("name", "") for l in bi.get("labels", [])).lower()
+        item["_sort_catno"] = (labels[0].get("catno", "") or bi.get("catno", "") or "").lower()
+        item["_sort_formats"] = " ".join(f.get("name", "") for f in bi.get("formats", [])).lower()
+        item["_sort_year"] = bi.get("year") or 0
+        item["_sort_rating"] = item.get("rating") or 0
+        item["_sort_instance"] = item.get("id") or 0
+        item["_sort_release"] = bi.get("id") or 0
+        return item
+
+    @staticmethod
+    def _collection_search_key(item):
+        """ASCII-lowercased UTF-8 bytes of the searchable fields of a collection item."""
+        bi = item.get("basic_information", {})
+        
+        # Build searchable text
+        artists = " ".join([a.get("name", "") for a in bi.get("artists", [])])
+        labels = " ".join([l.get("name", "") for l in bi.get("labels", [])])
+        formats = " ".join([f.get("name", "") for f in bi.get("formats", [])])
+        
+        search_text = " ".join([
+            bi.get("title", ""),
+            artists,
+            labels, 
+            formats,
+            str(bi.get("year", ""))
+        ])
+        return search_text.encode("utf-8", "ignore").translate(_ASCII_LOWER)
+
     def _apply_collection_filter(self, items, filter_text):
         """Apply filter to collection items"""
         if not filter_text:
             return items
         
-        filter_text = filter_text.lower()
+        needle = filter_text.encode("utf-8", "ignore").translate(_ASCII_LOWER)
         filtered = []
         
         for item in items:
-            bi = item.get("basic_information", {})
-            
-            # Build searchable text
-            artists = " ".join([a.get("name", "") for a in bi.get("artists", [])])
-            labels = " ".join([l.get("name", "") for l in bi.get("labels", [])])
-            formats = " ".join([f.get("name", "") for f in bi.get("formats", [])])
-            
-            search_text = " ".join([
-                bi.get("title", ""),
-                artists,
-                labels, 
-                formats,
-                str(bi.get("year", ""))
-            ]).lower()
-            
-            if filter_text in search_text:
+            # Normally precomputed when the page is fetched
+            key = item.get("_search")
+            if key is None:
+                key = item["_search"] = self._collection_search_key(item)
+            if needle in key:
                 filtered.append(item)
         
         return filtered
@@ -1920,9 +2339,7 @@ class VinylToolApp:
 
     def _render_collection_tree(self):
         """Render collection items in tree"""
-        # Clear existing items
-        for item in self.collection_tree.get_children():
-            self.collection_tree.delete(item)
+        tree = self.collection_tree
         
         # Apply filter
         items = self._apply_collection_filter(
@@ -1935,6 +2352,7 @@ class VinylToolApp:
         fid_media = (self._discogs_field_ids or {}).get("media")
         fid_sleeve = (self._discogs_field_ids or {}).get("sleeve")
         
+        rows = []
         for item in items:
             media_val = sleeve_val = ""
             try:
@@ -1946,23 +2364,22 @@ class VinylToolApp:
             except Exception:
                 pass
 
-            bi = item.get("basic_information", {})
+            bi = item.get("basic_information") or _EMPTY
             
             # Extract data
-            artists = ", ".join([a.get("name", "") for a in bi.get("artists", [])])
-            labels = ", ".join([l.get("name", "") for l in bi.get("labels", [])])
-            formats = ", ".join([f.get("name", "") for f in bi.get("formats", [])])
+            artists = _join_names(bi.get("artists"))
+            labels = _join_names(bi.get("labels"))
+            formats = _join_names(bi.get("formats"))
             
             # Get catalog number
-            catno = ""
-            if bi.get("labels"):
-                catnos = [l.get("catno", "") for l in bi.get("labels", []) if l.get("catno")]
-                catno = ", ".join(sorted(set(catnos)))
+            # dict.fromkeys dedupes in label order; only long lists are worth sorting
+            catno_list = [l["catno"] for l in (bi.get("labels") or ()) if l.get("catno")]
+            if len(catno_list) > 3:
+                catno_list = sorted(catno_list)
+            catno = ", ".join(dict.fromkeys(catno_list)) if catno_list else ""
             
             # Format date
-            date_added = item.get("date_added", "")
-            if date_added and len(date_added) >= 10:
-                date_added = date_added[:10]  # Just the date part
+            date_added = (item.get("date_added") or "")[:10]  # Just the date part
             
             row = (
                 date_added,
@@ -1975,7 +2392,7 @@ class VinylToolApp:
                 media_val,
                 sleeve_val,
                 folder_name,
-                item.get("rating", "") or "",
+                item.get("rating") or "",
                 item.get("id", ""),
                 bi.get("id", "")
             )
@@ -2027,9 +2444,15 @@ class VinylToolApp:
             _row2 = list(row) if isinstance(row, (list, tuple)) else []
             for _k,_v in enumerate(_row2):
                 _row2[_k] = _vt_norm_grade(_v)
-            self.collection_tree.insert("", "end", values=tuple(_row2))
+            rows.append(tuple(_row2))
             # --- VT_ROW_GRADE_NORMALIZE --- END
         
+        # Clear and repopulate in one pass. Inserting at index 0 in reverse
+        # avoids Treeview walking the sibling list to find "end" on each insert.
+        tree.delete(*tree.get_children())
+        for row in reversed(rows):
+            tree.insert("", 0, values=row)
+        
         # Update page label
         page = self._collection_state.get("page", 1)
         pages = self._collection_state.get("pages", 1)
@@ -2045,24 +2468,38 @@ class VinylToolApp:
         try:
             release_id = values[-1]  # Last column is release ID
             if release_id:
-                import webbrowser
                 webbrowser.open(f"https://www.discogs.com/release/{release_id}")
         except Exception as e:
-            logger.error(f"Failed to open release: {e}")
+            logger.error("Failed to open release: %s", e)
 
     # ========================================================================
     # START: ENHANCED CONTEXT MENU FOR COLLECTION TAB
     # ========================================================================
 
+    # (label, handler name, needs a release id); None marks a separator
+    _COLLECTION_MENU_ITEMS = (
+        ("Add to Inventory", "_collection_add_to_inventory", False),
+        None,
+        ("Open on Discogs", "_collection_open_release", True),
+        ("View Price History", "_collection_view_price_history", True),
+        ("View All Variants", "_collection_view_all_variants", True),
+        None,
+        ("Quick List on Discogs", "_collection_quick_list_on_discogs", True),
+        ("Search Sold Listings (eBay)", "_collection_search_sold_listings", False),
+        None,
+        ("Edit Grades…", "_collection_edit_grades", True),
+        ("Update Collection Notes", "_collection_update_notes", False),
+    )
+
     def _collection_context_menu(self, event):
         """Show context menu for collection with enhanced features."""
-        from tkinter import Menu
-        
         item_id = self.collection_tree.identify_row(event.y)
         if not item_id:
             return
         
-        self.collection_tree.selection_set(item_id)
+        # Keep an existing multi-row selection when right-clicking inside it
+        if item_id not in self.collection_tree.selection():
+            self.collection_tree.selection_set(item_id)
         selection = self.collection_tree.selection()
         if not selection:
             return
@@ -2075,23 +2512,23 @@ class VinylToolApp:
         except (ValueError, IndexError):
             pass
 
-        menu = Menu(self.collection_tree, tearoff=0)
-        menu.add_command(label="Add to Inventory", command=self._collection_add_to_inventory)
-        menu.add_separator()
-        menu.add_command(label="Open on Discogs", command=self._collection_open_release, 
-                         state="normal" if has_release_id else "disabled")
-        menu.add_command(label="View Price History", command=self._collection_view_price_history,
-                         state="normal" if has_release_id else "disabled")
-        menu.add_command(label="View All Variants", command=self._collection_view_all_variants,
-                         state="normal" if has_release_id else "disabled")
-        menu.add_separator()
-        menu.add_command(label="Quick List on Discogs", command=self._collection_quick_list_on_discogs,
-                         state="normal" if has_release_id else "disabled")
-        menu.add_command(label="Search Sold Listings (eBay)", command=self._collection_search_sold_listings)
-        menu.add_separator()
-        menu.add_command(label="Edit Grades…", command=self._collection_edit_grades,
-                         state="normal" if has_release_id else "disabled")
-        menu.add_command(label="Update Collection Notes", command=self._collection_update_notes)
+        menu = self._collection_menu
+        if menu is None:
+            menu = self._collection_menu = tk.Menu(self.collection_tree, tearoff=0)
+            release_indices = []
+            for index, entry in enumerate(self._COLLECTION_MENU_ITEMS):
+                if entry is None:
+                    menu.add_separator()
+                    continue
+                label, handler, needs_release = entry
+                menu.add_command(label=label, command=getattr(self, handler))
+                if needs_release:
+                    release_indices.append(index)
+            self._collection_menu_release_indices = tuple(release_indices)
+
+        release_state = "normal" if has_release_id else "disabled"
+        for index in self._collection_menu_release_indices:
+            menu.entryconfig(index, state=release_state)
 
         try:
             menu.tk_popup(event.x_root, event.y_root)
@@ -2190,7 +2627,7 @@ class VinylToolApp:
         if release_id:
             url = f"https://www.discogs.com/sell/history/{release_id}"
             webbrowser.open_new_tab(url)
-            logger.info(f"Opened price history for release {release_id}")
+            logger.info("Opened price history for release %s", release_id)
 
     def _view_all_variants(self, release_id: int):
         """Finds the master release and opens the page to show all variants."""
@@ -2204,17 +2641,17 @@ class VinylToolApp:
                     if master_id:
                         url = f"https://www.discogs.com/master/{master_id}"
                         self.safe_after(0, lambda: webbrowser.open_new_tab(url))
-                        logger.info(f"Opened master release {master_id} for release {release_id}")
+                        logger.info("Opened master release %s for release %s", master_id, release_id)
                     else:
                         # If master_id is 0 or null, it's a unique release
                         self.safe_after(0, lambda: messagebox.showinfo("No Variants", "This release is not part of a master release and has no other known variants."))
                 else:
                     self.safe_after(0, lambda: messagebox.showwarning("Not Found", "Could not find a master release for this item."))
             except Exception as e:
-                logger.error(f"Failed to get variants for release {release_id}: {e}")
+                logger.error("Failed to get variants for release %s: %s", release_id, e)
                 self.safe_after(0, lambda: messagebox.showerror("API Error", f"Failed to fetch release data: {e}"))
         
-        threading.Thread(target=worker, daemon=True).start()
+        self._io_pool.submit(worker)
 
     def _quick_list_on_discogs(self, release_id: int):
         """Opens a streamlined dialog to quickly list an item on Discogs."""
@@ -2223,14 +2660,17 @@ class VinylToolApp:
             return
 
         dialog = QuickListDialog(self.root, "Quick List on Discogs")
-        if dialog.result:
+        result = dialog.result
+        if result:
+            media = result["media_condition"]
+            sleeve = result["sleeve_condition"]
             listing_data = {
                 'release_id': release_id,
-                'price': dialog.result["price"],
+                'price': result["price"],
                 'status': 'For Sale', # List directly as For Sale
-                'condition': DISCOGS_GRADE_MAP.get(dialog.result["media_condition"], dialog.result["media_condition"]),
-                'sleeve_condition': DISCOGS_GRADE_MAP.get(dialog.result["sleeve_condition"], dialog.result["sleeve_condition"]),
-                'comments': dialog.result["comments"]
+                'condition': DISCOGS_GRADE_MAP.get(media, media),
+                'sleeve_condition': DISCOGS_GRADE_MAP.get(sleeve, sleeve),
+                'comments': result["comments"]
             }
 
             def list_worker():
@@ -2243,11 +2683,10 @@ class VinylToolApp:
                 except Exception as e:
                     self.safe_after(0, lambda err=e: messagebox.showerror("Listing Error", str(err)))
                 finally:
-                    self.safe_after(0, lambda: self.root.config(cursor=""))
+                    self.safe_after(0, lambda: self._busy(False))
 
-            self.root.config(cursor="watch")
-            self.root.update()
-            threading.Thread(target=list_worker, daemon=True).start()
+            self._busy(True)
+            self._io_pool.submit(list_worker)
 
     def _search_sold_listings_inventory(self, artist: str, title: str):
         """Opens eBay completed listings search for an item from inventory."""
@@ -2257,7 +2696,7 @@ class VinylToolApp:
         query = f"{artist} {title}".strip()
         url = f"https://www.ebay.co.uk/sch/i.html?_from=R40&_nkw={quote_plus(query)}&_sacat=176985&LH_Complete=1&LH_Sold=1"
         webbrowser.open_new_tab(url)
-        logger.info(f"Opened eBay sold listings search for: {query}")
+        logger.info("Opened eBay sold listings search for: %s", query)
 
     def _update_collection_notes(self):
         """Dialog for editing personal notes (with API limitation notice)."""
@@ -2278,65 +2717,69 @@ class VinylToolApp:
         from vinyltool.core import parse
         return parse._extract_matrix_info(release_data)
     def _collection_add_to_inventory(self):
-        """Enhanced: Add selected collection item directly to inventory database."""
+        """Enhanced: Add selected collection item(s) directly to inventory database."""
         selection = self.collection_tree.selection()
         if not selection:
             return
 
-        values = self.collection_tree.item(selection[0], "values")
-
-        # capture Discogs grades from current row for dialog defaults
-
-        try:
-
-            media_cell  = values[7] if len(values) > 7 else ''
-
-            sleeve_cell = values[8] if len(values) > 8 else ''
-
-        except Exception:
-
-            media_cell = sleeve_cell = ''
-
         _norm = getattr(self, '_extract_grade_initials_safe', getattr(self, '_extract_grade_initials', lambda x: (str(x or '').strip())))
 
-        self._pending_discogs_media_grade  = _norm(media_cell)
-
-        self._pending_discogs_sleeve_grade = _norm(sleeve_cell)
-        # schedule autofill of grading dialog from Discogs
-        try:
-            self.root.after(50, lambda: _autofill_grading_dialog_from_discogs(self))
-        except Exception:
-            pass
+        # Collect (release_id, cat_no, media grade, sleeve grade) for each selected row
+        entries = []
+        for iid in selection:
+            values = self.collection_tree.item(iid, "values")
+            try:
+                release_id = int(values[-1])
+            except (ValueError, IndexError):
+                continue
+            # Collection tree columns are: added, artist, title, labels, catno, formats, year, media, sleeve, ...
+            # The catno resides at index 4; Discogs grades at 7 and 8
+            cat_no = values[4] if len(values) > 4 else None
+            media_cell = values[7] if len(values) > 7 else ''
+            sleeve_cell = values[8] if len(values) > 8 else ''
+            entries.append((release_id, cat_no or None, _norm(media_cell), _norm(sleeve_cell)))
 
-        
-        try:
-            release_id = int(values[-1])
-        except (ValueError, IndexError):
+        if not entries:
             messagebox.showerror("Error", "Could not get a valid Release ID from the selected item.")
             return
 
-        # 1. Check for duplicates before proceeding
+        # 1. Check for duplicates with a single query before proceeding
         try:
-            # Attempt to deduplicate by both release ID and cat_no if available
-            cat_no = None
-            try:
-                # Collection tree columns are: added, artist, title, labels, catno, formats, year, folder, rating, instance, release
-                # The catno resides at index 4
-                cat_no = values[4] if len(values) > 4 else None
-            except Exception:
-                cat_no = None
-            with self.db.get_connection() as conn:
+            release_ids = list(dict.fromkeys(e[0] for e in entries))
+            placeholders = ",".join("?" * len(release_ids))
+            with self.db.read_connection() as conn:
                 cursor = conn.cursor()
-                if cat_no:
-                    cursor.execute("SELECT sku, status FROM inventory WHERE discogs_release_id = ? AND cat_no = ?", (release_id, cat_no))
-                else:
-                    cursor.execute("SELECT sku, status FROM inventory WHERE discogs_release_id = ?", (release_id,))
-                existing = cursor.fetchone()
-                if existing:
-                    msg = (f"This release (ID: {release_id}) already exists in your inventory.\n\n"
+                cursor.execute(
+                    f"SELECT discogs_release_id, cat_no, sku, status FROM inventory "
+                    f"WHERE discogs_release_id IN ({placeholders})",
+                    release_ids,
+                )
+                rows = cursor.fetchall()
+            # Deduplicate by release ID, and by cat_no too when the row has one
+            existing_by_release = {}
+            for row in rows:
+                existing_by_release.setdefault(row["discogs_release_id"], []).append(row)
+            duplicates = []
+            for entry in entries:
+                release_id, cat_no = entry[0], entry[1]
+                matches = [r for r in existing_by_release.get(release_id, ()) if not cat_no or r["cat_no"] == cat_no]
+                if matches:
+                    duplicates.append((entry, matches[0]))
+            if duplicates:
+                if len(entries) == 1:
+                    existing = duplicates[0][1]
+                    msg = (f"This release (ID: {entries[0][0]}) already exists in your inventory.\n\n"
                            f"SKU: {existing['sku']}\nStatus: {existing['status']}\n\n"
                            "Do you want to add it again?")
-                    if not messagebox.askyesno("Duplicate Found", msg):
+                else:
+                    listed = "\n".join(f"Release {e[0]}: SKU {m['sku']} ({m['status']})" for e, m in duplicates[:10])
+                    more = f"\n... and {len(duplicates) - 10} more" if len(duplicates) > 10 else ""
+                    msg = (f"{len(duplicates)} of the {len(entries)} selected releases already exist in your inventory:\n\n"
+                           f"{listed}{more}\n\nDo you want to add them again?")
+                if not messagebox.askyesno("Duplicate Found", msg):
+                    dup_entries = {id(e) for e, _ in duplicates}
+                    entries = [e for e in entries if id(e) not in dup_entries]
+                    if not entries:
                         return
         except Exception as e:
             logger.error(f"Database error checking for duplicates: {e}")
@@ -2344,94 +2787,124 @@ class VinylToolApp:
             return
 
         # 2. Fetch full details from Discogs API in a background thread
-        self.root.config(cursor="watch")
-        self.root.update()
-
-        def api_worker():
-            release_data = self.discogs_api.get_release(release_id)
-            self.safe_after(0, lambda: self._process_inventory_addition(release_data))
+        self._busy(True)
+
+        # Overlap the release fetches when several rows are selected; the last one to
+        # finish hands the results to the UI (no pool thread blocks waiting on the others)
+        futures = [self._io_pool.submit(self.discogs_api.get_release, e[0]) for e in entries]
+        pending = [len(futures)]
+        pending_lock = threading.Lock()
+
+        def on_fetched(_future):
+            with pending_lock:
+                pending[0] -= 1
+                if pending[0]:
+                    return
+            fetched = [(None if f.exception() else f.result(), e) for f, e in zip(futures, entries)]
+            self.safe_after(0, lambda: self._process_inventory_additions(fetched))
 
-        threading.Thread(target=api_worker, daemon=True).start()
+        for future in futures:
+            future.add_done_callback(on_fetched)
 
-    def _process_inventory_addition(self, release_data):
+    def _process_inventory_additions(self, fetched):
         """
-        Callback to handle processing after API call, ensuring matrix/runout is saved
-        AND included in the lister_payload for consistent loading.
+        Prompt for condition/price for each fetched release, then insert all of
+        them in one transaction with executemany.
         """
-        self.root.config(cursor="")
-        if not release_data:
-            messagebox.showerror("API Error", f"Failed to fetch complete data for Release ID: {release_data.get('id')}")
-            return
-
+        self._busy(False)
+        db_params_list = []
+        for release_data, entry in fetched:
+            if not release_data:
+                messagebox.showerror("API Error", f"Failed to fetch complete data for Release ID: {entry[0]}")
+                continue
+            # Discogs grades from the collection row become the dialog defaults
+            self._pending_discogs_media_grade = entry[2]
+            self._pending_discogs_sleeve_grade = entry[3]
+            # schedule autofill of grading dialog from Discogs
+            try:
+                self.root.after(50, lambda: _autofill_grading_dialog_from_discogs(self))
+            except Exception:
+                pass
+            db_params = self._build_inventory_addition(release_data)
+            if db_params is None:
+                break  # User cancelled; keep what was already graded
+            # SKUs are second-resolution timestamps; keep them unique within the batch
+            if any(p[0] == db_params[0] for p in db_params_list):
+                db_params = (f"{db_params[0]}-{len(db_params_list) + 1}",) + db_params[1:]
+            db_params_list.append(db_params)
+        self._save_inventory_additions(db_params_list)
+
+    def _build_inventory_addition(self, release_data):
+        """Ask for condition/price and return the INSERT row tuple for one release, or None if cancelled."""
         # 3. Prompt user for condition and price
         dialog = ConditionGradingDialog(self.root)
-        if not dialog.result:
-            return  # User cancelled
+        result = dialog.result
+        if not result:
+            return None  # User cancelled
 
         # 4. Prepare data for database insertion
-        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        now = datetime.datetime.now(_UTC).isoformat()
         sku = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
         
-        artist_names = [re.sub(r'\s*\(\d+\)$', '', a['name']).strip() for a in release_data.get('artists', [])]
+        get = release_data.get
+        release_id = release_data['id']
+        artist_names = [_DISCOGS_ARTIST_NUM_RE.sub('', a['name']).strip() for a in (get('artists') or ())]
         artist = ", ".join(artist_names)
-        title = release_data.get('title', '')
+        title = get('title', '')
         
         barcode, cat_no = self._extract_barcode_and_cat_no(release_data)
 
-        year = release_data.get('year', '')
-        formats_list = [f.get('name', '') for f in release_data.get('formats', [])]
-        main_format = formats_list[0] if formats_list else 'Vinyl'
+        year = str(get('year', ''))
+        formats = get('formats') or ()
+        main_format = formats[0].get('name', '') if formats else 'Vinyl'
 
         # [FIXED] Use the new robust extraction method for matrix info
         matrix_runout_info = self._extract_matrix_info(release_data)
 
+        media = result["media_condition"]
+        sleeve = result["sleeve_condition"]
+        price = result["price"]
+        notes = result["notes"]
+
         # Create a complete payload for the `lister_payload` column
         # that INCLUDES the matrix_runout data.
         lister_payload_data = {
-            "artist": artist, "title": title, "cat_no": cat_no, "year": str(year),
-            "format": main_format, "media_condition": dialog.result["media_condition"],
-            "sleeve_condition": dialog.result["sleeve_condition"], "price": dialog.result["price"],
-            "condition_notes": dialog.result["notes"], "barcode": barcode,
+            "artist": artist, "title": title, "cat_no": cat_no, "year": year,
+            "format": main_format, "media_condition": media,
+            "sleeve_condition": sleeve, "price": price,
+            "condition_notes": notes, "barcode": barcode,
             "matrix_runout": matrix_runout_info,
-            "discogs_release_id": release_data['id'],
+            "discogs_release_id": release_id,
             "description": "", # Start with an empty description
             "images": [] # Start with empty images
         }
 
-        # 5. Save to database
-        try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                sql = """
-                    INSERT INTO inventory (
-                        sku, artist, title, cat_no, year, format, media_condition,
-                        sleeve_condition, price, status, discogs_release_id, notes,
-                        barcode, matrix_runout, date_added, last_modified, inv_updated_at, lister_payload
-                    ) VALUES (
-                        :sku, :artist, :title, :cat_no, :year, :format, :media_condition,
-                        :sleeve_condition, :price, :status, :discogs_release_id, :notes,
-                        :barcode, :matrix_runout, :date_added, :last_modified, :inv_updated_at, :lister_payload
-                    )
-                """
-
-                db_params = {
-                    "sku": sku, "artist": artist, "title": title, "cat_no": cat_no,
-                    "year": str(year), "format": main_format,
-                    "media_condition": dialog.result["media_condition"],
-                    "sleeve_condition": dialog.result["sleeve_condition"],
-                    "price": dialog.result["price"], "status": "For Sale",
-                    "discogs_release_id": release_data['id'],
-                    "notes": dialog.result["notes"], "barcode": barcode,
-                    "matrix_runout": matrix_runout_info,
-                    "date_added": now, "last_modified": now,
-                    "inv_updated_at": now,
-                    "lister_payload": json.dumps(lister_payload_data)
-                }
+        # Positional row in _INSERT_INVENTORY_COLUMNS order
+        return (
+            sku, artist, title, cat_no, year, main_format, media,
+            sleeve, price, "For Sale", release_id, notes,
+            barcode, matrix_runout_info, now, now, now,
+            _json_dumps(lister_payload_data),
+        )
+
+    def _insert_inventory_rows(self, rows):
+        """Insert inventory rows (tuples in _INSERT_INVENTORY_COLUMNS order) in one transaction."""
+        with self.db.get_connection() as conn:
+            conn.executemany(_INSERT_INVENTORY_SQL, rows)
 
-                cursor.execute(sql, db_params)
+    def _save_inventory_additions(self, db_params_list):
+        """5. Save new inventory rows in a single transaction, then confirm and refresh."""
+        if not db_params_list:
+            return
+        try:
+            self._insert_inventory_rows(db_params_list)
             
             # 6. Show confirmation and refresh
-            messagebox.showinfo("Success", f"Added to inventory!\n\nSKU: {sku}\n{artist} - {title}")
+            if len(db_params_list) == 1:
+                sku, artist, title = db_params_list[0][:3]
+                messagebox.showinfo("Success", f"Added to inventory!\n\nSKU: {sku}\n{artist} - {title}")
+            else:
+                messagebox.showinfo("Success", f"Added {len(db_params_list)} items to inventory!")
             self.populate_inventory_view()
             self.notebook.select(self.inventory_tab)
 
@@ -2566,7 +3039,7 @@ class VinylToolApp:
         listbox_container.pack(fill="x", expand=True)
         self.image_listbox = tk.Listbox(listbox_container, height=6, selectmode=tk.SINGLE)
         self.image_listbox.pack(side="left", fill="x", expand=True)
-        self.image_listbox.bind("<<ListboxSelect>>", self._update_image_preview)
+        self.image_listbox.bind("<<ListboxSelect>>", self._schedule_image_preview)
         image_scrollbar = tk.Scrollbar(listbox_container, orient="vertical", command=self.image_listbox.yview)
         image_scrollbar.pack(side="right", fill="y")
         self.image_listbox.config(yscrollcommand=image_scrollbar.set)
@@ -2598,12 +3071,25 @@ class VinylToolApp:
     
     def _update_image_listbox(self):
         """Clears and repopulates the image listbox from self.image_paths."""
-        self.image_listbox.delete(0, tk.END)
-        for path in self.image_paths:
-            self.image_listbox.insert(tk.END, os.path.basename(path))
+        listbox = self.image_listbox
+        basenames = self._image_basenames = [os.path.basename(path) for path in self.image_paths]
+        # Detach the scrollbar while repopulating; one delete + one varargs insert
+        scroll_cmd = listbox.cget("yscrollcommand")
+        listbox.config(yscrollcommand="")
+        try:
+            listbox.delete(0, tk.END)
+            if basenames:
+                listbox.insert(tk.END, *basenames)
+        finally:
+            listbox.config(yscrollcommand=scroll_cmd)
 
     def _update_image_preview(self, event=None):
         """Updates the image preview label when a listbox item is selected."""
+        # Any decode still queued is for an older selection
+        pending = self._pending_preview_future
+        if pending is not None:
+            pending.cancel()
+            self._pending_preview_future = None
         try:
             selected_indices = self.image_listbox.curselection()
             if not selected_indices:
@@ -2613,35 +3099,160 @@ class VinylToolApp:
             idx = selected_indices[0]
             image_path = self.image_paths[idx]
 
-            if not os.path.exists(image_path):
-                self.image_preview_label.config(image='', text=f"Image not found:\n{os.path.basename(image_path)}")
+            # One stat serves both as the existence check and the cache key's mtime
+            try:
+                mtime = os.stat(image_path).st_mtime
+            except FileNotFoundError:
+                self._show_image_not_found(image_path)
+                return
+            if (image_path, mtime) == self._current_preview_path:
+                return  # Same, unmodified file still on screen (e.g. after a reorder)
+
+            # Create a thumbnail for preview (fixed size keeps cache keys stable across resizes)
+            preview_size = self._preview_pixel_size
+
+            # Reuse the decoded thumbnail when the file and preview size are unchanged
+            key = (image_path, mtime, preview_size)
+            preview = self._preview_cache.get(key)
+            if preview is not None:
+                self._preview_cache.move_to_end(key)
+                self._show_image_preview(preview, key)
                 return
 
-            with Image.open(image_path) as img:
-                # Create a thumbnail for preview
-                preview_size = (self.image_preview_label.winfo_width(), self.image_preview_label.winfo_height())
-                # Fallback size if widget not rendered yet
-                if preview_size[0] < 20 or preview_size[1] < 20: 
-                    preview_size = (200, 200)
-                
-                img.thumbnail(preview_size, Image.Resampling.LANCZOS)
-                
-                photo_image = ImageTk.PhotoImage(img)
-                
-                # Update the label
-                self.image_preview_label.config(image=photo_image, text="")
-                # IMPORTANT: Keep a reference to the image to prevent garbage collection
-                self.image_preview_label.image = photo_image
+            # Decode off the Tk thread; _apply_image_preview pastes into the PhotoImage
+            future = self._preview_pool.submit(self._decode_for_preview, key, self._get_preview_bg())
+            self._pending_preview_future = future
+            future.add_done_callback(lambda f, k=key: self.safe_after(0, lambda: self._apply_image_preview(f, k)))
 
         except Exception as e:
             logger.error(f"Error updating image preview: {e}")
+            self._current_preview_path = None
+            self.image_preview_label.config(image='', text="Error loading preview")
+
+    def _schedule_image_preview(self, event=None):
+        """Debounce listbox selection so only the last change within 80ms is previewed."""
+        if self._preview_after_id:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(80, self._run_scheduled_image_preview)
+
+    def _run_scheduled_image_preview(self):
+        self._preview_after_id = None
+        self._update_image_preview()
+
+    def _get_preview_bg(self):
+        """Preview label background as an RGB tuple (resolved once, on the Tk thread)."""
+        if self._preview_bg is None:
+            bg = ttk.Style().lookup("TLabel", "background") or "#dcdad5"
+            self._preview_bg = tuple(c >> 8 for c in self.root.winfo_rgb(bg))
+        return self._preview_bg
+
+    def _prewarm_image_previews(self, paths):
+        """Decode previews for newly imported images in parallel and add them to the cache."""
+        background = self._get_preview_bg()
+        # Beyond the cache size, later decodes would only evict earlier ones
+        for path in paths[:_PREVIEW_CACHE_SIZE]:
+            try:
+                key = (path, os.stat(path).st_mtime, self._preview_pixel_size)
+            except OSError:
+                continue
+            if key in self._preview_cache:
+                continue
+            future = self._prewarm_pool.submit(self._decode_for_preview, key, background)
+            future.add_done_callback(lambda f, k=key: self.safe_after(0, lambda: self._store_prewarmed_preview(f, k)))
+
+    def _store_prewarmed_preview(self, future, key):
+        if future.cancelled() or future.exception() is not None:
+            return
+        cache = self._preview_cache
+        cache[key] = future.result()
+        if len(cache) > _PREVIEW_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _decode_for_preview(key, background):
+        """Open, draft and thumbnail an image, centered on a preview-sized RGB canvas."""
+        image_path, _mtime, preview_size = key
+        with Image.open(image_path) as img:
+            if img.format == "JPEG":
+                # Let libjpeg decode at a reduced DCT scale close to the preview size
+                img.draft("RGB", preview_size)
+            # Preview only: bicubic is plenty after draft() has already downscaled
+            img.thumbnail(preview_size, Image.Resampling.BICUBIC)
+            # Center on a fixed-size RGB canvas so one PhotoImage can be reused
+            preview = Image.new("RGB", preview_size, background)
+            offset = ((preview_size[0] - img.width) // 2, (preview_size[1] - img.height) // 2)
+            if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+                rgba = img.convert("RGBA")
+                preview.paste(rgba, offset, rgba)
+            else:
+                preview.paste(img.convert("RGB"), offset)
+        return preview
+
+    def _apply_image_preview(self, future, key):
+        """Show a decoded preview on the Tk thread, unless a newer request exists."""
+        if future is not self._pending_preview_future or future.cancelled():
+            return
+        self._pending_preview_future = None
+        error = future.exception()
+        if isinstance(error, FileNotFoundError):
+            # Removed between the stat and the decode
+            self._show_image_not_found(key[0])
+            return
+        if error is not None:
+            logger.error(f"Error updating image preview: {error}")
+            self._current_preview_path = None
             self.image_preview_label.config(image='', text="Error loading preview")
+            return
+        preview = future.result()
+        cache = self._preview_cache
+        cache[key] = preview
+        if len(cache) > _PREVIEW_CACHE_SIZE:
+            cache.popitem(last=False)
+        self._show_image_preview(preview, key)
+
+    def _show_image_not_found(self, image_path):
+        self._current_preview_path = None
+        self.image_preview_label.config(image='', text=f"Image not found:\n{os.path.basename(image_path)}")
+
+    def _show_image_preview(self, preview, key):
+        self._current_preview_path = key[:2]
+        # Paste into the shared PhotoImage; a new Tk image is only made when the size changes
+        photo_image = self._preview_photo
+        if photo_image is None or (photo_image.width(), photo_image.height()) != preview.size:
+            if photo_image is not None:
+                photo_image = None  # drop the local reference so the release can free it
+                self._release_preview_photo()
+            photo_image = self._preview_photo = ImageTk.PhotoImage("RGB", preview.size)
+        photo_image.paste(preview)
+        # Update the label
+        self.image_preview_label.config(image=photo_image, text="")
+        # IMPORTANT: Keep a reference to the image to prevent garbage collection
+        self.image_preview_label.image = photo_image
+
+    def _release_preview_photo(self):
+        """Drop the shared preview PhotoImage so its Tk image is actually deleted."""
+        if self._preview_photo is None:
+            return
+        # Drop our references before detaching it from the label, so the last one
+        # goes with the widget's and PhotoImage.__del__ deletes the Tk image
+        self.image_preview_label.image = None
+        self._preview_photo = None
+        self.image_preview_label.config(image='')
 
     def _clear_image_preview(self):
         """Clears the image preview area."""
+        self._current_preview_path = None
         self.image_preview_label.config(image='', text="Select an image to preview")
         self.image_preview_label.image = None
 
+    def _swap_image_rows(self, first):
+        """Swap image rows first and first + 1 in both image_paths and the listbox."""
+        for seq in (self.image_paths, self._image_basenames):
+            seq[first], seq[first + 1] = seq[first + 1], seq[first]
+        names = self._image_basenames
+        self.image_listbox.delete(first, first + 1)
+        self.image_listbox.insert(first, names[first], names[first + 1])
+
     def _move_image_up(self):
         """Moves the selected image up in the list."""
         try:
@@ -2650,8 +3261,7 @@ class VinylToolApp:
             
             idx = selected_indices[0]
             if idx > 0:
-                self.image_paths.insert(idx - 1, self.image_paths.pop(idx))
-                self._update_image_listbox()
+                self._swap_image_rows(idx - 1)
                 self.image_listbox.selection_set(idx - 1)
                 self._update_image_preview() # Update preview after move
         except Exception as e:
@@ -2665,8 +3275,7 @@ class VinylToolApp:
 
             idx = selected_indices[0]
             if idx < len(self.image_paths) - 1:
-                self.image_paths.insert(idx + 1, self.image_paths.pop(idx))
-                self._update_image_listbox()
+                self._swap_image_rows(idx)
                 self.image_listbox.selection_set(idx + 1)
                 self._update_image_preview() # Update preview after move
         except Exception as e:
@@ -2683,7 +3292,8 @@ class VinylToolApp:
             # if messagebox.askyesno("Delete Image", f"Permanently delete {os.path.basename(self.image_paths[idx])}?"):
             #     os.remove(self.image_paths[idx])
             self.image_paths.pop(idx)
-            self._update_image_listbox()
+            self._image_basenames.pop(idx)
+            self.image_listbox.delete(idx)
             
             if len(self.image_paths) > 0:
                 new_selection = min(idx, len(self.image_paths) - 1)
@@ -2702,7 +3312,10 @@ class VinylToolApp:
         self.discogs_search_filter_var = tk.StringVar()
         filter_entry = tk.Entry(controls_frame, textvariable=self.discogs_search_filter_var, width=30)
         filter_entry.pack(side="left", padx=5)
-        filter_entry.bind("<KeyRelease>", self.refresh_discogs_view)
+        filter_entry.bind("<KeyRelease>", self._schedule_discogs_filter)
+        self.discogs_load_more_button = tk.Button(controls_frame, text="Load more", state="disabled",
+                                                  command=self._load_more_discogs_results)
+        self.discogs_load_more_button.pack(side="right", padx=5)
         
         # Results tree
         tree_container = tk.Frame(parent)
@@ -2712,7 +3325,7 @@ class VinylToolApp:
         self.discogs_tree = ttk.Treeview(tree_container, columns=cols, show="headings")
         
         for col in cols:
-            self.discogs_tree.heading(col, text=col, command=lambda c=col: self.sort_discogs_results(c))
+            self.discogs_tree.heading(col, text=col, command=partial(self._sort_by_heading, "discogs", col))
         
         # Column widths
         self.discogs_tree.column("ID", width=0, stretch=tk.NO)
@@ -2758,7 +3371,7 @@ class VinylToolApp:
         self.inventory_search_var = tk.StringVar()
         search_entry = tk.Entry(controls_frame, textvariable=self.inventory_search_var, width=30)
         search_entry.pack(side="left", padx=5)
-        search_entry.bind("<KeyRelease>", lambda e: self.populate_inventory_view(self.inventory_search_var.get()))
+        search_entry.bind("<KeyRelease>", self._schedule_inventory_search)
         tk.Button(controls_frame, text="Edit in Lister", command=self.edit_in_lister).pack(side="left", padx=5)
         tk.Button(controls_frame, text="Delete Selected", command=self.delete_inventory_item).pack(side="left", padx=5)
         tk.Button(controls_frame, text="Select All", command=self.select_all_inventory).pack(side="left", padx=(10, 0))
@@ -2810,7 +3423,7 @@ class VinylToolApp:
         self.inventory_tree = ttk.Treeview(inv_frame, columns=cols, show="headings", selectmode="extended")
 
         for col in cols:
-            self.inventory_tree.heading(col, text=col, command=lambda c=col: self.sort_inventory(c))
+            self.inventory_tree.heading(col, text=col, command=partial(self._sort_by_heading, "inventory", col))
 
         # Column widths (adjusted for additional ID columns)
         self.inventory_tree.column("SKU", width=140)
@@ -2833,7 +3446,9 @@ class VinylToolApp:
         
         # Scrollbar
         inv_scroll = tk.Scrollbar(inv_frame, orient="vertical", command=self.inventory_tree.yview)
-        self.inventory_tree.configure(yscrollcommand=inv_scroll.set)
+        self._inventory_scrollbar = inv_scroll
+        # Scrolling (wheel, PgDn, End) to the bottom pulls in the next page
+        self.inventory_tree.configure(yscrollcommand=self._on_inventory_yscroll)
         
         # Pack
         self.inventory_tree.pack(side="left", fill="both", expand=True)
@@ -2845,6 +3460,8 @@ class VinylToolApp:
         
         self.publish_log = scrolledtext.ScrolledText(log_frame, height=8, state="disabled", wrap="word")
         self.publish_log.pack(fill="both", expand=True)
+        for color in ("red", "green", "black"):
+            self.publish_log.tag_configure(color, foreground=color)
         
         # Context menu with all options
         self.inventory_context_menu = tk.Menu(self.root, tearoff=0)
@@ -2947,9 +3564,26 @@ class VinylToolApp:
         self.sync_log_text.pack(side="left", fill="both", expand=True)
         log_scroll.pack(side="right", fill="y")
         
-        # --- Mappings & Workflow Tab ---
+        # --- Mappings & Workflow / Sales tabs: stub frames, built on first view ---
         mappings_tab = ttk.Frame(settings_notebook)
         settings_notebook.add(mappings_tab, text="Mappings & Workflow")
+        sales_tab = ttk.Frame(settings_notebook)
+        settings_notebook.add(sales_tab, text="Sales History")
+        self._settings_tab_builders = {
+            str(mappings_tab): (self._build_mappings_tab, mappings_tab),
+            str(sales_tab): (self._build_sales_tab, sales_tab),
+        }
+        settings_notebook.bind("<<NotebookTabChanged>>", self._on_settings_tab_changed)
+
+    def _on_settings_tab_changed(self, event):
+        """Build a Settings sub-tab the first time it is selected."""
+        builder = self._settings_tab_builders.pop(event.widget.select(), None)
+        if builder:
+            build, frame = builder
+            build(frame)
+
+    def _build_mappings_tab(self, mappings_tab):
+        """Image workflow and status mapping settings."""
 
         # Image Workflow Settings
         image_frame = ttk.LabelFrame(mappings_tab, text="Image Workflow Settings", padding=(10, 5))
@@ -2970,23 +3604,16 @@ class VinylToolApp:
         tk.Label(status_mapping_frame, text="Configure how Discogs inventory statuses map to your local inventory statuses:", 
                  font=("Helvetica", 11)).pack(anchor="w", pady=(0, 10))
         
-        # Mapping table
+        # Mapping table (rows are built before the frame is packed, then reused)
         mapping_table_frame = tk.Frame(status_mapping_frame)
-        mapping_table_frame.pack(fill="x", pady=(0, 10))
         
         tk.Label(mapping_table_frame, text="Discogs Status", font=("Helvetica", 12, "bold")).grid(row=0, column=0, padx=10, pady=5, sticky="w")
         tk.Label(mapping_table_frame, text="→", font=("Helvetica", 12, "bold")).grid(row=0, column=1, padx=5, pady=5)
         tk.Label(mapping_table_frame, text="Local Status", font=("Helvetica", 12, "bold")).grid(row=0, column=2, padx=10, pady=5, sticky="w")
         
-        for i, (discogs_status, default_local_status) in enumerate(DEFAULT_STATUS_MAPPINGS.items(), 1):
-            tk.Label(mapping_table_frame, text=discogs_status, font=("Helvetica", 11)).grid(row=i, column=0, padx=10, pady=3, sticky="w")
-            tk.Label(mapping_table_frame, text="→", font=("Helvetica", 11)).grid(row=i, column=1, padx=5, pady=3)
-            
-            var = tk.StringVar(value=self.status_mappings.get(discogs_status, default_local_status))
-            self.status_mapping_vars[discogs_status] = var
-            
-            ttk.Combobox(mapping_table_frame, textvariable=var, values=LOCAL_STATUSES, 
-                        state="readonly", width=15).grid(row=i, column=2, padx=10, pady=3, sticky="w")
+        self._status_mapping_table = mapping_table_frame
+        self._rebuild_status_mapping_rows()
+        mapping_table_frame.pack(fill="x", pady=(0, 10))
         
         # Mapping buttons
         mapping_buttons_frame = tk.Frame(status_mapping_frame)
@@ -2995,10 +3622,8 @@ class VinylToolApp:
         tk.Button(mapping_buttons_frame, text="Save Mappings", command=self._save_status_mappings).pack(side="left", padx=(0, 10))
         tk.Button(mapping_buttons_frame, text="Reset to Defaults", command=self._reset_status_mappings).pack(side="left")
 
-        # --- Sales Tab ---
-        sales_tab = ttk.Frame(settings_notebook)
-        settings_notebook.add(sales_tab, text="Sales History")
-        
+    def _build_sales_tab(self, sales_tab):
+        """Discogs and eBay sales history views."""
         sales_notebook_inner = ttk.Notebook(sales_tab)
         sales_notebook_inner.pack(fill="both", expand=True, pady=5)
         
@@ -3074,13 +3699,20 @@ class VinylToolApp:
         es_scroll.pack(side="right", fill="y", pady=(5, 0))
         self.ebay_sales_tree.configure(yscrollcommand=es_scroll.set)
 
+        # Connection checks may have run before this tab existed
+        if self._discogs_sales_ready:
+            self.check_sales_button.config(state="normal")
+        if self._ebay_sales_ready:
+            self.check_ebay_sales_button.config(state="normal")
+
     def _select_image_staging_path(self):
         """Open a dialog to select the image staging directory."""
         directory = filedialog.askdirectory(
             title="Select Image Staging Folder",
-            initialdir=self.config.get("image_staging_path") or os.path.expanduser("~")
+            initialdir=self._staging_initialdir
         )
         if directory:
+            self._staging_initialdir = directory
             self.image_staging_path_var.set(directory)
             self.config.save({"image_staging_path": directory})
             messagebox.showinfo("Path Saved", f"Image staging path set to:\n{directory}")
@@ -3093,7 +3725,9 @@ class VinylToolApp:
                 user = self.discogs_api.client.identity()
                 self.discogs_auth_status_var.set(f"Connected as: {user.username}")
                 self.discogs_connect_button.config(state="disabled")
-                self.check_sales_button.config(state="normal")
+                self._discogs_sales_ready = True
+                if self.check_sales_button is not None:
+                    self.check_sales_button.config(state="normal")
                 self.import_button.config(state="normal")
                 
                 # Enable all Discogs buttons across tabs
@@ -3120,7 +3754,9 @@ class VinylToolApp:
         # eBay status
         if self.ebay_api.test_connection():
             self.ebay_auth_status_var.set("Connected Successfully")
-            self.check_ebay_sales_button.config(state="normal")
+            self._ebay_sales_ready = True
+            if self.check_ebay_sales_button is not None:
+                self.check_ebay_sales_button.config(state="normal")
             self.list_on_ebay_button.config(state="normal")
     
     def _copy_ebay_status(self):
@@ -3133,6 +3769,59 @@ class VinylToolApp:
     # ALL CORE METHODS INCLUDING MISSING ONES
     # ========================================================================
     
+    def _begin_action(self, action, token=True):
+        """Claim the single in-flight slot for `action`; False if the same request is already running.
+
+        A different token replaces the pending request (its result is dropped by _is_current_action).
+        """
+        if self._inflight.get(action) == token:
+            self.root.bell()
+            return False
+        self._inflight[action] = token
+        return True
+
+    def _is_current_action(self, action, token=True):
+        return self._inflight.get(action) == token
+
+    def _end_action(self, action, token=True):
+        if self._inflight.get(action) == token:
+            del self._inflight[action]
+        self._busy(False)
+
+    def _db_write(self, work, on_done=None, on_error=None):
+        """Run work(conn) in one transaction on the serialized DB writer thread.
+
+        on_done(result) / on_error(exc) are posted back to the Tk thread. Returns
+        the Future, so worker threads can wait for their write to land.
+        """
+        def run():
+            try:
+                with self.db.get_connection() as conn:
+                    result = work(conn)
+            except Exception as e:
+                logger.error(f"Database write failed: {e}", exc_info=True)
+                if on_error and not self.app_is_closing:
+                    self.safe_after(0, lambda err=e: on_error(err))
+                raise
+            # No UI callbacks once closing: the window is about to be destroyed
+            if on_done and not self.app_is_closing:
+                self.safe_after(0, lambda: on_done(result))
+            return result
+        future = self._db_write_pool.submit(run)
+        self._db_write_pending.add(future)
+        future.add_done_callback(self._db_write_pending.discard)
+        return future
+
+    def _busy(self, on):
+        """Show/clear the busy cursor; update_idletasks repaints it without draining user input.
+
+        Calls nest: every _busy(True) is paired with one _busy(False), and the cursor
+        only resets once no job still holds it, so overlapping jobs don't clear each other's.
+        """
+        self._busy_count = self._busy_count + 1 if on else max(0, self._busy_count - 1)
+        self.root.config(cursor="watch" if self._busy_count else "")
+        self.root.update_idletasks()
+
     def search_discogs(self):
         """Search Discogs for releases"""
         artist = self.entries["artist"].get().strip()
@@ -3142,27 +3831,52 @@ class VinylToolApp:
             messagebox.showwarning("Input Required", "Please enter artist and/or title")
             return
         
-        self.root.config(cursor="watch")
-        self.root.update()
-        
         # Build search parameters
-        params = {"per_page": 100, "type": "release"}
+        params = {"type": "release"}
         if artist:
             params["artist"] = artist
         if title:
             params["release_title"] = title
+        self._run_discogs_search(params)
+
+    def _run_discogs_search(self, params, page=1):
+        """Fetch one page of search results; page 1 replaces the tree, later pages append."""
+        # Most matches are in the first couple of dozen rows; config can raise it (Discogs max 100)
+        params = dict(params, per_page=int(self.config.get("discogs_search_per_page", 25) or 25), page=page)
+        token = tuple(sorted(params.items()))
+        if not self._begin_action("search", token):
+            return
+        
+        self._busy(True)
+        
+        def show(results, pagination):
+            if not self._is_current_action("search", token):
+                return
+            self._discogs_search_params = params
+            self._discogs_search_page = page
+            if page == 1:
+                self.display_discogs_results(results)
+            else:
+                self._append_discogs_results(results)
+            # Judged from Discogs' pagination, not the row count: the vinyl filter can
+            # shorten a page that still has more behind it
+            try:
+                more = int(pagination.get("page") or page) < int(pagination.get("pages") or 0)
+            except (TypeError, ValueError):
+                more = False
+            self.discogs_load_more_button.config(state="normal" if more else "disabled")
         
         # Search in thread
         def search_worker():
             try:
-                results = self.discogs_api.search(params)
-                self.safe_after(0, lambda: self.display_discogs_results(results))
+                results, pagination = self.discogs_api.search_page(params)
+                self.safe_after(0, lambda: show(results, pagination))
             except Exception as e:
                 self.safe_after(0, lambda err=e: messagebox.showerror("Search Error", str(err)))
             finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
+                self.safe_after(0, lambda: self._end_action("search", token))
         
-        threading.Thread(target=search_worker, daemon=True).start()
+        self._io_pool.submit(search_worker)
     
     def search_by_catno(self):
         """Search Discogs by catalog number"""
@@ -3172,27 +3886,21 @@ class VinylToolApp:
             messagebox.showwarning("Input Required", "Please enter a catalog number")
             return
         
-        self.root.config(cursor="watch")
-        self.root.update()
-        
-        def search_worker():
-            try:
-                results = self.discogs_api.search({"catno": catno, "per_page": 100})
-                self.safe_after(0, lambda: self.display_discogs_results(results))
-            except Exception as e:
-                self.safe_after(0, lambda err=e: messagebox.showerror("Search Error", str(err)))
-            finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
-        
-        threading.Thread(target=search_worker, daemon=True).start()
+        self._run_discogs_search({"catno": catno})
     
 
 
     def display_discogs_results(self, results):
         """Display Discogs search results in the results tree"""
-        # Clear existing results
-        for item_id in self.discogs_tree.get_children():
-            self.discogs_tree.delete(item_id)
+        # Clear existing results (including rows detached by the filter) in one Tcl call
+        tree = self.discogs_tree
+        stale = set(self._discogs_result_iids.values())
+        stale.update(tree.get_children())
+        if stale:
+            tree.delete(*stale)
+        self._discogs_result_iids = {}
+        self._discogs_result_blobs = {}
+        self._discogs_sort_keys = {}
 
         if not results:
             try:
@@ -3202,13 +3910,34 @@ class VinylToolApp:
             return
 
         self.discogs_search_results = results
+        self._insert_discogs_rows(results)
 
-        for item in results:
-            title_field = item.get("title", "") or ""
-            parts = title_field.split(" - ", 1)
-            artist = parts[0] if parts else ""
-            title = parts[1] if len(parts) > 1 else ""
+    def _append_discogs_results(self, results):
+        """Add a further page of search results below the rows already shown."""
+        if not results:
+            return
+        self.discogs_search_results.extend(results)
+        self._insert_discogs_rows(results)
+        if self.discogs_search_filter_var.get():
+            self.refresh_discogs_view()
+
+    def _load_more_discogs_results(self):
+        if self._discogs_search_params:
+            self._run_discogs_search(self._discogs_search_params, self._discogs_search_page + 1)
 
+    def _insert_discogs_rows(self, results):
+        insert = self.discogs_tree.insert
+        iids = self._discogs_result_iids
+        blobs = self._discogs_result_blobs
+        sort_keys = self._discogs_sort_keys
+        for item in results:
+            artist, _, title = (item.get("title") or "").partition(" - ")
+            blobs[id(item)] = f"{artist} {title} {item.get('catno', '')} {item.get('year', '')}".lower()
+            try:
+                year_key = int(item.get("year") or 0)
+            except (TypeError, ValueError):
+                year_key = 0
+            sort_keys[id(item)] = (artist.lower(), title.lower(), year_key)
             values = (
                 item.get("id"),
                 artist,
@@ -3216,9 +3945,9 @@ class VinylToolApp:
                 item.get("catno", "N/A"),
                 item.get("year", "N/A"),
                 item.get("country", "N/A"),
-                ", ".join((item.get("format", []) or []))
+                ", ".join(item.get("format") or ())
             )
-            self.discogs_tree.insert("", "end", values=values)
+            iids[id(item)] = insert("", "end", values=values)
 
     def _grade_name_to_abbrev(self, v: str) -> str:
         try:
@@ -3307,24 +4036,25 @@ class VinylToolApp:
         
         if not release_id:
             return
+        if not self._begin_action("apply", release_id):
+            return
         
-        self.root.config(cursor="watch")
-        self.root.update()
+        self._busy(True)
         
         def fetch_and_apply_worker():
             try:
                 # Fetch the full, detailed release data
                 release_data = self.discogs_api.get_release(release_id)
                 if release_data:
-                    self.safe_after(0, lambda: self._populate_lister_with_release_data(release_data))
+                    self.safe_after(0, lambda: self._is_current_action("apply", release_id) and self._populate_lister_with_release_data(release_data))
                 else:
                     self.safe_after(0, lambda: messagebox.showerror("API Error", f"Could not fetch full details for release {release_id}."))
             except Exception as e:
                 self.safe_after(0, lambda err=e: messagebox.showerror("API Error", str(err)))
             finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
+                self.safe_after(0, lambda: self._end_action("apply", release_id))
         
-        threading.Thread(target=fetch_and_apply_worker, daemon=True).start()
+        self._io_pool.submit(fetch_and_apply_worker)
 
 
 
@@ -3356,7 +4086,7 @@ class VinylToolApp:
         """
         Populates the lister form with cleaned, detailed data from a full Discogs release.
         """
-        artist_names = [re.sub(r'\s*\(\d+\)$', '', a['name']).strip() for a in release_data.get('artists', [])]
+        artist_names = [_DISCOGS_ARTIST_NUM_RE.sub('', a['name']).strip() for a in release_data.get('artists', ())]
         artist = ", ".join(artist_names)
 
         barcode, cat_no = self._extract_barcode_and_cat_no(release_data)
@@ -3393,6 +4123,7 @@ class VinylToolApp:
                  self.entries["format"].set('Other')
 
         self.current_release_id = release_data.get('id')
+        self._last_release_data = release_data
         
         self.release_status_label.config(
             text=f"✓ Release selected: {release_data.get('title')} (ID: {self.current_release_id})",
@@ -3436,9 +4167,10 @@ class VinylToolApp:
             'sleeve_condition': REVERSE_GRADE_MAP.get(self.entries["sleeve_condition"].get(), 'Generic'),
             'comments': self.full_desc.get("1.0", tk.END).strip()
         }
+        if not self._begin_action("list_discogs"):
+            return
         
-        self.root.config(cursor="watch")
-        self.root.update()
+        self._busy(True)
         
         def list_worker():
             try:
@@ -3448,9 +4180,9 @@ class VinylToolApp:
             except Exception as e:
                 self.safe_after(0, lambda err=e: messagebox.showerror("Listing Error", str(err)))
             finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
+                self.safe_after(0, lambda: self._end_action("list_discogs"))
         
-        threading.Thread(target=list_worker, daemon=True).start()
+        self._io_pool.submit(list_worker)
     
     def _handle_listing_success(self, listing_id):
         """Handle successful Discogs listing"""
@@ -3477,13 +4209,15 @@ class VinylToolApp:
     
         # Validation
     
+        snap = self._snapshot_form()
+    
         required_fields = ['artist', 'title', 'media_condition']
     
         for field in required_fields:
     
             key = field.replace(' ', '_')
     
-            if not self.entries.get(key) or not self.entries[key].get().strip():
+            if not snap.get(key, "").strip():
     
                 messagebox.showwarning("Validation Error", f"Please enter {field}")
     
@@ -3516,18 +4250,14 @@ class VinylToolApp:
             self.sku_display_var.set(sku)
 
     
-        format_val = self.entries["format"].get() or "LP"
+        format_val = snap["format"] or "LP"
     
-        media_cond_str = self.entries["media_condition"].get()
+        media_cond_str = snap["media_condition"]
 
     
-        condition_enum = EBAY_INVENTORY_CONDITION_MAP.get(media_cond_str, "USED_GOOD")
+        condition_enum, condition_id_numeric, category_id = _ebay_condition_category(media_cond_str, format_val)
     
-        condition_id_numeric = EBAY_CONDITION_MAP_NUMERIC.get(media_cond_str, "3000")
-    
-        category_id = EBAY_VINYL_CATEGORIES.get(format_val, "176985")
-    
-        ebay_title = self.entries["listing_title"].get() or f"{self.entries['artist'].get()} - {self.entries['title'].get()}"
+        ebay_title = snap["listing_title"] or f"{snap['artist']} - {snap['title']}"
     
         description_html = self.full_desc.get("1.0", tk.END).strip()
 
@@ -3538,7 +4268,7 @@ class VinylToolApp:
     
             "title": ebay_title[:80],
     
-            "release_title": self.entries["title"].get().strip(),
+            "release_title": snap["title"],
     
             "description": description_html,
     
@@ -3552,9 +4282,9 @@ class VinylToolApp:
     
             "condition_id_numeric": condition_id_numeric,
     
-            "media_condition": self.entries["media_condition"].get(),
+            "media_condition": media_cond_str,
     
-            "sleeve_condition": self.entries["sleeve_condition"].get(),
+            "sleeve_condition": snap["sleeve_condition"],
     
             "currency": "GBP",
     
@@ -3638,9 +4368,11 @@ class VinylToolApp:
     
         # Background worker
     
-        self.root.config(cursor="watch")
+        if not self._begin_action("list_ebay"):
+    
+            return
     
-        self.root.update()
+        self._busy(True)
     
         self.notebook.select(self.inventory_tab)
 
@@ -3673,10 +4405,10 @@ class VinylToolApp:
     
             finally:
     
-                self.safe_after(0, lambda: self.root.config(cursor=""))
+                self.safe_after(0, lambda: self._end_action("list_ebay"))
 
     
-        threading.Thread(target=list_worker, daemon=True).start()
+        self._io_pool.submit(list_worker)
     
     def _handle_ebay_listing_success(self, sku, offer_id):
 
@@ -3729,7 +4461,7 @@ class VinylToolApp:
     
 
     
-        now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        now_iso = datetime.datetime.now(_UTC).isoformat()
 
     
         try:
@@ -3741,7 +4473,7 @@ class VinylToolApp:
                 cursor = conn.cursor()
 
     
-                cursor.execute("UPDATE inventory SET ebay_listing_id = ?, ebay_updated_at = ? WHERE sku = ?", (stored_id, now_iso, sku))
+                cursor.execute(_SET_EBAY_LISTING_ID_SQL, (stored_id, now_iso, sku))
 
     
             self.populate_inventory_view()
@@ -3774,27 +4506,31 @@ class VinylToolApp:
     
     def save_to_inventory(self):
         """Save current form to inventory, ensuring full payload is saved on update."""
-        payload_json = json.dumps(self._serialize_form_to_payload())
+        payload = self._serialize_form_to_payload()
+        if self.editing_sku and payload == self._loaded_payload:
+            messagebox.showinfo("No Changes", f"SKU {self.editing_sku} has not been modified.")
+            return
+        payload_json = _json_dumps(payload)
         data = {
-            "artist": self.entries["artist"].get().strip(),
-            "title": self.entries["title"].get().strip(),
-            "cat_no": self.entries["cat_no"].get().strip(),
-            "year": self.entries["year"].get().strip(),
-            "format": self.entries["format"].get(),
-            "media_condition": self.entries["media_condition"].get(),
-            "sleeve_condition": self.entries["sleeve_condition"].get(),
+            "artist": payload["artist"],
+            "title": payload["title"],
+            "cat_no": payload["cat_no"],
+            "year": payload["year"],
+            "format": payload["format"],
+            "media_condition": payload["media_condition"],
+            "sleeve_condition": payload["sleeve_condition"],
             "price": self.price_entry.get().strip(),
             "status": "For Sale",
             "discogs_release_id": self.current_release_id,
-            "notes": self.entries["condition_notes"].get("1.0", "end-1c").strip(),
-            "matrix_runout": self.entries["matrix_runout"].get("1.0", "end-1c").strip(),
-            "condition_tags": self.entries["condition_tags"].get().strip(),
-            "description": self.full_desc.get("1.0", tk.END).strip(),
-            "shipping_option": self.entries["shipping_option"].get(),
-            "barcode": self.entries["barcode"].get().strip(),
-            "genre": self.entries["genre"].get(),
-            "new_used": self.entries["new_used"].get(),
-            "listing_title": self.entries["listing_title"].get().strip()
+            "notes": payload["condition_notes"],
+            "matrix_runout": payload["matrix_runout"],
+            "condition_tags": payload["condition_tags"],
+            "description": payload["description"],
+            "shipping_option": payload["shipping_option"],
+            "barcode": payload["barcode"],
+            "genre": payload["genre"],
+            "new_used": payload["new_used"],
+            "listing_title": payload["listing_title"]
         }
         
         if not data["title"]:
@@ -3807,6 +4543,10 @@ class VinylToolApp:
             messagebox.showwarning("Validation Error", "Invalid price")
             return
         
+        # Claim the slot before a SKU is chosen: a new SKU comes from the clock, so
+        # two quick clicks would otherwise get different SKUs and both insert
+        if not self._begin_action("save"):
+            return
         is_update = bool(self.editing_sku)
         
         if is_update:
@@ -3817,50 +4557,39 @@ class VinylToolApp:
         else:
             sku = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
 
-        try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                if is_update:
-                    # --- CRITICAL FIX: Ensure payload is saved on update ---
-                    sql = """UPDATE inventory SET artist = :artist, title = :title, cat_no = :cat_no, year = :year, format = :format,
-                            media_condition = :media_condition, sleeve_condition = :sleeve_condition, price = :price, 
-                            discogs_release_id = :discogs_release_id, notes = :notes, description = :description,
-                            shipping_option = :shipping_option, barcode = :barcode, genre = :genre, new_used = :new_used, 
-                            listing_title = :listing_title, matrix_runout = :matrix_runout, condition_tags = :condition_tags,
-                            last_modified = :last_modified, inv_updated_at = :inv_updated_at, lister_payload = :lister_payload WHERE sku = :sku"""
-                    params = data
-                    now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-                    params["last_modified"] = now_iso
-                    # update local inventory timestamp
-                    params["inv_updated_at"] = now_iso
-                    params["lister_payload"] = payload_json
-                    params["sku"] = sku
-                    cursor.execute(sql, params)
-                    messagebox.showinfo("Success", f"Updated SKU: {sku}")
-                else:
-                    sql = """INSERT INTO inventory (sku, artist, title, cat_no, year, format, media_condition,
-                            sleeve_condition, price, status, discogs_release_id, notes, description, shipping_option, barcode, genre, new_used,
-                            listing_title, matrix_runout, condition_tags, date_added, last_modified, inv_updated_at, lister_payload
-                            ) VALUES (:sku, :artist, :title, :cat_no, :year, :format, :media_condition,
-                            :sleeve_condition, :price, :status, :discogs_release_id, :notes, :description, :shipping_option, :barcode, :genre, :new_used,
-                            :listing_title, :matrix_runout, :condition_tags, :date_added, :last_modified, :inv_updated_at, :lister_payload)"""
-                    now = datetime.datetime.now(datetime.timezone.utc).isoformat()
-                    params = data
-                    params["sku"] = sku
-                    params["date_added"] = now
-                    params["last_modified"] = now
-                    params["inv_updated_at"] = now
-                    params["lister_payload"] = payload_json
-                    cursor.execute(sql, params)
-                    messagebox.showinfo("Success", f"Saved with SKU: {sku}")
+        now_iso = datetime.datetime.now(_UTC).isoformat()
+        params = data
+        params["sku"] = sku
+        params["last_modified"] = now_iso
+        # update local inventory timestamp
+        params["inv_updated_at"] = now_iso
+        params["lister_payload"] = payload_json
+        if not is_update:
+            params["date_added"] = now_iso
+        self._busy(True)
+
+        def write(conn):
+            # --- CRITICAL FIX: Ensure payload is saved on update ---
+            conn.execute(_SAVE_INVENTORY_UPDATE_SQL if is_update else _SAVE_INVENTORY_INSERT_SQL, params)
+
+        def saved(_):
+            self._end_action("save")
+            # Confirm only after the transaction has committed
+            if is_update:
+                messagebox.showinfo("Success", f"Updated SKU: {sku}")
+            else:
+                messagebox.showinfo("Success", f"Saved with SKU: {sku}")
             
-            self.populate_inventory_view()
+            self._upsert_inventory_row(sku, params)
+            self._note_inventory_change()
             self.clear_form()
-            
-        except Exception as e:
-            logger.error(f"Failed to save to inventory: {e}", exc_info=True)
+
+        def failed(e):
+            self._end_action("save")
             messagebox.showerror("Database Error", f"Failed to save: {e}")
 
+        self._db_write(write, saved, failed)
+
     def clear_form(self):
         """Clear all form fields"""
         for key, widget in self.entries.items():
@@ -3875,24 +4604,31 @@ class VinylToolApp:
         self.full_desc.delete("1.0", tk.END)
         
         self.current_release_id = None
+        self._last_release_data = None
+        self._loaded_payload = None
         self.editing_sku = None
         self.temporary_sku = None
         self.image_paths = []
         self._update_image_listbox()
         self._clear_image_preview()
+        self._release_preview_photo()  # no images left to preview; free the Tk image until the next one
         self.sku_display_var.set("")
         
         self.save_button.config(text="Save to Inventory")
         self.release_status_label.config(text="⚠ No release selected", fg="red")
         
+        self.discogs_tree.delete(*self._discogs_result_iids.values())
+        self._discogs_result_iids = {}
+        self._discogs_result_blobs = {}
+        self._discogs_sort_keys = {}
         for item in self.discogs_tree.get_children():
             self.discogs_tree.delete(item)
     
 
     def generate_image_qr_code(self):
         """Generate QR code for image association."""
-        if not QR_LIBRARIES_AVAILABLE:
-            messagebox.showerror("Missing Libraries", "PIL (Pillow) and qrcode libraries are required for this feature.")
+        if _qr_encoder() is None:
+            messagebox.showerror("Missing Libraries", "The segno or qrcode library is required for this feature.")
             return
 
         if self.editing_sku:
@@ -3908,16 +4644,11 @@ class VinylToolApp:
 
         qr_data = f"vinyltool_sku:{sku}"
         
-        qr = qrcode.QRCode(version=1, box_size=10, border=4)
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-        img = qr.make_image(fill='black', back_color='white')
-        
         # Display in a new window
         qr_window = tk.Toplevel(self.root)
         qr_window.title(f"QR Code for SKU: {sku}")
         
-        photo = ImageTk.PhotoImage(img)
+        photo = _qr_photo_image(qr_window, qr_data, scale=10, border=4)
         label = tk.Label(qr_window, image=photo)
         label.image = photo # Keep a reference
         label.pack(padx=20, pady=20)
@@ -3952,26 +4683,36 @@ class VinylToolApp:
         os.makedirs(permanent_storage_path, exist_ok=True)
         
         new_image_paths = []
+        failed = []
         for source_path in selected_files:
             filename = os.path.basename(source_path)
             destination_path = os.path.join(permanent_storage_path, filename)
             try:
                 # Copy the file to the managed folder. Use copy2 to preserve metadata.
-                shutil.copy2(source_path, destination_path)
+                _copy_image_file(source_path, destination_path)
                 new_image_paths.append(destination_path)
                 logger.info(f"Copied '{filename}' to '{permanent_storage_path}'")
             except Exception as e:
                 logger.error(f"Failed to copy image '{filename}': {e}")
-                messagebox.showerror("Image Copy Error", f"Could not copy file: {filename}\n\nError: {e}")
+                failed.append((filename, str(e)))
 
         # 4. Update the internal image list and the UI
-        # Add new paths and remove duplicates, preserving order
-        for path in new_image_paths:
-            if path not in self.image_paths:
-                self.image_paths.append(path)
+        # Add new paths and remove duplicates, preserving order (dict.fromkeys: one linear pass)
+        self.image_paths = list(dict.fromkeys(self.image_paths + new_image_paths))
         
         self._update_image_listbox()
-        messagebox.showinfo("Images Linked", f"Successfully linked {len(new_image_paths)} images to SKU {sku}.")
+        # Report through the log rather than a modal box; copy errors still pop up, once for the batch
+        self.append_log(f"Linked {len(new_image_paths)} image(s) to SKU {sku}", "green")
+        self._report_file_errors("Image Copy Errors", failed)
+
+    def _report_file_errors(self, title, errors, limit=20):
+        """One error dialog for a batch of (filename, error) failures, instead of one per file."""
+        if not errors:
+            return
+        lines = [f"• {name}: {err}" for name, err in errors[:limit]]
+        if len(errors) > limit:
+            lines.append(f"... and {len(errors) - limit} more (see log)")
+        messagebox.showerror(title, f"{len(errors)} file(s) failed:\n" + "\n".join(lines))
 
     def import_staged_images(self):
         """Import images from the staging folder that have a matching SKU via QR or filename."""
@@ -3993,34 +4734,52 @@ class VinylToolApp:
         sku_folder_path = os.path.join(staging_path, sku_to_find)
         if os.path.isdir(sku_folder_path):
             logger.info(f"Found SKU subfolder: {sku_folder_path}")
-            for filename in sorted(os.listdir(sku_folder_path)):
-                if filename.lower().endswith(('.png', '.jpg', '.jpeg')):
-                    found_images.append(os.path.join(sku_folder_path, filename))
+            # scandir entries carry the file type from the directory read, so no extra stat per file
+            with os.scandir(sku_folder_path) as it:
+                found_images = [
+                    entry.path for entry in sorted(it, key=attrgetter("name"))
+                    if entry.name.lower().endswith(_STAGED_IMAGE_EXTS) and entry.is_file()
+                ]
         else:
             logger.warning(f"SKU subfolder not found. Scanning staging root for QR codes or prefixed files.")
             # Fallback: scan root of staging path for images containing the QR code or SKU prefix
-            for filename in os.listdir(staging_path):
-                 if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.heic')):
-                    filepath = os.path.join(staging_path, filename)
-                    # Check for SKU prefix
-                    if filename.startswith(sku_to_find):
-                        found_images.append(filepath)
-                        logger.info(f"Found matching SKU prefix in {filename}")
-                        continue # Move to next file
-
-                    # Check for QR code if pyzbar is available
-                    if QR_DECODER_AVAILABLE:
-                        try:
-                            with Image.open(filepath) as img:
-                                decoded_objects = qr_decode(img, symbols=[ZBarSymbol.QRCODE])
-                                for obj in decoded_objects:
-                                    decoded_data = obj.data.decode('utf-8')
-                                    if decoded_data == f"vinyltool_sku:{sku_to_find}":
-                                        found_images.append(filepath)
-                                        logger.info(f"Found matching QR code in {filename}")
-                                        break # Stop checking this image's QR codes
-                        except Exception as e:
-                            logger.error(f"Error decoding {filename}: {e}")
+            with os.scandir(staging_path) as it:
+                root_entries = [entry for entry in it
+                                if entry.name.lower().endswith(_STAGED_ROOT_IMAGE_EXTS) and entry.is_file()]
+            qr_candidates = []
+            for entry in root_entries:
+                # Check for SKU prefix
+                if entry.name.startswith(sku_to_find):
+                    found_images.append(entry.path)
+                    logger.info(f"Found matching SKU prefix in {entry.name}")
+                else:
+                    qr_candidates.append(entry)
+
+            # Check the rest for a QR code if pyzbar is available; decoding releases the GIL,
+            # so the images are scanned in parallel and matches collected here in order
+            qr_decoder = _qr_decoder() if qr_candidates else None
+            if qr_decoder:
+                qr_decode, ZBarSymbol = qr_decoder
+                wanted = f"vinyltool_sku:{sku_to_find}"
+
+                def has_sku_qr(entry):
+                    try:
+                        with Image.open(entry.path) as img:
+                            # JPEGs decode straight to grayscale at 1/2..1/8 scale; thumbnail
+                            # covers the remainder and formats draft() cannot scale
+                            img.draft('L', _QR_SCAN_SIZE)
+                            img.thumbnail(_QR_SCAN_SIZE)
+                            decoded_objects = qr_decode(img, symbols=[ZBarSymbol.QRCODE])
+                        return any(obj.data.decode('utf-8') == wanted for obj in decoded_objects)
+                    except Exception as e:
+                        logger.error(f"Error decoding {entry.name}: {e}")
+                        return False
+
+                with ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="qr-scan") as pool:
+                    for entry, matched in zip(qr_candidates, pool.map(has_sku_qr, qr_candidates)):
+                        if matched:
+                            found_images.append(entry.path)
+                            logger.info(f"Found matching QR code in {entry.name}")
 
         if not found_images:
             messagebox.showinfo("No Images Found", f"No images for SKU '{sku_to_find}' were found in the staging folder.")
@@ -4029,47 +4788,75 @@ class VinylToolApp:
         # Move images to a permanent, organized location
         permanent_storage_path = os.path.join(os.path.dirname(__file__), "managed_images", sku_to_find.replace('-TEMP',''))
         os.makedirs(permanent_storage_path, exist_ok=True)
+        # Same volume: a plain rename is an atomic metadata update, no need for shutil.move
+        try:
+            same_fs = os.stat(staging_path).st_dev == os.stat(permanent_storage_path).st_dev
+        except OSError:
+            same_fs = False
+        relocate = os.rename if same_fs else shutil.move
+        failed = []  # (filename, error); list.append is safe from the move threads
         
-        new_image_paths = []
-        for old_path in found_images:
+        def move_image(old_path):
             filename = os.path.basename(old_path)
             new_path = os.path.join(permanent_storage_path, filename)
             try:
-                shutil.move(old_path, new_path)
-                new_image_paths.append(new_path)
+                relocate(old_path, new_path)
                 logger.info(f"Moved {filename} to {permanent_storage_path}")
+                return new_path
             except Exception as e:
                 logger.error(f"Failed to move {filename}: {e}")
                 # If move fails, try to copy as a fallback
                 try:
-                    shutil.copy2(old_path, new_path)
-                    new_image_paths.append(new_path)
+                    _copy_image_file(old_path, new_path)
                     logger.info(f"Copied {filename} to {permanent_storage_path} as a fallback.")
+                    return new_path
                 except Exception as copy_e:
                     logger.error(f"Fallback copy also failed for {filename}: {copy_e}")
+                    failed.append((filename, str(copy_e)))
+                    return None
+
+        if same_fs:
+            new_image_paths = [p for p in map(move_image, found_images) if p]
+        else:
+            # Moves across drives are full copies, so overlap them
+            with ThreadPoolExecutor(max_workers=min(8, len(found_images)), thread_name_prefix="image-move") as pool:
+                new_image_paths = [p for p in pool.map(move_image, found_images) if p]
 
         # Update the UI
-        self.image_paths.extend(new_image_paths)
-        self.image_paths = sorted(list(set(self.image_paths))) # Remove duplicates and sort
+        # Append in scan order, dropping repeats, so any manual ordering is kept
+        self.image_paths = list(dict.fromkeys(self.image_paths + new_image_paths))
         self._update_image_listbox()
-        messagebox.showinfo("Import Complete", f"Successfully imported {len(new_image_paths)} images.")
-
-    def populate_inventory_view(self, search_term=""):
-        """Populate inventory tree view"""
-        for item in self.inventory_tree.get_children():
-            self.inventory_tree.delete(item)
-        
+        self._prewarm_image_previews(new_image_paths)
+        self.append_log(f"Imported {len(new_image_paths)} staged image(s) for SKU {sku_to_find}", "green")
+        self._report_file_errors("Image Import Errors", sorted(failed))
+
+    def populate_inventory_view(self, search_term="", page=0, rest=False):
+        """Populate inventory tree view.
+
+        Filtering and sorting run in SQL and rows are fetched a page at a time
+        (config ``inventory_page_size``, default 200). ``page=0`` refreshes the
+        pages already loaded (just the first one if the search changed); a
+        higher page appends the rows after the last loaded one, or every
+        remaining row with ``rest=True``. Pages continue from the last row's
+        sort key and id rather than an OFFSET, so rows deleted or re-statused
+        since the last load don't shift the next page.
+        """
+        tree = self.inventory_tree
+        search_term = (search_term or "").strip()
         try:
-            with self.db.get_connection() as conn:
+            page_size = max(1, int(self.config.get("inventory_page_size", 200) or 200))
+        except (TypeError, ValueError):
+            page_size = 200
+        appending = bool(page) and self._inventory_last_key is not None
+        if appending:
+            limit = -1 if rest else page_size
+        else:
+            pages = self.inventory_page + 1 if search_term == self._inventory_search_term else 1
+            limit = pages * page_size
+            page = pages - 1
+        try:
+            with self.db.read_connection() as conn:
                 cursor = conn.cursor()
-                # Select additional ID columns and timestamps for display and logic
-                query = "SELECT sku, artist, title, price, status, ebay_item_draft_id, ebay_listing_id, discogs_listing_id, date_added, inv_updated_at, ebay_updated_at, discogs_updated_at FROM inventory"
-                params = []
-                if search_term:
-                    query += " WHERE artist LIKE ? OR title LIKE ? OR sku LIKE ?"
-                    search_pattern = f"%{search_term}%"
-                    params = [search_pattern, search_pattern, search_pattern]
-                
                 sort_map = {
                     "SKU": "sku",
                     "Artist": "artist",
@@ -4082,30 +4869,199 @@ class VinylToolApp:
                     "Date Added": "date_added"
                 }
                 sort_col = sort_map.get(self.inventory_sort_column, "id")
-                query += f" ORDER BY {sort_col} {self.inventory_sort_direction}"
+                direction = "ASC" if self.inventory_sort_direction == "ASC" else "DESC"
+                # Select additional ID columns and timestamps for display and logic;
+                # the trailing id and sort value are the keyset for the next page
+                query = f"SELECT sku, artist, title, price, status, ebay_item_draft_id, ebay_listing_id, discogs_listing_id, date_added, inv_updated_at, ebay_updated_at, discogs_updated_at, id, {sort_col} FROM inventory"
+                where, params = self._inventory_filter_sql(search_term)
+                if appending:
+                    after_sql, after_params = self._inventory_keyset_sql(sort_col, direction, *self._inventory_last_key)
+                    where = f"({where}) AND ({after_sql})" if where else after_sql
+                    params += after_params
+                if where:
+                    query += " WHERE " + where
                 
-                cursor.execute(query, params)
+                query += f" ORDER BY {sort_col} {direction}"
+                if sort_col != "id":
+                    query += f", id {direction}"  # total order, so the keyset is unambiguous
+                query += " LIMIT ?"
+                params.append(limit)
                 
-                for row in cursor.fetchall():
-                    # row indices: 0=sku,1=artist,2=title,3=price,4=status,5=ebay_item_draft_id,6=ebay_listing_id,7=discogs_listing_id,8=date_added,9=inv_updated_at,10=ebay_updated_at,11=discogs_updated_at
-                    price_str = f"£{row[3]:.2f}" if row[3] else ""
-                    date_added_str = ""
-                    if row[8]:
-                        try:
-                            dt = datetime.datetime.fromisoformat(str(row[8]).replace('Z', '+00:00'))
-                            date_added_str = dt.strftime("%Y-%m-%d %H:%M")
-                        except Exception:
-                            date_added_str = row[8]
-                    draft_id = row[5] or ""
-                    live_id = row[6] or ""
-                    discogs_id = row[7] or ""
-                    values = (row[0], row[1] or "", row[2] or "", price_str, row[4] or "", draft_id, live_id, discogs_id, date_added_str)
-                    self.inventory_tree.insert("", "end", values=values)
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+
+            # Rows are keyed by SKU (the tree iid); only new, changed or removed rows touch the tree
+            known = self._inventory_row_values
+            if appending:
+                fresh = known
+                order = self._inventory_order
+            else:
+                fresh = {}
+                order = []
+            for row in rows:
+                # row indices: 0=sku,1=artist,2=title,3=price,4=status,5=ebay_item_draft_id,6=ebay_listing_id,7=discogs_listing_id,8=date_added,9=inv_updated_at,10=ebay_updated_at,11=discogs_updated_at
+                price_str = f"£{row[3]:.2f}" if row[3] else ""
+                date_added_str = _format_inventory_date(row[8]) if row[8] else ""
+                draft_id = row[5] or ""
+                live_id = row[6] or ""
+                discogs_id = row[7] or ""
+                sku = str(row[0])
+                if appending and sku in fresh:
+                    continue  # already shown (its sort value changed since it was loaded)
+                values = (row[0], row[1] or "", row[2] or "", price_str, row[4] or "", draft_id, live_id, discogs_id, date_added_str)
+                previous = known.get(sku)
+                if previous is None:
+                    tree.insert("", "end", iid=sku, values=values)
+                elif previous != values:
+                    tree.item(sku, values=values)
+                fresh[sku] = values
+                order.append(sku)
+            if not appending:
+                stale = known.keys() - fresh.keys()
+                if stale:
+                    tree.delete(*stale)
+            if rows:
+                self._inventory_last_key = (rows[-1][13], rows[-1][12])
+            elif not appending:
+                self._inventory_last_key = None
+            self._inventory_row_values = fresh
+            self._inventory_order = order
+            # A refresh reloads this many pages, so count what is actually loaded
+            self.inventory_page = max(page, (len(order) - 1) // page_size)
+            self._inventory_search_term = search_term
+            self._inventory_has_more = len(rows) == limit
+            tree.set_children("", *order)
                     
         except Exception as e:
             logger.error(f"Failed to populate inventory: {e}")
             messagebox.showerror("Database Error", f"Failed to load inventory: {e}")
-    
+
+    @staticmethod
+    def _inventory_filter_sql(search_term):
+        """WHERE clause (without the keyword) and params for the inventory search box."""
+        if not search_term:
+            return "", []
+        # LIKE is case-insensitive for ASCII, matching the old in-memory filter
+        pattern = "%" + search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return ("sku LIKE ? ESCAPE '\\' OR artist LIKE ? ESCAPE '\\' OR title LIKE ? ESCAPE '\\'",
+                [pattern, pattern, pattern])
+
+    @staticmethod
+    def _inventory_keyset_sql(sort_col, direction, last_value, last_id):
+        """Condition for rows after (last_value, last_id) in ORDER BY sort_col, id.
+
+        SQLite sorts NULLs first ascending and last descending, and NULL never
+        compares equal, so NULL sort values get their own branches.
+        """
+        if sort_col == "id":
+            return ("id > ?" if direction == "ASC" else "id < ?"), [last_id]
+        if direction == "ASC":
+            if last_value is None:
+                return f"({sort_col} IS NULL AND id > ?) OR {sort_col} IS NOT NULL", [last_id]
+            return f"{sort_col} > ? OR ({sort_col} = ? AND id > ?)", [last_value, last_value, last_id]
+        if last_value is None:
+            return f"{sort_col} IS NULL AND id < ?", [last_id]
+        return (f"{sort_col} < ? OR ({sort_col} = ? AND id < ?) OR {sort_col} IS NULL",
+                [last_value, last_value, last_id])
+
+    def _patch_inventory_rows(self, skus, column_index, value):
+        """Change one displayed column for the given rows in place (no re-query)."""
+        known = self._inventory_row_values
+        tree = self.inventory_tree
+        for sku in skus:
+            values = known.get(sku)
+            if values is None or values[column_index] == value:
+                continue
+            values = values[:column_index] + (value,) + values[column_index + 1:]
+            known[sku] = values
+            tree.item(sku, values=values)
+
+    def _upsert_inventory_row(self, sku, record):
+        """Show one saved record in the tree without re-querying.
+
+        Falls back to a full refresh when the row's position can't be known
+        locally (active search, or a sort on a column the save may change).
+        """
+        known = self._inventory_row_values
+        previous = known.get(sku)
+        sort_col = self.inventory_sort_column
+        price = record.get("price")
+        price_str = f"£{price:.2f}" if price else ""
+        if previous is not None:
+            if sort_col in ("Artist", "Title", "Price"):
+                self.populate_inventory_view()
+                return
+            # A lister save leaves status and marketplace IDs untouched
+            values = (previous[0], record.get("artist") or "", record.get("title") or "", price_str) + previous[4:]
+            if values != previous:
+                known[sku] = values
+                self.inventory_tree.item(sku, values=values)
+            return
+        date_added = record.get("date_added")
+        if not date_added:
+            return  # an update to a row outside the loaded pages
+        newest_first = self.inventory_sort_direction == "DESC"
+        if self._inventory_search_term or sort_col not in ("id", "Date Added") or (
+                not newest_first and self._inventory_has_more):
+            self.populate_inventory_view()
+            return
+        values = (sku, record.get("artist") or "", record.get("title") or "", price_str,
+                  record.get("status") or "", "", "", "",
+                  _format_inventory_date(date_added) if date_added else "")
+        known[sku] = values
+        if newest_first:
+            self._inventory_order.insert(0, sku)
+            self.inventory_tree.insert("", 0, iid=sku, values=values)
+        else:
+            self._inventory_order.append(sku)
+            self.inventory_tree.insert("", "end", iid=sku, values=values)
+
+    def _inventory_skus(self, items):
+        """SKUs for inventory tree rows; rows are inserted with iid=sku, so no per-row item() lookup."""
+        return [str(iid) for iid in items]
+
+    def _remove_inventory_rows(self, skus):
+        """Drop deleted SKUs from the tree and the cached row state."""
+        known = self._inventory_row_values
+        gone = [sku for sku in skus if known.pop(sku, None) is not None]
+        if gone:
+            gone_set = set(gone)
+            self._inventory_order = [sku for sku in self._inventory_order if sku not in gone_set]
+            self.inventory_tree.delete(*gone)
+
+    def _schedule_inventory_search(self, event=None):
+        """Debounce the search box so the query runs once typing pauses for 200ms."""
+        if self._inventory_search_after_id:
+            self.root.after_cancel(self._inventory_search_after_id)
+        self._inventory_search_after_id = self.root.after(200, self._run_scheduled_inventory_search)
+
+    def _run_scheduled_inventory_search(self):
+        self._inventory_search_after_id = None
+        search_term = self.inventory_search_var.get().strip()
+        if search_term != self._inventory_search_term:
+            self.populate_inventory_view(search_term)
+
+    def _on_inventory_yscroll(self, first, last):
+        """Scrollbar feed for the inventory tree; loads the next page at the bottom."""
+        self._inventory_scrollbar.set(first, last)
+        # An unmapped tree (tab not shown) reports 0..1, so wait until it is on screen
+        if (float(last) >= 1.0 and self._inventory_has_more and not self._inventory_loading_more
+                and self.inventory_tree.winfo_ismapped()):
+            self._inventory_loading_more = True
+            self.root.after_idle(self._load_more_inventory)
+
+    def _load_more_inventory(self):
+        self._inventory_loading_more = False
+        if self._inventory_has_more:
+            self.populate_inventory_view(self._inventory_search_term, page=self.inventory_page + 1)
+    
+    def _sort_by_heading(self, tree_name, col):
+        """Single heading-click dispatcher for the Discogs results and inventory trees."""
+        if tree_name == "discogs":
+            self.sort_discogs_results(col)
+        else:
+            self.sort_inventory(col)
+
     def sort_inventory(self, col):
         """Sort inventory by column"""
         if self.inventory_sort_column == col:
@@ -4143,6 +5099,7 @@ class VinylToolApp:
                  self.entries['condition_notes'].insert('1.0', str(record_data.get('notes') or ''))
 
             self.editing_sku = sku
+            self._loaded_payload = self._serialize_form_to_payload()
             self.sku_display_var.set(sku)
             self.save_button.config(text="Update Inventory")
             
@@ -4169,22 +5126,23 @@ class VinylToolApp:
             messagebox.showwarning("No Selection", "Please select one or more items to delete.")
             return
 
-        item_details = []
-        for item_id in selected_items:
-            values = self.inventory_tree.item(item_id, "values")
-            sku = values[0]
-            record = self._get_inventory_record(sku)
-            item_details.append({"sku": sku, "discogs_listing_id": record.get("discogs_listing_id")})
+        skus = self._inventory_skus(selected_items)
+        records = self._get_inventory_rows(skus)
+        item_details = [
+            {"sku": sku, "discogs_listing_id": records.get(sku, _EMPTY).get("discogs_listing_id")}
+            for sku in skus
+        ]
 
         msg = f"Are you sure you want to delete {len(item_details)} item(s)?\n\nThis will also attempt to delete their corresponding Discogs listings."
         if not messagebox.askyesno("Confirm Delete", msg):
             return
         
-        self.root.config(cursor="watch")
-        self.root.update()
+        self._busy(True)
 
         def delete_worker():
             success_count, fail_count = 0, 0
+            to_delete = []
+            deleted = []
             for item in item_details:
                 sku, discogs_listing_id = item["sku"], item["discogs_listing_id"]
                 if discogs_listing_id and self.discogs_api.is_connected():
@@ -4194,21 +5152,29 @@ class VinylToolApp:
                         if not messagebox.askyesno("Discogs Deletion Failed", f"Failed to delete Discogs listing for SKU {sku}.\n\nDo you still want to delete the item from your local inventory?"):
                             fail_count += 1
                             continue
+                to_delete.append(sku)
+            # Remove every confirmed SKU from the local DB in one transaction
+            if to_delete:
                 try:
                     with self.db.get_connection() as conn:
-                        conn.cursor().execute("DELETE FROM inventory WHERE sku = ?", (sku,))
-                    self.append_log(f"✓ Deleted SKU {sku} from local inventory.", "green")
-                    success_count += 1
+                        conn.executemany("DELETE FROM inventory WHERE sku = ?", [(sku,) for sku in to_delete])
+                    for sku in to_delete:
+                        self.append_log(f"✓ Deleted SKU {sku} from local inventory.", "green")
+                    success_count += len(to_delete)
+                    deleted = to_delete
                 except Exception as e:
-                    self.append_log(f"✗ Failed to delete SKU {sku} from local DB: {e}", "red")
-                    fail_count += 1
-            self.safe_after(0, lambda: (self.root.config(cursor=""), self.populate_inventory_view(), messagebox.showinfo("Deletion Complete", f"Successfully deleted: {success_count}\nFailed or skipped: {fail_count}")))
+                    self.append_log(f"✗ Failed to delete {len(to_delete)} SKU(s) from local DB: {e}", "red")
+                    fail_count += len(to_delete)
+            self.safe_after(0, lambda: (self._busy(False), self._remove_inventory_rows(deleted), messagebox.showinfo("Deletion Complete", f"Successfully deleted: {success_count}\nFailed or skipped: {fail_count}")))
         threading.Thread(target=delete_worker, daemon=True).start()
 
     def select_all_inventory(self):
         """Select all items in inventory"""
-        for item in self.inventory_tree.get_children():
-            self.inventory_tree.selection_add(item)
+        # Bulk actions work on the tree selection, so first load every row the
+        # current search matches, not just the pages scrolled into view
+        if self._inventory_has_more:
+            self.populate_inventory_view(self._inventory_search_term, page=self.inventory_page + 1, rest=True)
+        self.inventory_tree.selection_set(self.inventory_tree.get_children())
     
     def deselect_all_inventory(self):
         """Deselect all items in inventory"""
@@ -4221,14 +5187,21 @@ class VinylToolApp:
         if not selected:
             messagebox.showwarning("No Selection", "Please select items to update")
             return
-        skus = [self.inventory_tree.item(item, "values")[0] for item in selected]
+        skus = self._inventory_skus(selected)
         try:
+            now_iso = datetime.datetime.now(_UTC).isoformat()
             with self.db.get_connection() as conn:
-                placeholders = ",".join("?" * len(skus))
-                sql = f"UPDATE inventory SET status = ?, last_modified = ? WHERE sku IN ({placeholders})"
-                params = [new_status, datetime.datetime.now(datetime.timezone.utc).isoformat()] + skus
-                conn.cursor().execute(sql, params)
-            self.populate_inventory_view()
+                # One prepared statement for any selection size (an IN list can exceed SQLite's variable limit)
+                conn.executemany(
+                    _UPDATE_INVENTORY_STATUS_SQL,
+                    [(new_status, now_iso, sku) for sku in skus],
+                )
+            if self.inventory_sort_column == "Status":
+                # Row order depends on the new value, so let the view re-sort
+                self.populate_inventory_view(self.inventory_search_var.get())
+            else:
+                self._patch_inventory_rows(skus, 4, new_status)
+            self._note_inventory_change()
             self.append_log(f"Updated {len(skus)} item(s) to '{new_status}'", "green")
         except Exception as e:
             logger.error(f"Failed to update status: {e}")
@@ -4291,21 +5264,41 @@ class VinylToolApp:
         self.notebook.select(self.inventory_tab)  # Switch to see logs
 
     
-        def publish_worker():
-    
-            for item in selected:
+        skus = self._inventory_skus(selected)
+
+        def publish_worker(skus):
     
-                sku = self.inventory_tree.item(item, "values")[0]
+            records = self._get_inventory_records(skus)
+            jobs = []  # (sku, listing_data) that passed the checks, sent to eBay after the loop
+            id_updates = []  # (offer_id, sku), written in one transaction after the calls
+            # Per-run invariants: policies, location and lookups are the same for every SKU
+            base_listing = {
+                "quantity": 1,
+                "marketplaceId": self.config.get("marketplace_id", "EBAY_GB"),
+                "paymentPolicyId": self.config.get("ebay_payment_policy_id"),
+                "returnPolicyId": self.config.get("ebay_return_policy_id"),
+                "shippingPolicyId": self.config.get("ebay_shipping_policy_id"),
+                "currency": "GBP",
+            }
+            _pc = (self.config.get('postal_code', '') or '').strip()
+            _cc = (self.config.get('country', 'GB') or 'GB').strip()
+            _city = self.config.get('city', 'Kidderminster')
+            # Merchant Location (if exists); two eBay round trips, so checked once per run
+            try:
+                _mlk = self._ensure_ebay_location() if records else None
+            except Exception:
+                _mlk = None
+            if _mlk and not getattr(self, '_inventory_location_exists', lambda x: False)(_mlk):
+                _mlk = None
+            vinyl_category = EBAY_VINYL_CATEGORIES.get
+            for sku in skus:
     
                 self.append_log(f"SKU {sku}: Starting publish process for eBay...", "black")
 
     
                 try:
-    
-                    record = self._get_inventory_record(sku)
-    
+                    record = records.get(sku)
                     if not record:
-    
                         self.append_log(f"SKU {sku}: Could not find record.", "red")
     
                         continue
@@ -4325,9 +5318,9 @@ class VinylToolApp:
     
                             try:
     
-                                ldt = datetime.datetime.fromisoformat(str(local_ts).replace('Z','+00:00'))
+                                ldt = _parse_iso_ts(local_ts)
     
-                                rdt = datetime.datetime.fromisoformat(str(remote_ts).replace('Z','+00:00'))
+                                rdt = _parse_iso_ts(remote_ts)
     
                                 if rdt > ldt:
     
@@ -4366,7 +5359,7 @@ class VinylToolApp:
     
                             record = dict(record)
     
-                            record["categoryId"] = EBAY_VINYL_CATEGORIES.get(fmt, "176985")
+                            record["categoryId"] = vinyl_category(fmt, "176985")
     
                     except Exception:
     
@@ -4388,25 +5381,13 @@ class VinylToolApp:
     
                     media_cond_str = record.get("media_condition", "")
     
-                    condition_enum = EBAY_INVENTORY_CONDITION_MAP.get(media_cond_str, "USED_GOOD")
-    
-                    condition_id_numeric = EBAY_CONDITION_MAP_NUMERIC.get(media_cond_str, "3000")
-    
-                    category_id = EBAY_VINYL_CATEGORIES.get(format_val, "176985")
-
-    
+                    condition_enum, condition_id_numeric, category_id = _ebay_condition_category(media_cond_str, format_val)
                     listing_data = {
-    
+                        **base_listing,
                         "sku": sku,
-    
-                        "title": record.get("listing_title") or record.get("title", "")[:80],
-    
+                        "title": record.get("listing_title") or (record.get("title") or "")[:80],
                         "description": record.get("description", ""),
-    
                         "price": record.get("price", 0),
-    
-                        "quantity": 1,
-    
                         "categoryId": category_id,
     
                         "condition_enum": condition_enum,
@@ -4418,29 +5399,8 @@ class VinylToolApp:
                         "sleeve_condition": record.get("sleeve_condition"),
     
                         "images": record.get("images", []),
-    
-                        "marketplaceId": self.config.get("marketplace_id", "EBAY_GB"),
-    
-                        "paymentPolicyId": self.config.get("ebay_payment_policy_id"),
-    
-                        "returnPolicyId": self.config.get("ebay_return_policy_id"),
-    
-                        "shippingPolicyId": self.config.get("ebay_shipping_policy_id"),
-    
-                        "currency": "GBP",
-    
                     }
-
-    
                     # Location fields (Sell Inventory + Trading fallbacks)
-    
-                    _pc = (self.config.get('postal_code', '') or '').strip()
-    
-                    _cc = (self.config.get('country', 'GB') or 'GB').strip()
-    
-                    _city = self.config.get('city', 'Kidderminster')
-
-    
                     # Sell Inventory shape
     
                     listing_data['itemLocation'] = {'countryCode': _cc, 'postalCode': _pc, 'city': _city}
@@ -4465,23 +5425,8 @@ class VinylToolApp:
                     listing_data['Location'] = _city
 
     
-                    # Merchant Location (if exists)
-    
-                    try:
-    
-                        _mlk = self._ensure_ebay_location()
-    
-                    except Exception:
-    
-                        _mlk = None
-    
-                    if _mlk and getattr(self, '_inventory_location_exists', lambda x: False)(_mlk):
-    
+                    if _mlk:
                         listing_data['merchantLocationKey'] = _mlk
-    
-                    else:
-    
-                        listing_data.pop('merchantLocationKey', None)
 
     
                     # Explicit Trading-style Item block for bridges expecting Item.*
@@ -4497,47 +5442,7 @@ class VinylToolApp:
                     }
 
     
-                    # Create/Update offer and publish (wrapper handles publish)
-    
-                    result = self.ebay_api.create_draft_listing(listing_data)
-    
-                    if result.get("success"):
-    
-                        offer_id = result.get('offerId')
-    
-                        self.append_log(f"SKU {sku}: Successfully created eBay draft (Offer ID: {offer_id})", "green")
-                        try:
-                            # Resolve live listingId and save it (same as Lister flow)
-                            self.safe_after(0, lambda sku=sku, oid=offer_id: self._handle_ebay_listing_success(sku, oid))
-                        except Exception:
-                            pass
-    
-                        try:
-    
-                            now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-    
-                            with self.db.get_connection() as conn:
-    
-                                cursor = conn.cursor()
-    
-                                cursor.execute(
-    
-                                    "UPDATE inventory SET ebay_listing_id = ?, ebay_updated_at = ? WHERE sku = ?",
-    
-                                    (offer_id, now_iso, sku),
-    
-                                )
-    
-                        except Exception as e:
-    
-                            logger.error(f"Failed to update inventory with eBay listing ID: {e}")
-    
-                            self.append_log(f"SKU {sku}: Failed to save eBay Offer ID to local DB: {e}", "red")
-    
-                    else:
-    
-                        self.append_log(f"SKU {sku}: eBay listing failed: {result.get('error')}", "red")
-
+                    jobs.append((sku, listing_data))
     
                 except Exception as e:
     
@@ -4545,30 +5450,96 @@ class VinylToolApp:
     
                     logger.error(f"Error publishing SKU {sku} to eBay", exc_info=True)
 
-    
+            # Fetch the token once before fanning out (as _upload_images does): an expired
+            # token would otherwise be refreshed, or prompted for, by every worker at once
+            if jobs and not self.ebay_api.get_access_token():
+                self.append_log(f"eBay authentication failed; {len(jobs)} SKU(s) not published.", "red")
+                jobs = []
+            # Inventory items go up in bulk (25 per request); only SKUs whose item
+            # was accepted continue to the offer step
+            if jobs:
+                results = self.save_many_to_ebay([data for _, data in jobs])
+                created = {r.get("sku") for r in results if r.get("success")}
+                jobs = [(sku, data) for sku, data in jobs if sku in created]
+            # Create/Update offer and publish (wrapper handles publish). The calls are
+            # mostly HTTPS wait, so a few run at once (config ebay_concurrency)
+            if jobs:
+                try:
+                    concurrency = max(1, int(self.config.get("ebay_concurrency", 6) or 6))
+                except (TypeError, ValueError):
+                    concurrency = 6
+                with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs)), thread_name_prefix="ebay-publish") as pool:
+                    futures = {pool.submit(self.ebay_api.create_draft_listing, data, inventory_item_done=True): sku
+                               for sku, data in jobs}
+                    for future in as_completed(futures):
+                        sku = futures[future]
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            self.append_log(f"SKU {sku}: An unexpected error occurred: {e}", "red")
+                            logger.error(f"Error publishing SKU {sku} to eBay", exc_info=True)
+                            continue
+                        if result.get("success"):
+                            offer_id = result.get('offerId')
+                            self.append_log(f"SKU {sku}: Successfully created eBay draft (Offer ID: {offer_id})", "green")
+                            id_updates.append((offer_id, sku))
+                        else:
+                            self.append_log(f"SKU {sku}: eBay listing failed: {result.get('error')}", "red")
+            if id_updates:
+                now_iso = datetime.datetime.now(_UTC).isoformat()
+                rows = [(offer_id, now_iso, sku) for offer_id, sku in id_updates]
+                try:
+                    self._db_write(lambda conn: conn.executemany(
+                        _SET_EBAY_LISTING_ID_SQL, rows)).result()
+                except Exception as e:
+                    self.append_log(f"Failed to save {len(id_updates)} eBay Offer ID(s) to local DB: {e}", "red")
+                # Resolve live listingIds and save them (same as Lister flow); queued after the
+                # batch so the resolved Item ID replaces the Offer ID, not the other way round
+                for offer_id, sku in id_updates:
+                    self.safe_after(0, lambda sku=sku, oid=offer_id: self._handle_ebay_listing_success(sku, oid))
             self.safe_after(0, self.populate_inventory_view)
     
-            self.safe_after(0, lambda: self.root.config(cursor=""))
+            self.safe_after(0, lambda: self._busy(False))
 
     
-        self.root.config(cursor="watch")
+        self._busy(True)
     
-        self.root.update()
     
-        threading.Thread(target=publish_worker, daemon=True).start()
+        threading.Thread(target=publish_worker, args=(skus,), daemon=True).start()
     
     def append_log(self, message, color="black"):
-        """Append message to publish log"""
-        def do_append():
-            timestamp = datetime.datetime.now().strftime("[%H:%M:%S]")
-            self.publish_log.config(state="normal")
-            self.publish_log.insert("end", f"{timestamp} {message}\n", (color,))
-            self.publish_log.tag_configure("red", foreground="red")
-            self.publish_log.tag_configure("green", foreground="green")
-            self.publish_log.tag_configure("black", foreground="black")
-            self.publish_log.see("end")
-            self.publish_log.config(state="disabled")
-        self.safe_after(0, do_append)
+        """Append message to publish log (callable from any thread).
+
+        Lines queued before the Tk loop gets to them are written in one flush.
+        """
+        self._log_pending.append((message, color))
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.safe_after(0, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        pending = self._log_pending
+        if not pending:
+            return
+        timestamp = _log_timestamp()
+        log = self.publish_log
+        log.config(state="normal")
+        while pending:
+            message, color = pending.popleft()
+            self._append_log_line(log, f"{timestamp} {message}\n", (color,))
+        log.see("end")
+        log.config(state="disabled")
+
+    # Log Text widgets keep at most this many lines; older lines are dropped in bulk
+    _LOG_MAX_LINES = 5000
+
+    def _append_log_line(self, widget, line, tags=()):
+        """Insert a line into a log Text widget, trimming the oldest lines past _LOG_MAX_LINES."""
+        widget.insert("end", line, tags)
+        line_count = int(widget.index("end-1c").split(".")[0])
+        if line_count > self._LOG_MAX_LINES:
+            widget.delete("1.0", f"{line_count - self._LOG_MAX_LINES + 1}.0")
 
     def show_inventory_context_menu(self, event):
         """Show inventory context menu"""
@@ -4592,7 +5563,7 @@ class VinylToolApp:
         if not selected: return
         sku = self.inventory_tree.item(selected, "values")[0]
         try:
-            record = self._get_inventory_record(sku)
+            record = self._get_inventory_record(sku, include_payload=False)
             if record.get("discogs_listing_id"):
                 webbrowser.open_new_tab(f"https://www.discogs.com/sell/item/{record['discogs_listing_id']}")
             else:
@@ -4606,7 +5577,7 @@ class VinylToolApp:
         if not selected: return
         sku = self.inventory_tree.item(selected, "values")[0]
         try:
-            record = self._get_inventory_record(sku)
+            record = self._get_inventory_record(sku, include_payload=False)
             if record.get("ebay_listing_id"):
                 webbrowser.open_new_tab(f"https://www.ebay.co.uk/itm/{record['ebay_listing_id']}")
             else:
@@ -4649,8 +5620,7 @@ class VinylToolApp:
         selected = self.discogs_tree.focus()
         if not selected: return
         release_id = int(self.discogs_tree.item(selected, "values")[0])
-        self.root.config(cursor="watch")
-        self.root.update()
+        self._busy(True)
         def fetch_worker():
             try:
                 suggestions = self.discogs_api.get_price_suggestions(release_id)
@@ -4662,18 +5632,34 @@ class VinylToolApp:
             except Exception as e:
                 self.safe_after(0, lambda err=e: messagebox.showerror("Error", str(err)))
             finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
-        threading.Thread(target=fetch_worker, daemon=True).start()
+                self.safe_after(0, lambda: self._busy(False))
+        self._api_pool.submit(fetch_worker)
     
+    def _schedule_discogs_filter(self, event=None):
+        """Debounce the results filter so only the last keystroke within 150ms refilters."""
+        if self._discogs_filter_after_id:
+            self.root.after_cancel(self._discogs_filter_after_id)
+        self._discogs_filter_after_id = self.root.after(150, self._run_scheduled_discogs_filter)
+
+    def _run_scheduled_discogs_filter(self):
+        self._discogs_filter_after_id = None
+        self.refresh_discogs_view()
+
     def refresh_discogs_view(self, event=None):
         """Refresh Discogs results with filter"""
         filter_text = self.discogs_search_filter_var.get().lower()
         if not self.discogs_search_results: return
-        for item in self.discogs_tree.get_children(): self.discogs_tree.delete(item)
+        # Rows stay in the tree; hide non-matches and reorder the rest in one set_children call
+        iids = self._discogs_result_iids
+        blobs = self._discogs_result_blobs
+        visible = []
         for result in self.discogs_search_results:
-            artist, title = (result.get("title", "").split(" - ", 1) + [""])[:2]
-            if filter_text and filter_text not in f"{artist} {title} {result.get('catno', '')} {result.get('year', '')}".lower(): continue
-            values = (result.get("id"), artist, title, result.get("catno", "N/A"), result.get("year", "N/A"), result.get("country", "N/A"), ", ".join(result.get("format", [])))
+            key = id(result)
+            iid = iids.get(key)
+            if iid is None: continue
+            if filter_text and filter_text not in blobs[key]: continue
+            visible.append(iid)
+        self.discogs_tree.set_children("", *visible)
 
     def sort_discogs_results(self, col):
         """Sort Discogs results by column"""
@@ -4682,13 +5668,13 @@ class VinylToolApp:
         else:
             self.discogs_sort_column, self.discogs_sort_direction = col, "ASC"
         if self.discogs_search_results:
-            def sort_key(item):
-                if col == "Artist": return (item.get("title", "").split(" - ", 1) + [""])[0].lower()
-                elif col == "Title": return (item.get("title", "").split(" - ", 1) + [""])[1].lower()
-                elif col == "Year":
-                    try: return int(item.get("year", 0))
-                    except: return 0
-                else: return str(item.get(col.lower(), "")).lower()
+            # Artist/Title/Year keys were computed once when the rows were inserted
+            field = {"Artist": 0, "Title": 1, "Year": 2}.get(col)
+            if field is None:
+                def sort_key(item): return str(item.get(col.lower(), "")).lower()
+            else:
+                keys = self._discogs_sort_keys
+                def sort_key(item): return keys.get(id(item), ("", "", 0))[field]
             self.discogs_search_results.sort(key=sort_key, reverse=(self.discogs_sort_direction == "DESC"))
             self.refresh_discogs_view()
     
@@ -4729,7 +5715,7 @@ class VinylToolApp:
     def check_discogs_sales(self):
         """Check for Discogs sales"""
         if not self.discogs_api.is_connected(): return
-        self.root.config(cursor="watch"); self.root.update()
+        self._busy(True)
         def sales_worker():
             try:
                 orders = self.discogs_api.get_orders(['Payment Received', 'Shipped'])
@@ -4737,23 +5723,42 @@ class VinylToolApp:
             except Exception as e:
                 self.safe_after(0, lambda err=e: messagebox.showerror("Error", str(err)))
             finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
-        threading.Thread(target=sales_worker, daemon=True).start()
-    
+                self.safe_after(0, lambda: self._busy(False))
+        self._api_pool.submit(sales_worker)
+    
+    def _fill_tree(self, tree, rows):
+        """Replace all rows of a Treeview: one delete, then the inserts with the scrollbar detached."""
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        if not rows:
+            return
+        scroll_cmd = tree.cget("yscrollcommand")
+        tree.configure(yscrollcommand="")
+        try:
+            insert = tree.insert
+            for values in rows:
+                insert("", "end", values=values)
+        finally:
+            tree.configure(yscrollcommand=scroll_cmd)
+
     def _display_discogs_sales(self, orders):
         """Display Discogs sales"""
-        for item in self.sales_tree.get_children(): self.sales_tree.delete(item)
         if not orders:
+            self._fill_tree(self.sales_tree, ())
             messagebox.showinfo("No Sales", "No sales with status 'Payment Received' or 'Shipped' found.")
             return
+        rows = []
         for order in orders:
+            # "YYYY-MM-DD..." -> "DD-MM-YYYY" by slicing; no strptime/strftime round trip
+            created = order.data['created']
+            sale_date = f"{created[8:10]}-{created[5:7]}-{created[:4]}"
             for item in order.items:
                 artist = item.release.artists[0].name if item.release.artists else "Various"
                 title = item.release.title.replace(f"{artist} - ", "", 1).strip()
-                sale_date = datetime.datetime.strptime(order.data['created'][:10], "%Y-%m-%d").strftime("%d-%m-%Y")
                 sale_price = f"{item.price.value} {item.price.currency}"
-                values = (order.id, sale_date, order.buyer.username, artist, title, sale_price, item.release.id)
-                self.sales_tree.insert("", "end", values=values)
+                rows.append((order.id, sale_date, order.buyer.username, artist, title, sale_price, item.release.id))
+        self._fill_tree(self.sales_tree, rows)
     
     def sync_discogs_sale(self):
         """Sync selected Discogs sale to inventory"""
@@ -4761,17 +5766,19 @@ class VinylToolApp:
         if not selected: return
         release_id = self.sales_tree.item(selected, "values")[6]
         try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT sku FROM inventory WHERE discogs_release_id = ? AND status = 'For Sale'", (release_id,))
-                record = cursor.fetchone()
-                if record:
-                    sku = record[0]
-                    if messagebox.askyesno("Confirm Sync", f"Found matching item (SKU: {sku}). Mark as 'Sold'?"):
-                        self.update_inventory_status("Sold")
-                        messagebox.showinfo("Success", f"SKU {sku} marked as Sold.")
-                else:
-                    messagebox.showwarning("No Match", f"Could not find an unsold item with Release ID: {release_id}.")
+            # Look up on the read connection and leave it before asking: update_inventory_status
+            # opens its own write transaction, and no lock should be held while the dialog waits
+            with self.db.read_connection() as conn:
+                record = conn.execute(
+                    "SELECT sku FROM inventory WHERE discogs_release_id = ? AND status = 'For Sale'", (release_id,)
+                ).fetchone()
+            if record:
+                sku = record[0]
+                if messagebox.askyesno("Confirm Sync", f"Found matching item (SKU: {sku}). Mark as 'Sold'?"):
+                    self.update_inventory_status("Sold")
+                    messagebox.showinfo("Success", f"SKU {sku} marked as Sold.")
+            else:
+                messagebox.showwarning("No Match", f"Could not find an unsold item with Release ID: {release_id}.")
         except Exception as e:
             logger.error(f"Failed to sync sale: {e}")
             messagebox.showerror("Database Error", f"Could not sync sale: {e}")
@@ -4788,7 +5795,7 @@ class VinylToolApp:
         except ValueError:
             messagebox.showerror("Date Format Error", "Please enter dates in DD-MM-YYYY format.")
             return
-        self.root.config(cursor="watch"); self.root.update()
+        self._busy(True)
         def sales_worker():
             try:
                 orders = self.ebay_api.get_orders(start_date, end_date)
@@ -4796,15 +5803,16 @@ class VinylToolApp:
             except Exception as e:
                 self.safe_after(0, lambda err=e: messagebox.showerror("Error", str(err)))
             finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
-        threading.Thread(target=sales_worker, daemon=True).start()
+                self.safe_after(0, lambda: self._busy(False))
+        self._api_pool.submit(sales_worker)
     
     def _display_ebay_sales(self, orders):
         """Display eBay sales"""
-        for item in self.ebay_sales_tree.get_children(): self.ebay_sales_tree.delete(item)
         if not orders:
+            self._fill_tree(self.ebay_sales_tree, ())
             messagebox.showinfo("No eBay Sales", "No completed sales found in the specified date range.")
             return
+        rows = []
         for order in orders:
             order_id, created_date, buyer = order.get("orderId"), order.get("creationDate", "")[:10], order.get("buyer", {}).get("username", "")
             for line_item in order.get("lineItems", []):
@@ -4813,8 +5821,8 @@ class VinylToolApp:
                 if ":" in title:
                     parts = title.split(":", 1)
                     artist, album_title = parts[0].strip(), parts[1].strip()
-                values = (order_id, created_date, buyer, artist, album_title, f"{price} {currency}", item_id)
-                self.ebay_sales_tree.insert("", "end", values=values)
+                rows.append((order_id, created_date, buyer, artist, album_title, f"{price} {currency}", item_id))
+        self._fill_tree(self.ebay_sales_tree, rows)
     
     def sync_ebay_sale(self):
         """Sync selected eBay sale to inventory"""
@@ -4822,17 +5830,25 @@ class VinylToolApp:
         if not selected: return
         _, _, _, artist, title, _, item_id = self.ebay_sales_tree.item(selected, "values")
         try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT sku FROM inventory WHERE (ebay_listing_id = ? OR (artist LIKE ? AND title LIKE ?)) AND status = 'For Sale'", (item_id, f"%{artist}%", f"%{title}%"))
-                record = cursor.fetchone()
-                if record:
-                    sku = record[0]
-                    if messagebox.askyesno("Confirm Sync", f"Found matching item (SKU: {sku}). Mark as 'Sold'?"):
-                        self.update_inventory_status("Sold")
-                        messagebox.showinfo("Success", f"SKU {sku} marked as Sold.")
-                else:
-                    messagebox.showwarning("No Match", f"Could not find an unsold item matching:\n{artist} - {title}")
+            # Exact listing-id match first (idx_inv_ebay_listing); the artist/title LIKE
+            # fallback only runs when that misses. A read connection is enough, and it
+            # holds no write lock while the dialogs below wait on the user.
+            with self.db.read_connection() as conn:
+                record = conn.execute(
+                    "SELECT sku FROM inventory WHERE ebay_listing_id = ? AND status = 'For Sale'", (item_id,)
+                ).fetchone() if item_id else None
+                if record is None:
+                    record = conn.execute(
+                        "SELECT sku FROM inventory WHERE status = 'For Sale' AND artist LIKE ? AND title LIKE ?",
+                        (f"%{artist}%", f"%{title}%"),
+                    ).fetchone()
+            if record:
+                sku = record[0]
+                if messagebox.askyesno("Confirm Sync", f"Found matching item (SKU: {sku}). Mark as 'Sold'?"):
+                    self.update_inventory_status("Sold")
+                    messagebox.showinfo("Success", f"SKU {sku} marked as Sold.")
+            else:
+                messagebox.showwarning("No Match", f"Could not find an unsold item matching:\n{artist} - {title}")
         except Exception as e:
             logger.error(f"Failed to sync sale: {e}")
             messagebox.showerror("Database Error", f"Could not sync sale: {e}")
@@ -4841,7 +5857,7 @@ class VinylToolApp:
         """Import inventory from Discogs"""
         if not self.discogs_api.is_connected(): return
         if not messagebox.askyesno("Confirm Import", "This will import all 'For Sale' items from Discogs.\nExisting items will be skipped.\n\nContinue?"): return
-        self.root.config(cursor="watch"); self.root.update()
+        self._busy(True)
         def import_worker():
             try:
                 inventory = self.discogs_api.get_inventory()
@@ -4849,38 +5865,71 @@ class VinylToolApp:
             except Exception as e:
                 self.safe_after(0, lambda err=e: messagebox.showerror("Import Error", str(err)))
             finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
-        threading.Thread(target=import_worker, daemon=True).start()
+                self.safe_after(0, lambda: self._busy(False))
+        self._api_pool.submit(import_worker)
     
     def _process_discogs_import(self, inventory):
         """Process Discogs import"""
-        new_items, skipped_items = 0, 0
+        new_items, skipped_items, conflicts = 0, 0, 0
+        # One timestamp (and SKU stamp) for the whole import batch
+        now_dt = datetime.datetime.now()
+        now = now_dt.astimezone(_UTC).isoformat()
+        sku_stamp = now_dt.strftime("%Y%m%d-%H%M%S")
         try:
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                for listing in inventory:
-                    if listing.status != 'For Sale': continue
-                    cursor.execute("SELECT COUNT(*) FROM inventory WHERE discogs_listing_id = ?", (listing.id,))
-                    if cursor.fetchone()[0] > 0:
-                        skipped_items += 1
-                        continue
-                    new_items += 1
-                    artist = listing.release.artists[0].name if listing.release.artists else "Various"
-                    title = listing.release.title.replace(f"{artist} - ", "", 1).strip()
-                    sku = datetime.datetime.now().strftime(f"%Y%m%d-%H%M%S-{new_items}")
-                    now = datetime.datetime.now(datetime.timezone.utc).isoformat()
-                    sql = """INSERT INTO inventory (sku, artist, title, cat_no, media_condition, sleeve_condition, price, status, discogs_release_id, discogs_listing_id, date_added, last_modified) 
-                             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
-                    media_cond = DISCOGS_GRADE_MAP.get(listing.condition, listing.condition)
-                    sleeve_cond = DISCOGS_GRADE_MAP.get(listing.sleeve_condition, listing.sleeve_condition)
-                    catno = getattr(listing.release, 'catno', '')
-                    cursor.execute(sql, (sku, artist, title, catno, media_cond, sleeve_cond, listing.price.value, "For Sale", listing.release.id, listing.id, now, now))
-            messagebox.showinfo("Import Complete", f"Successfully imported {new_items} new item(s).\nSkipped {skipped_items} existing item(s).")
+            # Existence is checked against one prefetched id set before listing.release is
+            # touched (each access builds a lazy Release whose artists cost a Discogs GET),
+            # and the rows are built before the write transaction opens
+            with self.db.read_connection() as conn:
+                existing = {row[0] for row in conn.execute(
+                    "SELECT discogs_listing_id FROM inventory WHERE discogs_listing_id IS NOT NULL")}
+            rows = []
+            for listing in inventory:
+                if listing.status != 'For Sale': continue
+                if listing.id in existing:
+                    skipped_items += 1
+                    continue
+                existing.add(listing.id)
+                release = listing.release
+                artist = release.artists[0].name if release.artists else "Various"
+                title = release.title.replace(f"{artist} - ", "", 1).strip()
+                sku = f"{sku_stamp}-{len(rows) + 1}"
+                media_cond = DISCOGS_GRADE_MAP.get(listing.condition, listing.condition)
+                sleeve_cond = DISCOGS_GRADE_MAP.get(listing.sleeve_condition, listing.sleeve_condition)
+                catno = getattr(release, 'catno', '')
+                rows.append((sku, artist, title, catno, media_cond, sleeve_cond, listing.price.value, "For Sale", release.id, listing.id, now, now))
+            if rows:
+                # INSERT OR IGNORE is only a backstop here; anything it drops collided on
+                # SKU or listing id and is reported apart from the already-imported skips
+                with self.db.get_connection() as conn:
+                    before = conn.total_changes
+                    conn.executemany(_IMPORT_DISCOGS_LISTING_SQL, rows)
+                    new_items = conn.total_changes - before
+                conflicts = len(rows) - new_items
+                if conflicts:
+                    logger.warning(f"Discogs import: {conflicts} row(s) not inserted due to SKU/listing ID conflicts")
+            summary = f"Successfully imported {new_items} new item(s).\nSkipped {skipped_items} existing item(s)."
+            if conflicts:
+                summary += f"\n{conflicts} item(s) not imported (conflicting SKU or listing ID)."
+            messagebox.showinfo("Import Complete", summary)
             self.populate_inventory_view()
         except Exception as e:
             logger.error(f"Import failed: {e}")
             messagebox.showerror("Import Error", f"An error occurred during import:\n{e}")
     
+    def _save_config_later(self, updates):
+        """Apply config updates now and write config.json once changes pause for 500ms (Tk thread)."""
+        self.config.data.update(updates)
+        if self._config_save_after_id:
+            self.root.after_cancel(self._config_save_after_id)
+        self._config_save_after_id = self.root.after(500, self._flush_config)
+
+    def _flush_config(self):
+        self._config_save_after_id = None
+        try:
+            self.config.save()
+        except Exception:
+            pass  # Config.save logs the failure
+
     def toggle_auto_sync(self):
         """Toggle automatic sync"""
         if not self.discogs_api.is_connected():
@@ -4888,20 +5937,20 @@ class VinylToolApp:
             self.auto_sync_var.set(False)
             return
         self.auto_sync_enabled = self.auto_sync_var.get()
-        self.config.save({"auto_sync_enabled": self.auto_sync_enabled})
+        self._save_config_later({"auto_sync_enabled": self.auto_sync_enabled})
         if self.auto_sync_enabled: self.start_auto_sync()
         else: self.stop_auto_sync()
     
     def toggle_two_way_sync(self):
         """Toggle two-way sync"""
         self.two_way_sync_enabled = self.two_way_sync_var.get()
-        self.config.save({"two_way_sync_enabled": self.two_way_sync_enabled})
+        self._save_config_later({"two_way_sync_enabled": self.two_way_sync_enabled})
         self.log_sync_activity(f"Two-way sync {'enabled' if self.two_way_sync_enabled else 'disabled'}")
     
     def toggle_attempt_updates(self):
         """Toggle attempt to update Discogs"""
         self.attempt_discogs_updates = self.attempt_updates_var.get()
-        self.config.save({"attempt_discogs_updates": self.attempt_discogs_updates})
+        self._save_config_later({"attempt_discogs_updates": self.attempt_discogs_updates})
         self.log_sync_activity(f"Discogs update attempts {'enabled' if self.attempt_discogs_updates else 'disabled'}")
     
     def update_sync_interval(self):
@@ -4909,7 +5958,7 @@ class VinylToolApp:
         try:
             minutes = int(self.sync_interval_var.get())
             self.auto_sync_interval = minutes * 60
-            self.config.save({"auto_sync_interval": self.auto_sync_interval})
+            self._save_config_later({"auto_sync_interval": self.auto_sync_interval})
             self.log_sync_activity(f"Sync interval set to {minutes} minutes")
         except ValueError: self.sync_interval_var.set("5")
     
@@ -4917,6 +5966,7 @@ class VinylToolApp:
         """Start automatic sync"""
         if self.auto_sync_thread and self.auto_sync_thread.is_alive(): return
         self.auto_sync_stop_event.clear()
+        self._sync_trigger_event.clear()
         self.auto_sync_thread = threading.Thread(target=self._auto_sync_worker, daemon=True)
         self.auto_sync_thread.start()
         self.sync_status_var.set("Auto-sync enabled - waiting for next sync...")
@@ -4925,14 +5975,23 @@ class VinylToolApp:
     def stop_auto_sync(self):
         """Stop automatic sync"""
         self.auto_sync_stop_event.set()
+        self._sync_trigger_event.set()  # wake the worker so it sees the stop
         self.sync_status_var.set("Auto-sync disabled")
         self.log_sync_activity("Automatic sync stopped")
     
+    def _note_inventory_change(self):
+        """Wake auto-sync early so a local edit reaches Discogs without waiting out the interval."""
+        if self.auto_sync_enabled:
+            self._sync_trigger_event.set()
+
     def _auto_sync_worker(self):
-        """Auto sync worker thread"""
+        """Auto sync worker thread: runs every interval, or shortly after a local edit"""
         while not self.auto_sync_stop_event.is_set():
             try:
-                if self.auto_sync_stop_event.wait(self.auto_sync_interval): break
+                if self._sync_trigger_event.wait(self.auto_sync_interval):
+                    if self.auto_sync_stop_event.wait(_AUTO_SYNC_SETTLE_SECONDS): break
+                    self._sync_trigger_event.clear()  # edits made during the sync trigger the next one
+                if self.auto_sync_stop_event.is_set(): break
                 if self.auto_sync_enabled and self.discogs_api.is_connected():
                     self.safe_after(0, lambda: self.sync_status_var.set("Syncing inventory..."))
                     sync_result = self._perform_inventory_sync()
@@ -4946,7 +6005,7 @@ class VinylToolApp:
             messagebox.showwarning("Not Connected", "Please connect to your Discogs account first.")
             return
         self.sync_status_var.set("Manual sync in progress...")
-        self.root.config(cursor="watch"); self.root.update()
+        self._busy(True)
         def sync_worker():
             try:
                 result = self._perform_inventory_sync()
@@ -4954,71 +6013,86 @@ class VinylToolApp:
             except Exception as e:
                 self.safe_after(0, lambda err=e: messagebox.showerror("Sync Error", str(err)))
             finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
-        threading.Thread(target=sync_worker, daemon=True).start()
+                self.safe_after(0, lambda: self._busy(False))
+        self._api_pool.submit(sync_worker)
     
     def _perform_inventory_sync(self):
         """Implements true "latest-wins" two-way sync logic."""
-        sync_start_time = datetime.datetime.now(datetime.timezone.utc)
+        sync_start_time = datetime.datetime.now(_UTC)
         self.log_sync_activity("=== STARTING SYNC (Latest-Wins) ===")
         try:
-            discogs_inventory = self.discogs_api.get_inventory()
-            discogs_map = {listing.id: listing for listing in discogs_inventory}
-            self.log_sync_activity(f"Retrieved {len(discogs_inventory)} active listings from Discogs.")
-
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT sku, discogs_listing_id, price, status, notes, last_modified, last_sync_time FROM inventory WHERE discogs_listing_id IS NOT NULL")
-                local_items = [dict(row) for row in cursor.fetchall()]
-                local_map = {item['discogs_listing_id']: item for item in local_items}
+            # Only each listing's status is needed, so pages are reduced to id -> status as they
+            # stream in rather than holding every listing object
+            discogs_map = {listing.id: listing.status for listing in self.discogs_api.iter_inventory()}
+            self.log_sync_activity(f"Retrieved {len(discogs_map)} active listings from Discogs.")
+
+            # Read without the write lock: the loop below makes Discogs calls, and the
+            # writes are applied together in one transaction once it has finished
+            # local_newer (last_modified after the sync watermark) is worked out by SQLite's
+            # julianday(), which reads the stored ISO strings including offsets; it is NULL
+            # when either timestamp is missing or unparseable, and such rows are skipped
+            with self.db.read_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT sku, discogs_listing_id, price, status, notes, last_pushed_hash, "
+                    "julianday(last_modified) > julianday(COALESCE(?, last_sync_time)) AS local_newer "
+                    "FROM inventory WHERE discogs_listing_id IS NOT NULL",
+                    (self.last_successful_sync_time or None,))
+                local_map = {row['discogs_listing_id']: dict(row) for row in cursor}
             self.log_sync_activity(f"Found {len(local_map)} linked local items.")
 
             updates_to_local, updates_to_discogs, deletions_from_local, new_sales = 0, 0, 0, 0
+            sync_iso = sync_start_time.isoformat()
+            pending_local_updates = []  # (status, last_modified, last_sync_time, discogs_listing_id), written after the loop
+            pending_push_marks = []  # (last_pushed_hash, last_sync_time, discogs_listing_id) for rows Discogs already matches
+            map_discogs_status = self.status_mappings.get
             
-            for local_item in local_items:
-                listing_id, last_mod_local_str, last_sync_str = local_item['discogs_listing_id'], local_item.get('last_modified'), self.last_successful_sync_time or local_item.get('last_sync_time')
-                if not last_mod_local_str or not last_sync_str: continue
-                try:
-                    last_mod_local, last_sync = datetime.datetime.fromisoformat(last_mod_local_str), datetime.datetime.fromisoformat(last_sync_str)
-                except (ValueError, TypeError): continue
+            for local_item in local_map.values():
+                listing_id, local_newer = local_item['discogs_listing_id'], local_item['local_newer']
+                if local_newer is None: continue
 
-                if last_mod_local > last_sync and self.attempt_discogs_updates:
+                if local_newer and self.attempt_discogs_updates:
                     if listing_id in discogs_map:
-                        self.log_sync_activity(f"→ Local change detected for SKU {local_item['sku']}. Pushing to Discogs.")
                         update_payload = {"price": local_item['price'], "status": self._map_local_to_discogs_status(local_item['status']), "comments": local_item.get('notes', '')}
+                        # last_modified can move without price/status/notes changing; skip the round-trip
+                        # when Discogs already holds exactly what the last successful push sent
+                        payload_hash = hashlib.sha256(json.dumps(update_payload, sort_keys=True).encode()).digest()[:8]
+                        if payload_hash == local_item['last_pushed_hash']:
+                            pending_push_marks.append((payload_hash, sync_iso, listing_id))
+                            self.log_sync_activity(f"- SKU {local_item['sku']} unchanged since last push. Skipping.")
+                            continue
+                        self.log_sync_activity(f"→ Local change detected for SKU {local_item['sku']}. Pushing to Discogs.")
                         if self.discogs_api.update_listing(listing_id, update_payload):
+                            pending_push_marks.append((payload_hash, sync_iso, listing_id))
                             updates_to_discogs += 1; self.log_sync_activity(f"  ✓ Pushed update for SKU {local_item['sku']} to Discogs.")
                         else: self.log_sync_activity(f"  ✗ Failed to push update for SKU {local_item['sku']}.")
                     else: self.log_sync_activity(f"  - SKU {local_item['sku']} changed locally but no longer on Discogs. Skipping push.")
 
                 elif listing_id in discogs_map:
-                    listing = discogs_map[listing_id]
-                    mapped_status = self.status_mappings.get(listing.status, "Not For Sale")
+                    mapped_status = map_discogs_status(discogs_map[listing_id], "Not For Sale")
                     if mapped_status != local_item['status']:
-                        with self.db.get_connection() as conn:
-                            conn.cursor().execute("UPDATE inventory SET status = ?, last_modified = ? WHERE discogs_listing_id = ?", (mapped_status, sync_start_time.isoformat(), listing_id))
+                        pending_local_updates.append((mapped_status, sync_iso, sync_iso, listing_id))
                         updates_to_local += 1
                         if mapped_status == 'Sold' and local_item['status'] != 'Sold': new_sales += 1
                         self.log_sync_activity(f"✓ Sync from Discogs: SKU {local_item['sku']} '{local_item['status']}' → '{mapped_status}'")
 
-            ids_to_delete_locally = set(local_map.keys()) - set(discogs_map.keys())
-            if ids_to_delete_locally:
+            # Listings gone from Discogs that were still For Sale locally
+            skus_to_delete_locally = [local_map[listing_id]['sku'] for listing_id in local_map.keys() - discogs_map.keys()
+                                      if local_map[listing_id]['status'] == 'For Sale']
+            # The sync watermark is kept once in config (last_successful_sync_time, which the
+            # loop above prefers); only rows this sync changed get a per-row last_sync_time
+            if pending_local_updates or pending_push_marks or skus_to_delete_locally:
                 with self.db.get_connection() as conn:
-                    cursor = conn.cursor()
-                    for listing_id in ids_to_delete_locally:
-                        if local_map[listing_id]['status'] == 'For Sale':
-                            sku = local_map[listing_id]['sku']
-                            cursor.execute("DELETE FROM inventory WHERE discogs_listing_id = ?", (listing_id,))
-                            deletions_from_local += 1
-                            self.log_sync_activity(f"✓ Deleted SKU {sku} locally as it's no longer on Discogs.")
-            
-            with self.db.get_connection() as conn:
-                conn.cursor().execute("UPDATE inventory SET last_sync_time = ? WHERE discogs_listing_id IS NOT NULL", (sync_start_time.isoformat(),))
-            self.last_successful_sync_time = sync_start_time.isoformat()
-            self.config.save({"last_successful_sync_time": self.last_successful_sync_time})
+                    conn.executemany("UPDATE inventory SET status = ?, last_modified = ?, last_sync_time = ? WHERE discogs_listing_id = ?", pending_local_updates)
+                    conn.executemany("UPDATE inventory SET last_pushed_hash = ?, last_sync_time = ? WHERE discogs_listing_id = ?", pending_push_marks)
+                    conn.executemany("DELETE FROM inventory WHERE sku = ?", [(sku,) for sku in skus_to_delete_locally])
+            deletions_from_local = len(skus_to_delete_locally)
+            for sku in skus_to_delete_locally:
+                self.log_sync_activity(f"✓ Deleted SKU {sku} locally as it's no longer on Discogs.")
+            self.last_successful_sync_time = sync_iso
+            self.safe_after(0, lambda ts=sync_iso: self._save_config_later({"last_successful_sync_time": ts}))
             if updates_to_local > 0 or deletions_from_local > 0: self.safe_after(0, self.populate_inventory_view)
             self.log_sync_activity("=== SYNC COMPLETED ===")
-            return {'success': True, 'updates_local': updates_to_local, 'updates_discogs': updates_to_discogs, 'deletions': deletions_from_local, 'new_sales': new_sales, 'total_checked': len(discogs_inventory)}
+            return {'success': True, 'updates_local': updates_to_local, 'updates_discogs': updates_to_discogs, 'deletions': deletions_from_local, 'new_sales': new_sales, 'total_checked': len(discogs_map)}
         except Exception as e:
             logger.error(f"Sync failed: {e}", exc_info=True)
             self.log_sync_activity(f"✗ SYNC ERROR: {e}")
@@ -5026,7 +6100,7 @@ class VinylToolApp:
 
     def _map_local_to_discogs_status(self, local_status):
         """Map local status to valid Discogs status"""
-        return {'For Sale': 'For Sale', 'Sold': 'Sold'}.get(local_status, 'Draft')
+        return _LOCAL_TO_DISCOGS_STATUS.get(local_status, 'Draft')
     
     def _handle_sync_result(self, result):
         """Handle sync result"""
@@ -5134,7 +6208,7 @@ class VinylToolApp:
                 r = requests.get(url, headers=headers, timeout=30)
 
 
-                now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+                now_iso = datetime.datetime.now(_UTC).isoformat()
 
 
     
@@ -5224,7 +6298,7 @@ class VinylToolApp:
                             if stored_id:
 
 
-                                c.execute("UPDATE inventory SET ebay_listing_id = ?, ebay_updated_at = ? WHERE sku = ?", (stored_id, now_iso, sku))
+                                c.execute(_SET_EBAY_LISTING_ID_SQL, (stored_id, now_iso, sku))
 
 
                                 changed = True
@@ -5417,7 +6491,7 @@ class VinylToolApp:
 
 
 
-                with self.db.get_connection() as conn:
+                with self.db.read_connection() as conn:
 
 
 
@@ -5660,7 +6734,7 @@ class VinylToolApp:
 
 
 
-        with self.db.get_connection() as conn:
+        with self.db.read_connection() as conn:
 
 
 
@@ -6744,17 +7818,7 @@ class VinylToolApp:
 
             return
 
-        skus = []
-
-        for iid in items:
-
-            vals = self.inventory_tree.item(iid, "values")
-
-            if not vals:
-
-                continue
-
-            skus.append(vals[0])
+        skus = self._inventory_skus(items)
 
         try:
 
@@ -6828,12 +7892,12 @@ class VinylToolApp:
                     return
 
             # Save to database with special status
-            payload_json = json.dumps(self._serialize_form_to_payload())
+            payload_json = _json_dumps(self._serialize_form_to_payload())
             
             try:
                 with self.db.get_connection() as conn:
                     cursor = conn.cursor()
-                    now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+                    now_iso = datetime.datetime.now(_UTC).isoformat()
                     
                     if self.editing_sku:
                         # Update existing
@@ -6863,14 +7927,16 @@ class VinylToolApp:
                             payload_json
                         ))
                         message = f"Saved SKU {sku} as ready for eBay"
-                    
-                    self.populate_inventory_view()
-                    self.append_log(message, "green")
-                    messagebox.showinfo("eBay Draft Saved", 
-                        f"{message}\n\n" +
-                        f"Note: This creates a local draft in your database.\n" + 
-                        f"eBay doesn't provide draft functionality via their public API.\n" +
-                        f"Use 'Publish Live' when ready to list on eBay.")
+
+                # Commit before refreshing and showing the dialog so the write lock
+                # is not held while the modal waits on the user
+                self.populate_inventory_view()
+                self.append_log(message, "green")
+                messagebox.showinfo("eBay Draft Saved", 
+                    f"{message}\n\n" +
+                    f"Note: This creates a local draft in your database.\n" + 
+                    f"eBay doesn't provide draft functionality via their public API.\n" +
+                    f"Use 'Publish Live' when ready to list on eBay.")
                     
             except Exception as e:
                 logger.error(f"Failed to save eBay draft: {e}")
@@ -6887,27 +7953,21 @@ class VinylToolApp:
             messagebox.showwarning("No Selection", "Please select items to prepare for eBay")
             return
         
+        skus = self._inventory_skus(selected)
         try:
+            now_iso = datetime.datetime.now(_UTC).isoformat()
             with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-                
-                updated_count = 0
-                for item in selected:
-                    sku = self.inventory_tree.item(item, "values")[0]
-                    cursor.execute("""
-                        UPDATE inventory SET 
-                        status = 'eBay Ready',
-                        last_modified = ?
-                        WHERE sku = ?
-                    """, (now_iso, sku))
-                    updated_count += 1
-                
-                self.populate_inventory_view()
-                message = f"Marked {updated_count} item(s) as ready for eBay"
-                self.append_log(message, "green")
-                messagebox.showinfo("Success", message)
-                
+                conn.executemany(_UPDATE_INVENTORY_STATUS_SQL, [("eBay Ready", now_iso, sku) for sku in skus])
+            # Refresh after the commit so the view sees the new status
+            if self.inventory_sort_column == "Status":
+                self.populate_inventory_view(self.inventory_search_var.get())
+            else:
+                self._patch_inventory_rows(skus, 4, "eBay Ready")
+            self._note_inventory_change()
+            message = f"Marked {len(skus)} item(s) as ready for eBay"
+            self.append_log(message, "green")
+            messagebox.showinfo("Success", message)
+            
         except Exception as e:
             logger.error(f"Failed to mark items as eBay ready: {e}")
             messagebox.showerror("Database Error", f"Failed to update items: {e}")
@@ -6941,8 +8001,7 @@ class VinylToolApp:
             'comments': self.full_desc.get("1.0", tk.END).strip()
         }
         
-        self.root.config(cursor="watch")
-        self.root.update()
+        self._busy(True)
         
         def draft_worker():
             try:
@@ -6952,7 +8011,7 @@ class VinylToolApp:
             except Exception as e:
                 self.safe_after(0, lambda err=e: messagebox.showerror("Draft Error", str(err)))
             finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
+                self.safe_after(0, lambda: self._busy(False))
         
         threading.Thread(target=draft_worker, daemon=True).start()
 
@@ -6963,11 +8022,14 @@ class VinylToolApp:
             messagebox.showwarning("No Selection", "Please select items to create Discogs drafts")
             return
         
-        def draft_worker():
-            for item in selected:
-                sku = self.inventory_tree.item(item, "values")[0]
+        skus = self._inventory_skus(selected)
+
+        def draft_worker(skus):
+            records = self._get_inventory_records(skus)
+            id_updates = []  # (listing_id, sku)
+            for sku in skus:
                 try:
-                    record = self._get_inventory_record(sku)
+                    record = records.get(sku)
                     if not record:
                         self.append_log(f"SKU {sku}: Could not find record.", "red")
                         continue
@@ -6990,25 +8052,28 @@ class VinylToolApp:
                     listing_id = self.discogs_api.create_listing(listing_data)
                     if listing_id:
                         self.append_log(f"SKU {sku}: Created Discogs draft (ID: {listing_id})", "green")
-                        try:
-                            now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-                            with self.db.get_connection() as conn:
-                                cursor = conn.cursor()
-                                cursor.execute(
-                                    "UPDATE inventory SET discogs_listing_id = ?, discogs_updated_at = ? WHERE sku = ?",
-                                    (listing_id, now_iso, sku),
-                                )
-                        except Exception as e:
-                            logger.error(f"Failed to update inventory with Discogs listing ID: {e}")
-                            self.append_log(f"SKU {sku}: Failed to save Discogs listing ID to DB: {e}", "red")
+                        id_updates.append((listing_id, sku))
                     else:
                         self.append_log(f"SKU {sku}: Failed to create draft", "red")
                 except Exception as e:
                     self.append_log(f"SKU {sku}: Error - {e}", "red")
-            
+
+            self._save_discogs_listing_ids(id_updates)
             self.safe_after(0, self.populate_inventory_view)
         
-        threading.Thread(target=draft_worker, daemon=True).start()
+        threading.Thread(target=draft_worker, args=(skus,), daemon=True).start()
+
+    def _save_discogs_listing_ids(self, id_updates):
+        """Store (listing_id, sku) pairs in one transaction; blocks the calling worker."""
+        if not id_updates:
+            return
+        now_iso = datetime.datetime.now(_UTC).isoformat()
+        rows = [(listing_id, now_iso, sku) for listing_id, sku in id_updates]
+        try:
+            self._db_write(lambda conn: conn.executemany(
+                "UPDATE inventory SET discogs_listing_id = ?, discogs_updated_at = ? WHERE sku = ?", rows)).result()
+        except Exception as e:
+            self.append_log(f"Failed to save {len(id_updates)} Discogs listing ID(s) to DB: {e}", "red")
 
     def _list_on_discogs_live(self):
         """Create live Discogs listing (For Sale status) from lister form"""
@@ -7039,8 +8104,7 @@ class VinylToolApp:
             'comments': self.full_desc.get("1.0", tk.END).strip()
         }
         
-        self.root.config(cursor="watch")
-        self.root.update()
+        self._busy(True)
         
         def live_worker():
             try:
@@ -7050,7 +8114,7 @@ class VinylToolApp:
             except Exception as e:
                 self.safe_after(0, lambda err=e: messagebox.showerror("Listing Error", str(err)))
             finally:
-                self.safe_after(0, lambda: self.root.config(cursor=""))
+                self.safe_after(0, lambda: self._busy(False))
         
         threading.Thread(target=live_worker, daemon=True).start()
 
@@ -7060,11 +8124,14 @@ class VinylToolApp:
         if not selected: 
             return
         
-        def live_worker():
-            for item in selected:
-                sku = self.inventory_tree.item(item, "values")[0]
+        skus = self._inventory_skus(selected)
+
+        def live_worker(skus):
+            records = self._get_inventory_records(skus)
+            id_updates = []  # (listing_id, sku)
+            for sku in skus:
                 try:
-                    record = self._get_inventory_record(sku)
+                    record = records.get(sku)
                     if not record:
                         self.append_log(f"SKU {sku}: Could not find record.", "red")
                         continue
@@ -7092,25 +8159,14 @@ class VinylToolApp:
                             self.safe_after(0, lambda lid=listing_id: self._handle_discogs_live_success(lid))
                         except Exception:
                             pass
-                        try:
-                            now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-                            with self.db.get_connection() as conn:
-                                cursor = conn.cursor()
-                                cursor.execute(
-                                    "UPDATE inventory SET discogs_listing_id = ?, discogs_updated_at = ? WHERE sku = ?",
-                                    (listing_id, now_iso, sku),
-                                )
-                        except Exception as e:
-                            logger.error(f"Failed to update inventory with Discogs listing ID: {e}")
-                            self.append_log(f"SKU {sku}: Failed to save Discogs listing ID to DB: {e}", "red")
+                        id_updates.append((listing_id, sku))
                     else:
                         self.append_log(f"SKU {sku}: Failed to create live listing", "red")
                 except Exception as e:
                     self.append_log(f"SKU {sku}: Error - {e}", "red")
-            
+            self._save_discogs_listing_ids(id_updates)
             self.safe_after(0, self.populate_inventory_view)
-        
-        threading.Thread(target=live_worker, daemon=True).start()
+        threading.Thread(target=live_worker, args=(skus,), daemon=True).start()
 
     def _handle_discogs_draft_success(self, listing_id):
         """Handle successful Discogs draft creation"""
@@ -7152,7 +8208,7 @@ class VinylToolApp:
     def _check_existing_listings(self, sku: str) -> dict:
         """Check what listings already exist for this SKU"""
         try:
-            with self.db.get_connection() as conn:
+            with self.db.read_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT ebay_listing_id, discogs_listing_id, ebay_item_draft_id, status 
@@ -7288,14 +8344,30 @@ class VinylToolApp:
 
 
     def log_sync_activity(self, message):
-        """Log sync activity to the text widget"""
-        def do_log():
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.sync_log_text.config(state="normal")
-            self.sync_log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-            self.sync_log_text.see(tk.END)
-            self.sync_log_text.config(state="disabled")
-        self.safe_after(0, do_log)
+        """Log sync activity to the text widget (callable from any thread).
+
+        A sync logs a line per changed SKU, so lines are gathered for 100ms and
+        written in one insert.
+        """
+        self._sync_log_pending.append(message)
+        if not self._sync_log_flush_scheduled:
+            self._sync_log_flush_scheduled = True
+            self.safe_after(100, self._flush_sync_log)
+
+    def _flush_sync_log(self):
+        self._sync_log_flush_scheduled = False
+        pending = self._sync_log_pending
+        if not pending:
+            return
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        lines = []
+        while pending:
+            lines.append(f"[{timestamp}] {pending.popleft()}\n")
+        log = self.sync_log_text
+        log.config(state="normal")
+        self._append_log_line(log, "".join(lines))
+        log.see(tk.END)
+        log.config(state="disabled")
 
 # ============================================================================
 # MAIN EXECUTION
@@ -7326,7 +8398,7 @@ class VinylToolApp:
             return
         sku = self.inventory_tree.item(selected, "values")[0]
         try:
-            record = self._get_inventory_record(sku)
+            record = self._get_inventory_record(sku, include_payload=False)
             # eBay draft first (no direct URL to a single draft; open drafts overview)
             draft_id = record.get("ebay_item_draft_id")
             if draft_id:
@@ -7460,11 +8532,11 @@ try:
             import datetime, logging
             logger = logging.getLogger(__name__)
             try:
-                now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+                now_iso = datetime.datetime.now(_UTC).isoformat()
                 with self.db.get_connection() as conn:
                     cursor = conn.cursor()
                     cursor.execute(
-                        "UPDATE inventory SET ebay_listing_id = ?, ebay_updated_at = ? WHERE sku = ?",
+                        _SET_EBAY_LISTING_ID_SQL,
                         (listing_id, now_iso, sku),
                     )
                 try:
@@ -7503,7 +8575,7 @@ try:
             except Exception:
                 listing_id = ""
             if not listing_id and sku:
-                rec = self._get_inventory_record(sku)
+                rec = self._get_inventory_record(sku, include_payload=False)
                 listing_id = str(rec.get("ebay_listing_id") or "").strip()
             if not listing_id:
                 messagebox.showinfo("No eBay Listing", "No eBay Listing ID found for this item.")
@@ -7579,9 +8651,8 @@ try:
                 messagebox.showwarning("No Selection", "Please select one or more inventory items.")
                 return
             updated, skipped = 0, 0
-            for item in sel:
-                values = self.inventory_tree.item(item, "values")
-                sku = values[0] if values else ""
+            found = []  # (listing_id, sku), saved in one transaction after the lookups
+            for sku in self._inventory_skus(sel):
                 if not sku:
                     skipped += 1
                     continue
@@ -7590,25 +8661,21 @@ try:
                 except Exception:
                     listing_id = None
                 if listing_id:
-                    try:
-                        now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-                        with self.db.get_connection() as conn:
-                            conn.cursor().execute(
-                                "UPDATE inventory SET ebay_listing_id = ?, ebay_updated_at = ? WHERE sku = ?",
-                                (listing_id, now_iso, sku),
-                            )
-                        updated += 1
-                        try:
-                            self.append_log(f"SKU {sku}: synced eBay Listing ID {listing_id}", "green")
-                        except Exception:
-                            pass
-                    except Exception as e:
-                        try:
-                            self.append_log(f"SKU {sku}: failed to save listing ID: {e}", "red")
-                        except Exception:
-                            pass
+                    found.append((listing_id, sku))
                 else:
                     skipped += 1
+            if found:
+                now_iso = datetime.datetime.now(_UTC).isoformat()
+                try:
+                    with self.db.get_connection() as conn:
+                        conn.executemany(_SET_EBAY_LISTING_ID_SQL, [(listing_id, now_iso, sku) for listing_id, sku in found])
+                    updated = len(found)
+                    for listing_id, sku in found:
+                        try: self.append_log(f"SKU {sku}: synced eBay Listing ID {listing_id}", "green")
+                        except Exception: pass
+                except Exception as e:
+                    try: self.append_log(f"Failed to save {len(found)} eBay listing ID(s): {e}", "red")
+                    except Exception: pass
             # Refresh table
             try:
                 self.populate_inventory_view(getattr(self, "inventory_search_var", None).get() if hasattr(self, "inventory_search_var") else "")
@@ -7695,9 +8762,8 @@ try:
                 messagebox.showwarning("No Selection", "Please select one or more inventory items.")
                 return
             updated, skipped = 0, 0
-            for item in sel:
-                values = self.inventory_tree.item(item, "values")
-                sku = values[0] if values else ""
+            found = []  # (listing_id, sku), saved in one transaction after the lookups
+            for sku in self._inventory_skus(sel):
                 if not sku:
                     skipped += 1
                     continue
@@ -7707,21 +8773,21 @@ try:
                 except Exception:
                     listing_id = None
                 if listing_id:
-                    try:
-                        now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-                        with self.db.get_connection() as conn:
-                            conn.cursor().execute(
-                                "UPDATE inventory SET ebay_listing_id = ?, ebay_updated_at = ? WHERE sku = ?",
-                                (listing_id, now_iso, sku),
-                            )
-                        updated += 1
-                        try: self.append_log(f"SKU {sku}: synced eBay Listing ID {listing_id}", "green")
-                        except Exception: pass
-                    except Exception as e:
-                        try: self.append_log(f"SKU {sku}: failed to save listing ID: {e}", "red")
-                        except Exception: pass
+                    found.append((listing_id, sku))
                 else:
                     skipped += 1
+            if found:
+                now_iso = datetime.datetime.now(_UTC).isoformat()
+                try:
+                    with self.db.get_connection() as conn:
+                        conn.executemany(_SET_EBAY_LISTING_ID_SQL, [(listing_id, now_iso, sku) for listing_id, sku in found])
+                    updated = len(found)
+                    for listing_id, sku in found:
+                        try: self.append_log(f"SKU {sku}: synced eBay Listing ID {listing_id}", "green")
+                        except Exception: pass
+                except Exception as e:
+                    try: self.append_log(f"Failed to save {len(found)} eBay listing ID(s): {e}", "red")
+                    except Exception: pass
             try:
                 self.populate_inventory_view(getattr(self, "inventory_search_var", None).get() if hasattr(self, "inventory_search_var") else "")
             except Exception:
@@ -7742,7 +8808,7 @@ try:
             try: current = str(values[6] or "")
             except Exception: current = ""
             if not current and sku:
-                rec = self._get_inventory_record(sku)
+                rec = self._get_inventory_record(sku, include_payload=False)
                 current = str(rec.get("ebay_listing_id") or "")
             prompt = "Paste the eBay URL or numeric listing ID:"
             entry = simpledialog.askstring("Fix eBay Listing ID", prompt, initialvalue=current, parent=self.root)
@@ -7752,10 +8818,10 @@ try:
                 messagebox.showerror("Invalid ID", "Could not find a numeric listing ID in your input.")
                 return
             try:
-                now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+                now_iso = datetime.datetime.now(_UTC).isoformat()
                 with self.db.get_connection() as conn:
                     conn.cursor().execute(
-                        "UPDATE inventory SET ebay_listing_id = ?, ebay_updated_at = ? WHERE sku = ?",
+                        _SET_EBAY_LISTING_ID_SQL,
                         (new_id, now_iso, sku),
                     )
                 try: self.append_log(f"SKU {sku}: eBay Listing ID set to {new_id}", "green")
@@ -7851,9 +8917,8 @@ try:
                 messagebox.showwarning("No Selection", "Please select one or more inventory items.")
                 return
             updated, skipped = 0, 0
-            for item in sel:
-                values = self.inventory_tree.item(item, "values")
-                sku = values[0] if values else ""
+            found = []  # (listing_id, sku), saved in one transaction after the lookups
+            for sku in self._inventory_skus(sel):
                 if not sku:
                     skipped += 1
                     continue
@@ -7863,21 +8928,21 @@ try:
                 except Exception:
                     listing_id = None
                 if listing_id:
-                    try:
-                        now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
-                        with self.db.get_connection() as conn:
-                            conn.cursor().execute(
-                                "UPDATE inventory SET ebay_listing_id = ?, ebay_updated_at = ? WHERE sku = ?",
-                                (listing_id, now_iso, sku),
-                            )
-                        updated += 1
-                        try: self.append_log(f"SKU {sku}: synced eBay Listing ID {listing_id}", "green")
-                        except Exception: pass
-                    except Exception as e:
-                        try: self.append_log(f"SKU {sku}: failed to save listing ID: {e}", "red")
-                        except Exception: pass
+                    found.append((listing_id, sku))
                 else:
                     skipped += 1
+            if found:
+                now_iso = datetime.datetime.now(_UTC).isoformat()
+                try:
+                    with self.db.get_connection() as conn:
+                        conn.executemany(_SET_EBAY_LISTING_ID_SQL, [(listing_id, now_iso, sku) for listing_id, sku in found])
+                    updated = len(found)
+                    for listing_id, sku in found:
+                        try: self.append_log(f"SKU {sku}: synced eBay Listing ID {listing_id}", "green")
+                        except Exception: pass
+                except Exception as e:
+                    try: self.append_log(f"Failed to save {len(found)} eBay listing ID(s): {e}", "red")
+                    except Exception: pass
             try:
                 self.populate_inventory_view(getattr(self, "inventory_search_var", None).get() if hasattr(self, "inventory_search_var") else "")
             except Exception:
@@ -7902,7 +8967,7 @@ try:
             try: current = str(values[6] or "")
             except Exception: current = ""
             if not current and sku:
-                rec = self._get_inventory_record(sku)
+                rec = self._get_inventory_record(sku, include_payload=False)
                 current = str(rec.get("ebay_listing_id") or "")
             entry = simpledialog.askstring("Fix eBay Listing ID", "Paste the eBay URL or numeric listing ID:", initialvalue=current, parent=self.root)
             if entry is None: return
@@ -7911,10 +8976,10 @@ try:
                 messagebox.showerror("Invalid ID", "Could not find a numeric listing ID in your input.")
                 return
             try:
-                now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+                now_iso = datetime.datetime.now(_UTC).isoformat()
                 with self.db.get_connection() as conn:
                     conn.cursor().execute(
-                        "UPDATE inventory SET ebay_listing_id = ?, ebay_updated_at = ? WHERE sku = ?",
+                        _SET_EBAY_LISTING_ID_SQL,
                         (new_id, now_iso, sku),
                     )
                 try: self.append_log(f"SKU {sku}: eBay Listing ID set to {new_id}", "green")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import sys, yaml, tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 sys.path.insert(0, ".")
 from vinyltool.core.config import load_config
@@ -25,6 +26,20 @@ def build_query(s, defaults):
         return f'"{s["artist"]}" "{s["title"]}" {inc} {exc}'.strip()
     return s.get("query","")
 
+def search_kwargs(s, defaults):
+    formats = s.get("formats", ["vinyl"])
+    categories = []
+    if "cassette" in [f.lower() for f in formats]:
+        categories.append("Cassettes")
+    if "vinyl" in [f.lower() for f in formats]:
+        categories.append("Records")
+    return dict(
+        query=build_query(s, defaults), limit=40,
+        listing_types=s.get("listing_types", defaults.get("listing_types", ["BIN","AUCTION_BIN"])),
+        sort="newlyListed", price_cap=s.get("max_price", defaults.get("max_price", 9999)),
+        country="GB", categories=categories or None,
+    )
+
 def fnum(v):
     try: return float(v)
     except: return 0.0
@@ -70,23 +85,24 @@ def main():
     print("\n=== Deal Hunter — Profit View ===\n")
     any_shown = False
 
-    for s in searches:
+    # Every search is independent, so the network calls are issued up front and the
+    # results ranked in order below. eBay searches run 8 at a time; Discogs price
+    # lookups share one worker (DiscogsAPI paces its own requests) and each distinct
+    # release is fetched once.
+    eb.get_access_token()  # authorise once here rather than racing from every worker
+    ebay_pool = ThreadPoolExecutor(max_workers=8)
+    discogs_pool = ThreadPoolExecutor(max_workers=1)
+    search_futures = [ebay_pool.submit(es.search_active_listings, **search_kwargs(s, defaults)) for s in searches]
+    price_futures = {rid: discogs_pool.submit(dc.get_price_suggestions, rid)
+                     for rid in dict.fromkeys(int(s["discogs_release_id"]) for s in searches if s.get("discogs_release_id"))}
+
+    for s, search_future in zip(searches, search_futures):
         search_name = s.get("name", "")
-        q = build_query(s, defaults)
-        listing_types = s.get("listing_types", defaults.get("listing_types", ["BIN","AUCTION_BIN"]))
         max_price = s.get("max_price", defaults.get("max_price", 9999))
         excl = [t.lower() for t in s.get("exclude_terms", defaults.get("exclude_terms", []))]
         formats = s.get("formats", ["vinyl"])
-        categories = []
-        if "cassette" in [f.lower() for f in formats]:
-            categories.append("Cassettes")
-        if "vinyl" in [f.lower() for f in formats]:
-            categories.append("Records")
         try:
-            items = es.search_active_listings(
-                query=q, limit=40, listing_types=listing_types, sort="newlyListed",
-                price_cap=max_price, country="GB", categories=categories or None
-            )
+            items = search_future.result()
         except Exception as e:
             print(f"[{s['name']}] search error: {e}")
             continue
@@ -94,7 +110,7 @@ def main():
         rid = s.get("discogs_release_id")
         basis = 0.0
         if rid:
-            ps = dc.get_price_suggestions(int(rid)) or {}
+            ps = price_futures[int(rid)].result() or {}
             vg = fnum((ps.get("Very Good Plus (VG+)",{}) or {}).get("value"))
             nm = fnum((ps.get("Near Mint (NM or M-)",{}) or {}).get("value"))
             basis = nm or vg or 0.0
@@ -172,6 +188,8 @@ def main():
                     head = f"£{proj:>6.2f} ({margin:>5.1f}%) on £{buy:>6.2f}"
                     print(f"  {head} [{fmt}] | {it['title']}\n    {it['url']}")
                 print()
+    ebay_pool.shutdown()
+    discogs_pool.shutdown()
     if not any_shown:
         print("No profit-positive candidates yet. Try raising max_price or adding discogs_release_id to a search.")
 
@@ -76,7 +76,7 @@ def compute_profit(item, release_id, fmt, dc, defaults):
     margin = (proj / buy * 100.0) if buy > 0 else 0.0
     return basis, proj, margin, target_net
 
-def one_pass(eb, dc, matcher, min_confidence, verbose, discovery, state):
+def one_pass(eb, dc, matcher, min_confidence, verbose, discovery, state, deal_log):
     print("\n🔍 Scanning eBay for new deals...")
     print("\n🔍 Scanning eBay for new deals...")
     print("\n🔍 Scanning eBay for new deals...")
@@ -157,12 +157,10 @@ def one_pass(eb, dc, matcher, min_confidence, verbose, discovery, state):
                 min_profit = float(pm.get("min_profit_gbp", 10))
                 min_margin = float(pm.get("min_margin_pct", 20))
                 if proj >= min_profit and margin >= min_margin:
-                    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
                     line = (f"{now_utc()} | {name} | [{fmt}] £{proj:.2f} ({margin:.1f}%) "
                             f"on £{float(it.get('total') or 0):.2f} | basis £{basis:.2f} | "
                             f"{it.get('title')} | {it.get('url')}\n")
-                    with LOG_PATH.open("a", encoding="utf-8") as f:
-                        f.write(line)
+                    deal_log.write(line)
                     print(line, end="")
 
     return any_found
@@ -190,19 +188,20 @@ def main(loop_minutes=5, once=False):
     # Load state
     state = load_state()
 
-    # Initialize auto-matcher
-
-    if once:
-        one_pass(eb, dc, matcher, min_confidence, verbose, discovery, state)
-        state["last_run"] = now_utc()
-        save_state(state)
-        return
-
-    while True:
-        any_found = one_pass(eb, dc, matcher, min_confidence, verbose, discovery, state)
-        state["last_run"] = now_utc()
-        save_state(state)
-        time.sleep(loop_minutes * 60)
+    # Deal log stays open for the whole run; line-buffered so each hit lands as it is found
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with LOG_PATH.open("a", encoding="utf-8", buffering=1) as deal_log:
+        if once:
+            one_pass(eb, dc, matcher, min_confidence, verbose, discovery, state, deal_log)
+            state["last_run"] = now_utc()
+            save_state(state)
+            return
+
+        while True:
+            any_found = one_pass(eb, dc, matcher, min_confidence, verbose, discovery, state, deal_log)
+            state["last_run"] = now_utc()
+            save_state(state)
+            time.sleep(loop_minutes * 60)
 
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
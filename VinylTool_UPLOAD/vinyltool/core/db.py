@@ -7,29 +7,79 @@ from vinyltool.core.config import Config  # may be referenced by the class
 from vinyltool.core.logging import setup_logging  # may be referenced by the class
 logger = setup_logging('db')
 
+# Applied to every connection: WAL makes NORMAL sync durable enough, and the larger
+# page cache / mmap window keep the inventory table in memory between queries.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
 class DatabaseManager:
     """Handle all database operations"""
     
     def __init__(self):
         self.db_path = os.path.join(os.path.dirname(__file__), "inventory.db")
+        self._read_conn = None
+        self._read_lock = threading.Lock()
+        self._write_conn = None
+        self._write_lock = threading.RLock()
         self._init_database()
     
+    def _connect(self, **kwargs):
+        """Open a tuned connection in autocommit mode; callers manage transactions explicitly."""
+        conn = sqlite3.connect(self.db_path, isolation_level=None, **kwargs)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Context manager for database connections.
+
+        The whole block runs in one BEGIN IMMEDIATE transaction, committed on exit.
+        SQLite admits one writer at a time anyway, so writes share a single long-lived
+        connection (no per-transaction open and pragma setup, and its statement cache
+        stays warm); the lock queues writers from different threads.
+        """
+        with self._write_lock:
+            if self._write_conn is None:
+                self._write_conn = self._connect(check_same_thread=False, cached_statements=256)
+            conn = self._write_conn
+            if conn.in_transaction:
+                # Nested use on the same thread; refuse before touching the outer transaction
+                raise RuntimeError("get_connection() blocks cannot be nested")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+    
+    @contextmanager
+    def read_connection(self):
+        """Shared long-lived connection for hot read paths.
+        
+        Keeps sqlite3's per-connection statement cache warm across calls
+        (sized past the default 128, as the paged inventory query varies by sort/search).
+        Access is serialized with a lock, so it is safe from worker threads.
+        Use get_connection() for anything that writes.
+        """
+        with self._read_lock:
+            if self._read_conn is None:
+                self._read_conn = self._connect(check_same_thread=False, cached_statements=256)
+            yield self._read_conn
     
     def _init_database(self):
         """Initialize database schema"""
+        # WAL is persistent in the database file, so setting it once here covers
+        # every later connection; writers no longer block readers.
+        # (It cannot be switched inside a transaction, hence its own connection.)
+        with contextlib.closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -86,7 +136,9 @@ class DatabaseManager:
                 ("ebay_item_draft_id", "TEXT"),
                 ("ebay_updated_at", "TEXT"),
                 ("discogs_updated_at", "TEXT"),
-                ("inv_updated_at", "TEXT")
+                ("inv_updated_at", "TEXT"),
+                # Truncated sha256 of the last payload pushed to Discogs by the sync
+                ("last_pushed_hash", "BLOB")
             ]
             
             existing_columns = [row[1] for row in cursor.execute("PRAGMA table_info(inventory)")]
@@ -97,4 +149,27 @@ class DatabaseManager:
                         cursor.execute(f"ALTER TABLE inventory ADD COLUMN {col_name} {col_type}")
                         logger.info(f"Added column {col_name} to inventory table")
                     except sqlite3.OperationalError:
-                        pass  # Column already exists
\ No newline at end of file
+                        pass  # Column already exists
+
+            # Lookup and sort indexes (sku and discogs_listing_id are already UNIQUE-indexed).
+            # The inventory search is a leading-wildcard LIKE across sku/artist/title, which no
+            # B-tree index can serve; it scans, bounded by the view's page LIMIT.
+            for ddl in (
+                "CREATE INDEX IF NOT EXISTS idx_inv_discogs_release ON inventory(discogs_release_id)",
+                "CREATE INDEX IF NOT EXISTS idx_inv_ebay_listing ON inventory(ebay_listing_id)",
+                "CREATE INDEX IF NOT EXISTS idx_inv_status_date ON inventory(status, date_added)",
+                "CREATE INDEX IF NOT EXISTS idx_inv_date_added ON inventory(date_added)",
+                "CREATE INDEX IF NOT EXISTS idx_inv_artist ON inventory(artist)",
+                "CREATE INDEX IF NOT EXISTS idx_inv_title ON inventory(title)",
+            ):
+                cursor.execute(ddl)
+            # Databases that gained discogs_listing_id through ALTER TABLE never got its UNIQUE
+            # constraint (SQLite cannot add one that way); the Discogs import relies on it to skip
+            # listings it already holds
+            try:
+                cursor.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ux_inv_discogs_listing "
+                    "ON inventory(discogs_listing_id) WHERE discogs_listing_id IS NOT NULL"
+                )
+            except sqlite3.IntegrityError:
+                logger.warning("Duplicate discogs_listing_id values in inventory; unique index not created")
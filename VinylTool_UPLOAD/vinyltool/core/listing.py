@@ -1,11 +1,11 @@
 # vinyltool/core/listing.py
 from __future__ import annotations
 from typing import *
+import html
 import re
 import tkinter as tk
 from tkinter import ttk  # <<< THIS LINE WAS MISSING
 from tkinter import messagebox
-import threading
 
 # --- Constants and Helpers (Restored from VinylTool_BETA1_.py) ---
 
@@ -17,24 +17,73 @@ GRADE_ABBREVIATIONS = {
     "Good": "G", "Fair": "F", "Poor": "P", "Generic": "G"
 }
 
-# --- Helper Functions for Modular Access ---
-# These functions allow the title/description logic to access the main app's UI elements.
+# Multi-disc prefix on a format value, e.g. "2x" in '2x12"' or "2x LP"
+_FORMAT_MULTI_RE = re.compile(r"^\s*(\d+x)", re.IGNORECASE)
+
+# --- Static fragments of the Analog Theory description ---
+# Pre-stripped, one line per block, so rendering is a single join with no per-call cleanup.
+_AT_PILL = "display:inline-block; font-weight:bold; padding:6px 10px; border-radius:8px; border:1px solid #3a7d2c; background:#f1f9f1; color:#3a7d2c; margin:2px;"
+
+_AT_HEADER_OPEN = "\n".join([
+    '<div style="max-width: 860px; width: 100%; margin: 0 auto; background: #fffdf9; border: 1px solid #d6d2c9; border-radius: 12px; overflow: hidden; font-family: Arial, \'Helvetica Neue\', sans-serif; color: #1a1a1a; font-size: 16px; line-height: 1.55;">',
+    '<div style="padding: 20px 22px; border-bottom: 1px solid #d6d2c9; background: #ffffff;">',
+    '<table style="width: 100%; border-collapse: collapse;">',
+    '<tr>',
+    '<td style="width: 44px; vertical-align: middle; padding-right: 16px;"><div style="width: 44px; height: 44px; border-radius: 8px; border: 1px solid #d6d2c9; background: linear-gradient(135deg, #b8e6ff, #e8f7ff);"></div></td>',
+])
+
+_AT_HEADER_CLOSE = "\n".join([
+    '<td style="text-align: right; vertical-align: middle;"><span style="display: inline-block; border: 1px solid #d6d2c9; color: #5c5c5c; padding: 6px 12px; border-radius: 20px; font-size: 14px;">In Stock</span></td>',
+    '</tr>',
+    '</table>',
+    '</div>',
+    '<div style="padding: 20px 22px;">',
+    '<table style="width: 100%; border-collapse: separate; border-spacing: 10px; margin: 16px 0;">',
+    '<tr>',
+])
+
+_AT_CELL_OPEN = '<td style="border: 1px solid #d6d2c9; border-radius: 8px; padding: 10px 12px; background: #ffffff; width: 33%; vertical-align: top;"><span style="display:block; font-size:12px; color:#5c5c5c; text-transform:uppercase; letter-spacing:0.5px;">'
+_AT_CELL_MID = '</span><span style="display:block; font-weight:bold; margin-top:4px;">'
+
+_AT_CONDITION_OPEN = "\n".join([
+    '</tr>',
+    '</table>',
+    '<div style="border-top:1px dashed #d6d2c9; padding:14px 0;">',
+    '<div style="display:block;">',
+    '<strong style="font-size:16px; display:block;">Condition</strong>',
+    '<div style="font-size:14px; color:#5c5c5c; margin:6px 0 8px 0;">Graded under strong light.</div>',
+    '<div style="display:flex; gap:8px; flex-wrap:wrap;">',
+])
+
+_AT_CONDITION_CLOSE = "</div>\n</div>\n</div>\n</div>"
+
+_AT_STORE_PROMISE = (
+    '<div style="border:1px solid #e3e0d8; border-radius:12px; padding:16px; background:#fffefb; margin:12px 0 16px 0;">'
+    '<table role="presentation" style="width:100%; border-collapse:separate; border-spacing:8px;"><tr>'
+    '<td style="width:33.33%; vertical-align:top; padding:10px; border:1px solid #e3e0d8; border-radius:10px; background:#ffffff;"><div style="display:flex; align-items:flex-start; gap:10px;"><span aria-hidden="true" style="font-size:22px; line-height:1; margin-top:2px;">✅</span><span style="font-size:18px; font-weight:600; color:#1a1a1a; line-height:1.4;">Professional, Secure Packaging</span></div></td>'
+    '<td style="width:33.33%; vertical-align:top; padding:10px; border:1px solid #e3e0d8; border-radius:10px; background:#ffffff;"><div style="display:flex; align-items:flex-start; gap:10px;"><span aria-hidden="true" style="font-size:22px; line-height:1; margin-top:2px;">✅</span><span style="font-size:18px; font-weight:600; color:#1a1a1a; line-height:1.4;">Fast Dispatch Royal Mail</span></div></td>'
+    '<td style="width:33.33%; vertical-align:top; padding:10px; border:1px solid #e3e0d8; border-radius:10px; background:#ffffff;"><div style="display:flex; align-items:flex-start; gap:10px;"><span aria-hidden="true" style="font-size:22px; line-height:1; margin-top:2px;">✅</span><span style="font-size:18px; font-weight:600; color:#1a1a1a; line-height:1.4;">All Stock Graded Honestly</span></div></td>'
+    '</tr></table></div>'
+)
+
+
+def _at_cell(label, value):
+    return f"{_AT_CELL_OPEN}{label}{_AT_CELL_MID}{html.escape(str(value), quote=False)}</span></td>"
+
+
+def _track_item_html(track):
+    position = (track.get('position', '') or '').strip()
+    display = f"{position}  {track.get('title', 'Unknown Track')}".strip()
+    return f'<li><span class="track-line">{html.escape(display, quote=False)}</span></li>'
 
-def _get(app, key: str, default: str = "") -> str:
-    """Safely get a value from the main application's UI entry widgets."""
-    try:
-        # Construct the key name used in the `app.entries` dictionary
-        widget_key = key.lower().replace(" / ", "_").replace("/", "_").replace(" ", "_")
-        widget = app.entries[widget_key]
-        
-        if isinstance(widget, (tk.Entry, ttk.Entry, ttk.Combobox)):
-            return widget.get().strip()
-        elif isinstance(widget, tk.Text):
-            return widget.get("1.0", "end-1c").strip()
-    except (KeyError, AttributeError) as e:
-        print(f"Debug: Could not _get entry for key '{key}' (widget key: '{widget_key}'): {e}")
 
-    return default
+def _html_nl(text):
+    """Escape free text for the description body and turn newlines into <br> in the same pass."""
+    return html.escape(text, quote=False).replace("\n", "<br>")
+
+
+# --- Helper Functions for Modular Access ---
+# These functions allow the title/description logic to access the main app's UI elements.
 
 def _set_entry(app, key: str, value: str):
     """Safely set a value in the main application's UI entry widgets."""
@@ -62,12 +111,13 @@ def generate_listing_title(app):
     """
     parts = []
 
-    # 1. Gather data from the form using the _get helper
-    artist = _get(app, "artist")
-    title = _get(app, "title")
-    year = _get(app, "year")
-    cat_no = _get(app, "cat_no")
-    specific_format = _get(app, "format") # e.g., "2x12\"", "LP", "7\""
+    # 1. Gather data from the form in one pass
+    snap = app._snapshot_form()
+    artist = snap["artist"]
+    title = snap["title"]
+    year = snap["year"]
+    cat_no = snap["cat_no"]
+    specific_format = snap["format"] # e.g., "2x12\"", "LP", "7\""
     
     # 2. Artist (UPPERCASE)
     if artist:
@@ -82,22 +132,17 @@ def generate_listing_title(app):
         parts.append(f"({year})")
         
     # 5. Format Prefix and "Vinyl LP"
-    format_prefix = ""
-    if specific_format:
-        # Extract prefixes like "2x" from "2x12\"" or "2x LP"
-        match = re.match(r"^\s*(\d+x)", specific_format, re.IGNORECASE)
-        if match:
-            format_prefix = f"{match.group(1)} "
-            
-    parts.append(f"{format_prefix}Vinyl LP")
+    # Extract prefixes like "2x" from "2x12\"" or "2x LP"
+    match = _FORMAT_MULTI_RE.match(specific_format) if specific_format else None
+    parts.append(f"{match.group(1)} Vinyl LP" if match else "Vinyl LP")
     
     # 6. CatNo (skip if it looks like a barcode)
     if cat_no and not (cat_no.isdigit() and 10 <= len(cat_no) <= 14):
         parts.append(cat_no)
         
     # 7. Grade (NM/NM, VG+/VG+, etc.)
-    media_cond = _get(app, "media_condition")
-    sleeve_cond = _get(app, "sleeve_condition")
+    media_cond = snap["media_condition"]
+    sleeve_cond = snap["sleeve_condition"]
     
     media_abbr = GRADE_ABBREVIATIONS.get(media_cond, "")
     sleeve_abbr = GRADE_ABBREVIATIONS.get(sleeve_cond, "")
@@ -106,7 +151,8 @@ def generate_listing_title(app):
         parts.append(f"{media_abbr}/{sleeve_abbr}")
         
     # 8. Assemble, truncate, and set the final title
-    final_title = " ".join(filter(None, parts))[:80]
+    # Every append above is already guarded, so no empty parts need filtering
+    final_title = " ".join(parts)[:80]
     _set_entry(app, "listing_title", final_title)
     
     print(f"Generated Title: {final_title}") # For debugging
@@ -119,38 +165,45 @@ def build_description(app):
         _render_analog_theory_description(app, None)
         return
     
-    app.root.config(cursor="watch")
-    app.root.update()
+    release_id = app.current_release_id
+    # Apply already fetched this release; render from it without another round-trip
+    cached = app._last_release_data
+    if cached and cached.get('id') == release_id:
+        _render_analog_theory_description(app, cached)
+        return
+    if not app._begin_action("build", release_id):
+        return
+
+    app._busy(True)
+    # Read the form here on the Tk thread; the worker only fetches and formats
+    payload = app._snapshot_form()
     
     def fetch_worker():
         try:
             # Assumes app.discogs_api.get_release exists and works
-            release_data = app.discogs_api.get_release(app.current_release_id)
-            app.safe_after(0, lambda: _render_analog_theory_description(app, release_data))
+            release_data = app.discogs_api.get_release(release_id)
+            final_html = _build_analog_theory_html(payload, release_data)
+            app.safe_after(0, lambda: app._is_current_action("build", release_id) and _apply_description_html(app, final_html))
         except Exception as e:
-            app.safe_after(0, lambda: messagebox.showerror("Error", str(e)))
+            app.safe_after(0, lambda err=e: messagebox.showerror("Error", str(err)))
         finally:
-            app.safe_after(0, lambda: app.root.config(cursor=""))
+            app.safe_after(0, lambda: app._end_action("build", release_id))
     
-    threading.Thread(target=fetch_worker, daemon=True).start()
+    app._io_pool.submit(fetch_worker)
 
 def _render_analog_theory_description(app, release_data):
     """Renders the HTML description. (This function was mostly correct)."""
-    
-    # --- Gather data from UI form ---
-    payload = {
-        "artist": _get(app, "artist"),
-        "title": _get(app, "title"),
-        "cat_no": _get(app, "cat_no"),
-        "year": _get(app, "year"),
-        "format": _get(app, "format"),
-        "media_condition": _get(app, "media_condition"),
-        "sleeve_condition": _get(app, "sleeve_condition"),
-        "condition_notes": _get(app, "condition_notes"),
-        "matrix_runout": _get(app, "matrix_runout"),
-        "condition_tags": _get(app, "condition_tags"),
-        "barcode": _get(app, "barcode"),
-    }
+    _apply_description_html(app, _build_analog_theory_html(app._snapshot_form(), release_data))
+
+def _apply_description_html(app, final_html):
+    """Set the value in the main app's description widget (Tk thread only)."""
+    app.full_desc.delete("1.0", tk.END)
+    app.full_desc.insert("1.0", final_html)
+
+def _build_analog_theory_html(payload, release_data):
+    """Build the description HTML from a form snapshot; touches no widgets, so safe off the Tk thread."""
+    media_abbr = GRADE_ABBREVIATIONS.get(payload["media_condition"], "")
+    sleeve_abbr = GRADE_ABBREVIATIONS.get(payload["sleeve_condition"], "")
 
     # --- Helper functions for template ---
     def get_release_attr(data, key, default=''):
@@ -169,13 +222,11 @@ def _render_analog_theory_description(app, release_data):
     # --- Tracklist ---
     tracklist_html = ""
     if release_data and release_data.get('tracklist'):
-        tracklist_items = []
-        for track in release_data['tracklist']:
-            title = track.get('title', 'Unknown Track')
-            position = (track.get('position', '') or '').strip()
-            display = f"{position}  {title}".strip()
-            tracklist_items.append(f'<li><span class="track-line">{display}</span></li>')
-        tracklist_html = f'<ul class="track-listing" style="list-style:none; margin:0; padding-left:0;">{"".join(tracklist_items)}</ul>'
+        tracklist_html = (
+            '<ul class="track-listing" style="list-style:none; margin:0; padding-left:0;">'
+            + "".join(map(_track_item_html, release_data['tracklist']))
+            + '</ul>'
+        )
         tracklist_section_html = (
             '<div style="border:1px solid #d6d2c9; border-radius:8px; padding:12px; background:#ffffff; margin-top:10px;">'
             f'<h3 style="margin:0 0 12px 0; font-size:16px; font-weight:bold;">Tracklist</h3>{tracklist_html}</div>'
@@ -184,77 +235,44 @@ def _render_analog_theory_description(app, release_data):
         tracklist_section_html = ''
 
     # --- Other HTML sections ---
-    _pill = "display:inline-block; font-weight:bold; padding:6px 10px; border-radius:8px; border:1px solid #3a7d2c; background:#f1f9f1; color:#3a7d2c; margin:2px;"
     tags_raw = payload.get('condition_tags', '').strip()
-    tags_list = [t.strip() for t in tags_raw.split(',') if t.strip()]
-    tags_pills_html = "".join([f'<span style="{_pill}">{t}</span>' for t in tags_list])
-
-    condition_notes_html = (
-        '<div style="border-top:1px dashed #d6d2c9; padding:14px 0;"><strong>Condition Notes:</strong>'
-        f'<div style="font-size:14px; color:#5c5c5c; margin-top:8px;">{payload.get("condition_notes", "").replace(chr(10), "<br>")}</div></div>'
-    ) if payload.get("condition_notes") else ''
+    tags_pills_html = "".join([f'<span style="{_AT_PILL}">{html.escape(t, quote=False)}</span>' for t in (t.strip() for t in tags_raw.split(',')) if t])
 
+    condition_notes = payload.get("condition_notes")
     matrix_text = payload.get('matrix_runout', '')
-    matrix_details_html = (
-        '<div style="border:1px solid #d6d2c9; border-radius:8px; padding:12px; background:#ffffff; margin-top:14px;">'
-        '<h3 style="margin:0 0 12px 0; font-size:16px; font-weight:bold;">Matrix / Runout Details</h3>'
-        f'<div style="font-size:14px; white-space:pre-wrap;">{matrix_text.replace(chr(10), "<br>")}</div></div>'
-    ) if matrix_text else ''
-    
-    store_promise_html = (
-        '<div style="border:1px solid #e3e0d8; border-radius:12px; padding:16px; background:#fffefb; margin:12px 0 16px 0;">'
-          '<table role="presentation" style="width:100%; border-collapse:separate; border-spacing:8px;"><tr>'
-          '<td style="width:33.33%; vertical-align:top; padding:10px; border:1px solid #e3e0d8; border-radius:10px; background:#ffffff;"><div style="display:flex; align-items:flex-start; gap:10px;"><span aria-hidden="true" style="font-size:22px; line-height:1; margin-top:2px;">✅</span><span style="font-size:18px; font-weight:600; color:#1a1a1a; line-height:1.4;">Professional, Secure Packaging</span></div></td>'
-          '<td style="width:33.33%; vertical-align:top; padding:10px; border:1px solid #e3e0d8; border-radius:10px; background:#ffffff;"><div style="display:flex; align-items:flex-start; gap:10px;"><span aria-hidden="true" style="font-size:22px; line-height:1; margin-top:2px;">✅</span><span style="font-size:18px; font-weight:600; color:#1a1a1a; line-height:1.4;">Fast Dispatch Royal Mail</span></div></td>'
-          '<td style="width:33.33%; vertical-align:top; padding:10px; border:1px solid #e3e0d8; border-radius:10px; background:#ffffff;"><div style="display:flex; align-items:flex-start; gap:10px;"><span aria-hidden="true" style="font-size:22px; line-height:1; margin-top:2px;">✅</span><span style="font-size:18px; font-weight:600; color:#1a1a1a; line-height:1.4;">All Stock Graded Honestly</span></div></td>'
-          '</tr></table></div>'
-    )
-
-    # --- Assemble the final HTML ---
-    html_template = f"""
-    <div style="max-width: 860px; width: 100%; margin: 0 auto; background: #fffdf9; border: 1px solid #d6d2c9; border-radius: 12px; overflow: hidden; font-family: Arial, 'Helvetica Neue', sans-serif; color: #1a1a1a; font-size: 16px; line-height: 1.55;">
-      <div style="padding: 20px 22px; border-bottom: 1px solid #d6d2c9; background: #ffffff;">
-        <table style="width: 100%; border-collapse: collapse;">
-          <tr>
-            <td style="width: 44px; vertical-align: middle; padding-right: 16px;"><div style="width: 44px; height: 44px; border-radius: 8px; border: 1px solid #d6d2c9; background: linear-gradient(135deg, #b8e6ff, #e8f7ff);"></div></td>
-            <td style="vertical-align: middle;"><h1 style="margin: 0; font-size: 20px; font-weight: bold; color: #1a1a1a;">{payload.get('artist', '')} – {payload.get('title', '')}</h1></td>
-            <td style="text-align: right; vertical-align: middle;"><span style="display: inline-block; border: 1px solid #d6d2c9; color: #5c5c5c; padding: 6px 12px; border-radius: 20px; font-size: 14px;">In Stock</span></td>
-          </tr>
-        </table>
-      </div>
-      <div style="padding: 20px 22px;">
-        <table style="width: 100%; border-collapse: separate; border-spacing: 10px; margin: 16px 0;">
-          <tr>
-            <td style="border: 1px solid #d6d2c9; border-radius: 8px; padding: 10px 12px; background: #ffffff; width: 33%; vertical-align: top;"><span style="display:block; font-size:12px; color:#5c5c5c; text-transform:uppercase; letter-spacing:0.5px;">Format</span><span style="display:block; font-weight:bold; margin-top:4px;">{get_main_format(release_data)}</span></td>
-            <td style="border: 1px solid #d6d2c9; border-radius: 8px; padding: 10px 12px; background: #ffffff; width: 33%; vertical-align: top;"><span style="display:block; font-size:12px; color:#5c5c5c; text-transform:uppercase; letter-spacing:0.5px;">Cat No</span><span style="display:block; font-weight:bold; margin-top:4px;">{payload.get('cat_no', '')}</span></td>
-            <td style="border: 1px solid #d6d2c9; border-radius: 8px; padding: 10px 12px; background: #ffffff; width: 33%; vertical-align: top;"><span style="display:block; font-size:12px; color:#5c5c5c; text-transform:uppercase; letter-spacing:0.5px;">Year</span><span style="display:block; font-weight:bold; margin-top:4px;">{payload.get('year', '')}</span></td>
-          </tr>
-          <tr>
-            <td style="border: 1px solid #d6d2c9; border-radius: 8px; padding: 10px 12px; background: #ffffff; width: 33%; vertical-align: top;"><span style="display:block; font-size:12px; color:#5c5c5c; text-transform:uppercase; letter-spacing:0.5px;">Label</span><span style="display:block; font-weight:bold; margin-top:4px;">{get_label_info(release_data)}</span></td>
-            <td style="border: 1px solid #d6d2c9; border-radius: 8px; padding: 10px 12px; background: #ffffff; width: 33%; vertical-align: top;"><span style="display:block; font-size:12px; color:#5c5c5c; text-transform:uppercase; letter-spacing:0.5px;">Country</span><span style="display:block; font-weight:bold; margin-top:4px;">{get_release_attr(release_data, 'country', '')}</span></td>
-            <td style="border: 1px solid #d6d2c9; border-radius: 8px; padding: 10px 12px; background: #ffffff; width: 33%; vertical-align: top;"><span style="display:block; font-size:12px; color:#5c5c5c; text-transform:uppercase; letter-spacing:0.5px;">Barcode</span><span style="display:block; font-weight:bold; margin-top:4px;">{payload.get('barcode', '')}</span></td>
-          </tr>
-        </table>
-        <div style="border-top:1px dashed #d6d2c9; padding:14px 0;">
-          <div style="display:block;">
-            <strong style="font-size:16px; display:block;">Condition</strong>
-            <div style="font-size:14px; color:#5c5c5c; margin:6px 0 8px 0;">Graded under strong light.</div>
-            <div style="display:flex; gap:8px; flex-wrap:wrap;">
-              <span style="{_pill}">Vinyl: {GRADE_ABBREVIATIONS.get(payload.get('media_condition', ''), '')}</span>
-              <span style="{_pill}">Sleeve: {GRADE_ABBREVIATIONS.get(payload.get('sleeve_condition', ''), '')}</span>
-              {tags_pills_html}
-            </div>
-          </div>
-        </div>
-      </div>
-      {condition_notes_html}
-      {matrix_details_html}
-      {tracklist_section_html}
-      {store_promise_html}
-    </div>
-    """
-    final_html = '\n'.join([line.strip() for line in html_template.split('\n') if line.strip()])
-    
-    # Set the value in the main app's description widget
-    app.full_desc.delete("1.0", tk.END)
-    app.full_desc.insert("1.0", final_html)
+
+    # --- Assemble the final HTML (one line per block, matching the stored descriptions) ---
+    parts = [
+        _AT_HEADER_OPEN,
+        f'<td style="vertical-align: middle;"><h1 style="margin: 0; font-size: 20px; font-weight: bold; color: #1a1a1a;">{html.escape(payload.get("artist", ""), quote=False)} – {html.escape(payload.get("title", ""), quote=False)}</h1></td>',
+        _AT_HEADER_CLOSE,
+        _at_cell("Format", get_main_format(release_data)),
+        _at_cell("Cat No", payload.get('cat_no', '')),
+        _at_cell("Year", payload.get('year', '')),
+        "</tr>\n<tr>",
+        _at_cell("Label", get_label_info(release_data)),
+        _at_cell("Country", get_release_attr(release_data, 'country', '')),
+        _at_cell("Barcode", payload.get('barcode', '')),
+        _AT_CONDITION_OPEN,
+        f'<span style="{_AT_PILL}">Vinyl: {media_abbr}</span>',
+        f'<span style="{_AT_PILL}">Sleeve: {sleeve_abbr}</span>',
+    ]
+    if tags_pills_html:
+        parts.append(tags_pills_html)
+    parts.append(_AT_CONDITION_CLOSE)
+    if condition_notes:
+        parts.append(
+            '<div style="border-top:1px dashed #d6d2c9; padding:14px 0;"><strong>Condition Notes:</strong>'
+            f'<div style="font-size:14px; color:#5c5c5c; margin-top:8px;">{_html_nl(condition_notes)}</div></div>'
+        )
+    if matrix_text:
+        parts.append(
+            '<div style="border:1px solid #d6d2c9; border-radius:8px; padding:12px; background:#ffffff; margin-top:14px;">'
+            '<h3 style="margin:0 0 12px 0; font-size:16px; font-weight:bold;">Matrix / Runout Details</h3>'
+            f'<div style="font-size:14px; white-space:pre-wrap;">{_html_nl(matrix_text)}</div></div>'
+        )
+    if tracklist_section_html:
+        parts.append(tracklist_section_html)
+    parts.append(_AT_STORE_PROMISE)
+    parts.append("</div>")
+    return "\n".join(parts)
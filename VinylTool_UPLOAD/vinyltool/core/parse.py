@@ -3,10 +3,19 @@ from typing import *
 from typing import Tuple
 from vinyltool.core.logging import setup_logging
 logger = setup_logging('parse')
+import logging
 import re
 
 # Extracted helpers
 
+# A catno made only of 10-13 digits/spaces is really a barcode (UPC/EAN)
+_BARCODE_RE = re.compile(r'^\s*[\d\s]{10,13}\s*$')
+
+# Keywords that indicate a notes line is likely matrix/runout info (matched on lowercased text)
+_MATRIX_KW_RE = re.compile(r'\b(?:matrix|runout|etched|stamped|side [a-d])\b')
+# Cheap substring pre-check; a line must contain one of these before the regex runs
+_MATRIX_KW_HINTS = ('matrix', 'runout', 'etched', 'stamped', 'side ')
+
 def _extract_barcode_and_cat_no(app, release_data: dict) -> Tuple[str, str]:
 
     """
@@ -15,35 +24,36 @@ def _extract_barcode_and_cat_no(app, release_data: dict) -> Tuple[str, str]:
     if not release_data:
         return "", ""
 
-    explicit_barcodes = {
-        identifier.get('value', '').strip()
-        for identifier in release_data.get('identifiers', [])
-        if identifier.get('type', '').lower() == 'barcode' and identifier.get('value')
-    }
-
-    barcode_pattern = re.compile(r'^\s*[\d\s]{10,13}\s*$')
-
-    potential_cat_nos = {
-        label.get('catno', '').strip()
-        for label in release_data.get('labels', [])
-        if label.get('catno') and label.get('catno', '').strip().lower() != 'none'
-    }
-
-    heuristic_barcodes = {pcn for pcn in potential_cat_nos if barcode_pattern.match(pcn)}
+    explicit_barcodes = set()
+    for identifier in release_data.get('identifiers', ()):
+        if (identifier.get('type') or '').lower() == 'barcode':
+            value = (identifier.get('value') or '').strip()
+            if value:
+                explicit_barcodes.add(value)
+
+    # Collect catalog numbers and flag barcode-shaped ones in the same pass
+    potential_cat_nos = set()
+    heuristic_barcodes = set()
+    for label in release_data.get('labels', ()):
+        catno = (label.get('catno') or '').strip()
+        if catno and catno.lower() != 'none':
+            potential_cat_nos.add(catno)
+            if _BARCODE_RE.match(catno):
+                heuristic_barcodes.add(catno)
     
     true_cat_nos = potential_cat_nos - explicit_barcodes - heuristic_barcodes
     
     all_barcodes = explicit_barcodes.union(heuristic_barcodes)
 
-    main_barcode = sorted(list(explicit_barcodes))[0] if explicit_barcodes else \
-                   sorted(list(all_barcodes))[0] if all_barcodes else ""
+    main_barcode = min(explicit_barcodes) if explicit_barcodes else \
+                   (min(all_barcodes) if all_barcodes else "")
 
     if not true_cat_nos and potential_cat_nos:
          final_cat_nos = potential_cat_nos - all_barcodes
     else:
          final_cat_nos = true_cat_nos
     
-    final_cat_no_str = ", ".join(sorted(list(final_cat_nos)))
+    final_cat_no_str = ", ".join(sorted(final_cat_nos))
 
     return main_barcode.replace(" ", ""), final_cat_no_str
 
@@ -61,17 +71,20 @@ def _extract_matrix_info(release_data: dict) -> str:
 
         # --- Stage 1: Prioritize the structured `identifiers` field ---
         structured_matrix = []
-        for identifier in release_data.get('identifiers', []):
-            if identifier.get('type') == 'Matrix / Runout':
-                desc = identifier.get('description', '').strip()
-                value = identifier.get('value', '').strip()
-                if value:
-                    # Format nicely: "Side A, variant 1: XXX-123"
-                    line = f"{desc}: {value}" if desc else value
-                    structured_matrix.append(line)
+        append = structured_matrix.append
+        for identifier in release_data.get('identifiers', ()):
+            if identifier.get('type') != 'Matrix / Runout':
+                continue
+            value = (identifier.get('value') or '').strip()
+            if not value:
+                continue
+            desc = (identifier.get('description') or '').strip()
+            # Format nicely: "Side A, variant 1: XXX-123"
+            append(f"{desc}: {value}" if desc else value)
         
         if structured_matrix:
-            logger.info(f"Found {len(structured_matrix)} structured matrix entries.")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Found %d structured matrix entries.", len(structured_matrix))
             return "\n".join(structured_matrix)
 
         # --- Stage 2: Fallback to parsing the unstructured `notes` field ---
@@ -80,34 +93,31 @@ def _extract_matrix_info(release_data: dict) -> str:
         if not notes_text:
             return ""
 
-        lines = notes_text.splitlines()
         matrix_lines = []
         in_matrix_block = False
 
-        # Keywords that indicate a line is likely matrix/runout info
-        matrix_keywords = ['matrix', 'runout', 'etched', 'stamped', 'side a', 'side b', 'side c', 'side d']
-
-        for line in lines:
-            line_lower = line.lower().strip()
-            if not line_lower:
+        for line in notes_text.splitlines():
+            stripped = line.strip()
+            if not stripped:
                 in_matrix_block = False  # Blank line ends a block
                 continue
+            line_lower = stripped.lower()
 
             # Check for the explicit "Matrix / Runout:" header
             if line_lower.startswith('matrix / runout'):
                 in_matrix_block = True
                 # Add the line itself, but strip the label
-                matrix_part = line.split(':', 1)[-1].strip()
+                matrix_part = stripped.split(':', 1)[-1].strip()
                 if matrix_part:
                     matrix_lines.append(matrix_part)
                 continue
 
             if in_matrix_block:
-                matrix_lines.append(line.strip())
+                matrix_lines.append(stripped)
             else:
                 # Check if a line contains any of our keywords, but not as part of a larger word
-                if any(re.search(r'\b' + re.escape(kw) + r'\b', line_lower) for kw in matrix_keywords):
-                    matrix_lines.append(line.strip())
+                if any(kw in line_lower for kw in _MATRIX_KW_HINTS) and _MATRIX_KW_RE.search(line_lower):
+                    matrix_lines.append(stripped)
 
         return "\n".join(matrix_lines).strip()
 
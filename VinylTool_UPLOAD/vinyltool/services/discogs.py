@@ -1,5 +1,6 @@
 from __future__ import annotations
-import requests, json, logging, sys, os, time, re
+import requests, json, logging, sys, os, time, re, random, threading
+from requests.adapters import HTTPAdapter
 from vinyltool.core.logging import setup_logging
 from vinyltool.core.config import Config
 import secrets
@@ -11,6 +12,7 @@ import datetime
 import hmac
 import hashlib
 import base64
+from collections import OrderedDict
 logger = setup_logging('discogs')
 from tkinter import messagebox
 import discogs_client
@@ -18,6 +20,10 @@ import discogs_client
 
 class DiscogsAPI:
 
+    RELEASE_CACHE_SIZE = 256
+    PRICE_CACHE_SIZE = 4096
+    PRICE_CACHE_TTL = 24 * 60 * 60  # seconds; marketplace suggestions drift slowly
+
     def _safe_json(self, resp):
         try:
             return resp.json() if resp is not None else {}
@@ -34,8 +40,16 @@ class DiscogsAPI:
         self.config = config
         self.client = None
         self.rate_limit_sleep = 1.2
-        self.release_cache = {}
-        self.price_cache = {}
+        self.release_cache = OrderedDict()  # LRU, at most RELEASE_CACHE_SIZE releases
+        self._release_cache_lock = threading.Lock()  # get_release runs on worker threads
+        self.price_cache = OrderedDict()  # LRU of release_id -> (fetched_at, suggestions)
+        self._price_cache_lock = threading.Lock()
+        # OAuth1 pieces that only change with the credentials; see _init_client
+        self._oauth_static_params = None  # ((consumer_key, oauth_token), params)
+        self._oauth_signing_keys = {}  # (consumer_secret, token_secret) -> HMAC key
+        # Keep-alive pool shared by every direct API call; retries stay in _make_request
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
         self._init_client()
     
     def _init_client(self):
@@ -44,6 +58,10 @@ class DiscogsAPI:
     
         cfg = Config().load()
     
+        # Credentials are (re)read here, so drop anything derived from the old ones
+        self._oauth_static_params = None
+        self._oauth_signing_keys = {}
+    
         consumer_key = None or ""
     
         consumer_secret = None or ""
@@ -92,8 +110,16 @@ class DiscogsAPI:
     
     def search(self, params: dict) -> list:
         """Search Discogs database"""
+        return self.search_page(params)[0]
+    
+    def search_page(self, params: dict) -> tuple:
+        """Search Discogs database; returns (results, pagination).
+        
+        pagination is the response's own block ({"page": .., "pages": .., ...}),
+        taken before the vinyl filter so callers can tell whether more pages exist.
+        """
         if not self.is_connected():
-            return []
+            return [], {}
         
         try:
             params = dict(params or {})
@@ -107,23 +133,32 @@ class DiscogsAPI:
                 params=params
             )
             
-            results = response.json().get("results", [])
+            data = response.json()
+            results = data.get("results", [])
             
             if self.config.get("enforce_vinyl"):
                 results = self._filter_vinyl(results)
             
-            return results
+            return results, data.get("pagination") or {}
             
         except Exception as e:
             logger.error(f"Discogs search failed: {e}")
-            return []
+            return [], {}
     
     def get_release(self, release_id: int) -> Optional[dict]:
         """Get release details"""
+        # Tree rows hand us "123" while release data carries 123; key both the same way
+        try:
+            release_id = int(release_id)
+        except (TypeError, ValueError):
+            pass
         cache_key = (release_id, self.config.get("preferred_currency"))
         
-        if cache_key in self.release_cache:
-            return self.release_cache[cache_key]
+        with self._release_cache_lock:
+            cached = self.release_cache.get(cache_key)
+            if cached is not None:
+                self.release_cache.move_to_end(cache_key)
+                return cached
         
         try:
             response = self._make_request(
@@ -131,7 +166,10 @@ class DiscogsAPI:
                 params={"curr_abbr": self.config.get("preferred_currency", "GBP")}
             )
             data = response.json()
-            self.release_cache[cache_key] = data
+            with self._release_cache_lock:
+                self.release_cache[cache_key] = data
+                if len(self.release_cache) > self.RELEASE_CACHE_SIZE:
+                    self.release_cache.popitem(last=False)
             return data
         except Exception as e:
             logger.error(f"Failed to get release {release_id}: {e}")
@@ -139,15 +177,26 @@ class DiscogsAPI:
     
     def get_price_suggestions(self, release_id: int) -> Optional[dict]:
         """Get price suggestions for a release"""
-        if release_id in self.price_cache:
-            return self.price_cache[release_id]
+        try:
+            release_id = int(release_id)
+        except (TypeError, ValueError):
+            pass
+        with self._price_cache_lock:
+            cached = self.price_cache.get(release_id)
+            if cached is not None and time.monotonic() - cached[0] < self.PRICE_CACHE_TTL:
+                self.price_cache.move_to_end(release_id)
+                return cached[1]
         
         try:
             response = self._make_request(
                 f"https://api.discogs.com/marketplace/price_suggestions/{release_id}"
             )
             data = response.json()
-            self.price_cache[release_id] = data
+            with self._price_cache_lock:
+                self.price_cache[release_id] = (time.monotonic(), data)
+                self.price_cache.move_to_end(release_id)
+                if len(self.price_cache) > self.PRICE_CACHE_SIZE:
+                    self.price_cache.popitem(last=False)
             return data
         except Exception as e:
             logger.error(f"Failed to get price suggestions: {e}")
@@ -172,7 +221,7 @@ class DiscogsAPI:
                 'Content-Type': 'application/json'
             }
             
-            response = requests.post(url, json=listing_data, headers=headers, timeout=30)
+            response = self.session.post(url, json=listing_data, headers=headers, timeout=30)
             
             if response.status_code == 201:
                 return response.json().get('listing_id') # CORRECTED KEY
@@ -213,6 +262,16 @@ class DiscogsAPI:
             logger.error(f"Failed to get inventory: {e}")
             return []
     
+    def iter_inventory(self):
+        """Yield the user's inventory listings as each page arrives.
+
+        Unlike get_inventory, failures propagate: a partial listing must not be
+        mistaken for the complete inventory by callers that diff against it.
+        """
+        if not self.is_connected():
+            raise RuntimeError("Discogs client is not connected")
+        yield from self.client.identity().inventory
+    
     def get_orders(self, status_filter=None):
         """Get user's orders"""
         if not self.is_connected():
@@ -247,7 +306,7 @@ class DiscogsAPI:
                 'Content-Type': 'application/json'
             }
             
-            response = requests.post(url, json=data, headers=headers, timeout=30)
+            response = self.session.post(url, json=data, headers=headers, timeout=30)
             return response.status_code in [200, 204]
             
         except Exception as e:
@@ -266,20 +325,20 @@ class DiscogsAPI:
         if token:
             headers["Authorization"] = f"Discogs token={token}"
         
-        session = requests.Session()
-        session.headers.update(headers)
-        
         for attempt in range(max_retries):
             try:
-                response = session.get(url, params=params or {}, timeout=30)
+                response = self.session.get(url, params=params or {}, headers=headers, timeout=30)
                 
                 if response.status_code == 429:
-                    sleep_time = int(response.headers.get("Retry-After", 3))
-                    time.sleep(sleep_time)
+                    try:
+                        sleep_time = float(response.headers.get("Retry-After", 0))
+                    except ValueError:
+                        sleep_time = 0
+                    time.sleep(max(sleep_time, self._backoff_delay(attempt)))
                     continue
                 
                 if 500 <= response.status_code < 600:
-                    time.sleep(1.2 * (attempt + 1))
+                    time.sleep(self._backoff_delay(attempt))
                     continue
                 
                 response.raise_for_status()
@@ -289,7 +348,13 @@ class DiscogsAPI:
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise
-                time.sleep(1.2 * (attempt + 1))
+                time.sleep(self._backoff_delay(attempt))
+    
+    @staticmethod
+    def _backoff_delay(attempt: int, base: float = 1.2, cap: float = 16.0) -> float:
+        """Capped exponential backoff with jitter (1.2s, 2.4s, 4.8s ... <= 16s)."""
+        delay = min(cap, base * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
     
     def _filter_vinyl(self, results: list) -> list:
         """Filter results to only include vinyl"""
@@ -301,14 +366,23 @@ class DiscogsAPI:
     
     def _generate_oauth_params(self) -> dict:
         """Generate OAuth1 parameters"""
-        return {
-            'oauth_consumer_key': self.config.get("discogs_consumer_key"),
-            'oauth_token': self.config.get("discogs_oauth_token"),
-            'oauth_signature_method': 'HMAC-SHA1',
-            'oauth_timestamp': str(int(time.time())),
-            'oauth_nonce': secrets.token_hex(16),
-            'oauth_version': '1.0'
-        }
+        # Consumer key/token are fixed per session; only timestamp and nonce
+        # must be fresh for each wire attempt.
+        consumer_key = self.config.get("discogs_consumer_key")
+        oauth_token = self.config.get("discogs_oauth_token")
+        static = self._oauth_static_params
+        if static is None or static[0] != (consumer_key, oauth_token):
+            static = ((consumer_key, oauth_token), {
+                'oauth_consumer_key': consumer_key,
+                'oauth_token': oauth_token,
+                'oauth_signature_method': 'HMAC-SHA1',
+                'oauth_version': '1.0'
+            })
+            self._oauth_static_params = static
+        params = dict(static[1])
+        params['oauth_timestamp'] = str(int(time.time()))
+        params['oauth_nonce'] = secrets.token_hex(16)
+        return params
     
     def _create_oauth_signature(self, method: str, url: str, params: dict,
                                 consumer_secret: str, token_secret: str) -> str:
@@ -316,9 +390,13 @@ class DiscogsAPI:
         sorted_params = sorted(params.items())
         param_string = urllib.parse.urlencode(sorted_params)
         base_string = f"{method}&{urllib.parse.quote(str(url), safe='')}&{urllib.parse.quote(str(param_string), safe='')}"
-        signing_key = f"{urllib.parse.quote(str(consumer_secret) if consumer_secret else '', safe='')}&{urllib.parse.quote(str(token_secret) if token_secret else '', safe='')}"
+        key_cache = self._oauth_signing_keys
+        signing_key = key_cache.get((consumer_secret, token_secret))
+        if signing_key is None:
+            signing_key = f"{urllib.parse.quote(str(consumer_secret) if consumer_secret else '', safe='')}&{urllib.parse.quote(str(token_secret) if token_secret else '', safe='')}".encode()
+            key_cache[(consumer_secret, token_secret)] = signing_key
         signature = base64.b64encode(
-            hmac.new(signing_key.encode(), base_string.encode(), hashlib.sha1).digest()
+            hmac.new(signing_key, base_string.encode(), hashlib.sha1).digest()
         ).decode()
         return signature
     
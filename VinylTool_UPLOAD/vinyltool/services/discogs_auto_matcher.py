@@ -7,6 +7,41 @@ from vinyltool.services.discogs import DiscogsAPI
 import re
 import time
 
+# Title patterns are compiled once at import; _extract_identifiers runs for every eBay item
+_YEAR_RE = re.compile(r'\b(19[5-9]\d|20[0-2]\d)\b')
+_COUNTRY_RES = [(country, re.compile(pattern, re.IGNORECASE)) for country, pattern in (
+    ("UK", r'\b(UK|United Kingdom|British)\b'),
+    ("US", r'\b(US|USA|American)\b'),
+    ("EU", r'\b(EU|Europe|European)\b'),
+    ("DE", r'\b(German|Germany|Deutsche)\b'),
+    ("FR", r'\b(French|France)\b'),
+    ("JP", r'\b(Japan|Japanese)\b'),
+    ("CA", r'\b(Canada|Canadian)\b'),
+    ("AU", r'\b(Australia|Australian)\b'),
+)]
+# Catalog number (various formats)
+# Examples: SHVL 804, 2C 068-04914, PCS 7169, ILPS 9085
+_CAT_RES = [
+    re.compile(r'\b([A-Z]{2,4}[- ]?\d{3,6})\b'),  # SHVL 804, PCS7169
+    re.compile(r'\b(\d[A-Z]\s?\d{3}-?\d{5})\b'),  # 2C 068-04914
+]
+_BARCODE_RE = re.compile(r'\b(\d{12,13})\b')
+# Record labels (common ones)
+_LABEL_RES = [(label, re.compile(r'\b' + label + r'\b', re.IGNORECASE)) for label in (
+    "EMI", "Columbia", "Parlophone", "Capitol", "Atlantic", "Warner",
+    "Polydor", "Island", "Virgin", "Apple", "RCA", "Decca", "Mercury")]
+_PRESSING_RES = [(key, re.compile(pattern, re.IGNORECASE)) for key, pattern in (
+    ("first_press", r'\b(1st|first)\s+(press|pressing|edition)\b'),
+    ("original", r'\b(original|orig)\s+(press|pressing)?\b'),
+    ("reissue", r'\b(reissue|remaster|re-issue)\b'),
+    ("promo", r'\b(promo|promotional|white label)\b'),
+    ("test_pressing", r'\b(test pressing|TP)\b'),
+)]
+_TITLE_NOISE_RES = [re.compile(r'\b' + re.escape(noise) + r'\b', re.IGNORECASE) for noise in (
+    "Vinyl", "LP", "12\"", "7\"", "Record", "Album",
+    "NEW", "SEALED", "MINT", "VG", "EX", "***", "🔥")]
+_ALBUM_EXTRA_RE = re.compile(r'\s*[\(\[]')
+
 class DiscogsAutoMatcher:
     """Find Discogs releases for eBay items using multiple identifiers"""
     
@@ -94,59 +129,35 @@ class DiscogsAutoMatcher:
         identifiers["album"] = album
         
         # Year (4 digits: 1950-2025)
-        year_match = re.search(r'\b(19[5-9]\d|20[0-2]\d)\b', title)
+        year_match = _YEAR_RE.search(title)
         identifiers["year"] = int(year_match.group(1)) if year_match else None
         
         # Country codes
-        country_patterns = {
-            "UK": r'\b(UK|United Kingdom|British)\b',
-            "US": r'\b(US|USA|American)\b',
-            "EU": r'\b(EU|Europe|European)\b',
-            "DE": r'\b(German|Germany|Deutsche)\b',
-            "FR": r'\b(French|France)\b',
-            "JP": r'\b(Japan|Japanese)\b',
-            "CA": r'\b(Canada|Canadian)\b',
-            "AU": r'\b(Australia|Australian)\b',
-        }
-        for country, pattern in country_patterns.items():
-            if re.search(pattern, title, re.IGNORECASE):
+        for country, pattern in _COUNTRY_RES:
+            if pattern.search(title):
                 identifiers["country"] = country
                 break
         
         # Catalog number (various formats)
-        # Examples: SHVL 804, 2C 068-04914, PCS 7169, ILPS 9085
-        cat_patterns = [
-            r'\b([A-Z]{2,4}[- ]?\d{3,6})\b',  # SHVL 804, PCS7169
-            r'\b(\d[A-Z]\s?\d{3}-?\d{5})\b',  # 2C 068-04914
-        ]
-        for pattern in cat_patterns:
-            match = re.search(pattern, title)
+        for pattern in _CAT_RES:
+            match = pattern.search(title)
             if match:
                 identifiers["catalog_number"] = match.group(1).replace(" ", "")
                 break
         
         # Barcode (12-13 digits)
-        barcode_match = re.search(r'\b(\d{12,13})\b', title)
+        barcode_match = _BARCODE_RE.search(title)
         identifiers["barcode"] = barcode_match.group(1) if barcode_match else None
         
         # Record labels (common ones)
-        labels = ["EMI", "Columbia", "Parlophone", "Capitol", "Atlantic", "Warner", 
-                  "Polydor", "Island", "Virgin", "Apple", "RCA", "Decca", "Mercury"]
-        for label in labels:
-            if re.search(r'\b' + label + r'\b', title, re.IGNORECASE):
+        for label, pattern in _LABEL_RES:
+            if pattern.search(title):
                 identifiers["label"] = label
                 break
         
         # Pressing notes
-        pressing_patterns = {
-            "first_press": r'\b(1st|first)\s+(press|pressing|edition)\b',
-            "original": r'\b(original|orig)\s+(press|pressing)?\b',
-            "reissue": r'\b(reissue|remaster|re-issue)\b',
-            "promo": r'\b(promo|promotional|white label)\b',
-            "test_pressing": r'\b(test pressing|TP)\b',
-        }
-        for key, pattern in pressing_patterns.items():
-            if re.search(pattern, title, re.IGNORECASE):
+        for key, pattern in _PRESSING_RES:
+            if pattern.search(title):
                 identifiers["pressing_note"] = key
                 break
         
@@ -156,9 +167,8 @@ class DiscogsAutoMatcher:
         """Extract artist and album from title"""
         # Remove noise
         clean = title
-        for noise in ["Vinyl", "LP", "12\"", "7\"", "Record", "Album", 
-                      "NEW", "SEALED", "MINT", "VG", "EX", "***", "🔥"]:
-            clean = re.sub(r'\b' + re.escape(noise) + r'\b', '', clean, flags=re.IGNORECASE)
+        for noise in _TITLE_NOISE_RES:
+            clean = noise.sub('', clean)
         
         # Try separators
         for sep in [" - ", " – ", " — ", ":"]:
@@ -168,7 +178,7 @@ class DiscogsAutoMatcher:
                 album = parts[1].strip()
                 
                 # Clean album (remove extra info in parentheses/brackets)
-                album = re.split(r'\s*[\(\[]', album)[0].strip()
+                album = _ALBUM_EXTRA_RE.split(album, 1)[0].strip()
                 
                 if len(artist) > 1 and len(album) > 1:
                     return (artist, album)
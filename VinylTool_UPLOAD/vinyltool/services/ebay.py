@@ -1,9 +1,24 @@
 from __future__ import annotations
 import base64
 import requests, json, logging, sys, os, time, re
+from requests.adapters import HTTPAdapter
 from vinyltool.core.logging import setup_logging
 logger = setup_logging('ebay')
 from vinyltool.core.config import Config
+from concurrent.futures import ThreadPoolExecutor
+
+# Description sanitising for eBay: drop non-content blocks, then collapse whitespace in one scan
+_EBAY_DESC_STRIP_RES = (
+    re.compile(r"(?is)<(meta|style|script)\b.*?>.*?</\1>"),
+    re.compile(r"(?is)<!--.*?-->"),
+    re.compile(r"(?is)<head\b.*?>.*?</head>"),
+)
+_EBAY_DESC_WS_RE = re.compile(r"\s+")
+
+# Media API uploads are independent HTTP POSTs; four at a time keeps well inside eBay's rate limits
+_IMAGE_UPLOAD_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ebay-upload")
+
+_SELL_ITEM_DRAFT_SCOPE = "https://api.ebay.com/oauth/api_scope/sell.item.draft"
 
 class EbayAPI:
     """eBay REST API wrapper"""
@@ -17,10 +32,15 @@ class EbayAPI:
         returns HTTP 404.  See documentation for the limited release Listing API
         which also requires the `sell.item.draft` OAuth scope.
         """
-        token = self.get_access_token()
+        # That scope is not in the default set; ensure_token fetches a separate token for
+        # it (one refresh the first time) and reuses it until it expires
+        token = self.ensure_token((_SELL_ITEM_DRAFT_SCOPE,))
         if not token:
-            return {"success": False, "error": "No access token"}
-        import requests
+            error = "No access token"
+            if _SELL_ITEM_DRAFT_SCOPE in self._refused_scopes:
+                error = ("eBay refused the sell.item.draft scope for the stored refresh token; "
+                         "re-authorize eBay with that scope to create drafts")
+            return {"success": False, "error": error, "body": {"error": error}}
         # Use v1_beta path to avoid 404 errors on the beta Listing API
         url = f"{self.base_url}/sell/listing/v1_beta/item_draft"
         headers = {
@@ -51,7 +71,7 @@ class EbayAPI:
         pics = listing_data.get("imageUrls") or listing_data.get("image_urls") or listing_data.get("pictures")
         if pics and isinstance(pics, list):
             payload["pictures"] = [{"imageUrl": u} for u in pics if u]
-        resp = requests.post(url, headers=headers, json=payload, timeout=30)
+        resp = self.session.post(url, headers=headers, json=payload, timeout=30)
         try:
             body = resp.json()
         except Exception:
@@ -436,7 +456,15 @@ class EbayAPI:
         self.root_tk = root_tk
         self.access_token: Optional[str] = None
         self.token_expires: float = 0.0
+        self.token_scopes: frozenset = frozenset()  # scopes the cached token was issued for
+        # Tokens for scopes outside _get_scopes(): frozenset of extra scopes -> (token, expires)
+        self._scoped_tokens: dict[frozenset, tuple[str, float]] = {}
+        self._refused_scopes: set[str] = set()  # extra scopes the refresh token was not granted
         self.sandbox = False
+        # Keep-alive pool so per-SKU publish calls reuse TLS connections. No adapter
+        # retries: a replayed offer POST could create a duplicate listing
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
         self._init_urls()
 
     def _init_urls(self) -> None:
@@ -464,6 +492,63 @@ class EbayAPI:
             "https://api.ebay.com/oauth/api_scope/commerce.identity.readonly",
         ]
 
+    def ensure_token(self, required_scopes=()) -> Optional[str]:
+        """Return a valid access token covering required_scopes.
+
+        Scopes in _get_scopes() use the shared token. Any others get a separate token
+        from a refresh-token grant, cached until it expires; the shared scope list is
+        left alone so other calls never ask eBay for them. This never starts the
+        interactive auth flow, so it is safe to call from worker threads.
+        """
+        extra = frozenset(required_scopes) - set(self._get_scopes())
+        if not extra:
+            return self.get_access_token()
+        cached = self._scoped_tokens.get(extra)
+        if cached and time.time() < cached[1]:
+            return cached[0]
+        if extra & self._refused_scopes:
+            return None
+        token_data = self._refresh_for_scopes([*self._get_scopes(), *sorted(extra)], extra)
+        if not token_data:
+            return None
+        token = token_data["access_token"]
+        self._scoped_tokens[extra] = (token, time.time() + token_data["expires_in"] - 60)
+        return token
+
+    def _refresh_for_scopes(self, scopes: list[str], extra: frozenset) -> Optional[dict]:
+        """Refresh-token grant for scopes; returns the token response or None."""
+        app_id = self.config.get("ebay_app_id")
+        cert_id = self.config.get("ebay_cert_id")
+        refresh_token = self.config.get("ebay_refresh_token")
+        if not all([app_id, cert_id, refresh_token]):
+            logger.error("Missing eBay credentials or refresh token; cannot request extra scopes.")
+            return None
+        encoded_credentials = base64.b64encode(f"{app_id}:{cert_id}".encode()).decode()
+        headers = {
+            "Authorization": f"Basic {encoded_credentials}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        data = {
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "scope": " ".join(scopes),
+        }
+        try:
+            response = self.session.post(self.auth_url, headers=headers, data=data, timeout=30)
+        except requests.RequestException as e:
+            logger.error(f"Error refreshing token for {sorted(extra)}: {e}")
+            return None
+        if response.status_code == 200:
+            logger.info("Obtained eBay access token for %s.", ", ".join(sorted(extra)))
+            return response.json()
+        if self._safe_json(response).get("error") == "invalid_scope":
+            # Not granted to this refresh token; stop asking until the user re-authorizes
+            self._refused_scopes |= extra
+        logger.error(
+            f"Failed to refresh token for {sorted(extra)} (status {response.status_code}): {response.text}"
+        )
+        return None
+
     def _get_auth_code(self) -> Optional[str]:
         """Prompt the user via a browser flow to obtain an authorization code."""
         app_id = self.config.get("ebay_app_id")
@@ -507,6 +592,7 @@ class EbayAPI:
         # Return cached token if still valid
         if self.access_token and time.time() < self.token_expires:
             return self.access_token
+        scopes = self._get_scopes()
         app_id = self.config.get("ebay_app_id")
         cert_id = self.config.get("ebay_cert_id")
         ru_name = self.config.get("ebay_ru_name")
@@ -525,14 +611,15 @@ class EbayAPI:
             data = {
                 "grant_type": "refresh_token",
                 "refresh_token": refresh_token,
-                "scope": " ".join(self._get_scopes()),
+                "scope": " ".join(scopes),
             }
             try:
-                response = requests.post(self.auth_url, headers=headers, data=data, timeout=30)
+                response = self.session.post(self.auth_url, headers=headers, data=data, timeout=30)
                 if response.status_code == 200:
                     token_data = response.json()
                     self.access_token = token_data["access_token"]
                     self.token_expires = time.time() + token_data["expires_in"] - 60
+                    self.token_scopes = frozenset(scopes)
                     logger.info("Successfully refreshed eBay access token.")
                     return self.access_token
                 else:
@@ -552,15 +639,17 @@ class EbayAPI:
             "redirect_uri": ru_name,
         }
         try:
-            response = requests.post(self.auth_url, headers=headers, data=data, timeout=30)
+            response = self.session.post(self.auth_url, headers=headers, data=data, timeout=30)
             if response.status_code == 200:
                 token_data = response.json()
                 self.access_token = token_data["access_token"]
                 self.token_expires = time.time() + token_data["expires_in"] - 60
+                self.token_scopes = frozenset(scopes)
                 # Save new refresh token if provided
                 new_refresh_token = token_data.get("refresh_token")
                 if new_refresh_token:
                     self.config.save({"ebay_refresh_token": new_refresh_token})
+                    self._refused_scopes.clear()  # a new grant may cover them
                     logger.info("Successfully obtained new eBay access and refresh tokens.")
                 return self.access_token
             else:
@@ -587,13 +676,11 @@ class EbayAPI:
     def _sanitize_ebay_description(self, html: str, max_len: int = 3800) -> str:
         """Sanitize and truncate HTML descriptions for eBay compatibility."""
         try:
-            import re as _re
             if not html:
                 return ""
-            html = _re.sub(r"(?is)<(meta|style|script)\b.*?>.*?</\1>", "", html or "")
-            html = _re.sub(r"(?is)<!--.*?-->", "", html)
-            html = _re.sub(r"(?is)<head\b.*?>.*?</head>", "", html)
-            html = _re.sub(r"\\s+", " ", html).strip()
+            for pattern in _EBAY_DESC_STRIP_RES:
+                html = pattern.sub("", html)
+            html = _EBAY_DESC_WS_RE.sub(" ", html).strip()
             return html[:max_len]
         except Exception:
             return (html or "")[:max_len]
@@ -612,18 +699,28 @@ class EbayAPI:
             except Exception:
                 pass
         logger.info("[images] Local paths to upload: %d", len(local_paths))
-        collected: list[str] = []
-        for p in local_paths[:12]:
+        return self._upload_images(local_paths[:12], sku)
+
+    def _upload_images(self, paths: list, sku: str) -> list[str]:
+        """Upload local images concurrently; returns the EPS URLs in the original order."""
+        if not paths:
+            return []
+        # Refresh the token once up front so the parallel uploads don't race to refresh it
+        self.get_access_token()
+
+        def upload(p):
             try:
                 url = self.upload_image(p, sku)
                 if url:
-                    collected.append(url)
                     logger.info(f"[images] Successfully processed {os.path.basename(p)} -> {url}")
                 else:
                     logger.warning(f"[images] Failed to upload {os.path.basename(p)} after retries.")
+                return url
             except Exception as e:
                 logger.error(f"[images] Exception during upload process for {os.path.basename(p)}: {e}")
-        return collected
+                return None
+
+        return [url for url in _IMAGE_UPLOAD_POOL.map(upload, paths) if url]
 
     def _get_condition_policy(self, marketplace_id: str, primary_category_id: str) -> dict:
         """Fetch item condition policies for a marketplace/category. Returns {} on failure."""
@@ -637,7 +734,7 @@ class EbayAPI:
                 "Authorization": f"Bearer {token}",
                 "Accept": "application/json",
             }
-            r = requests.get(url, headers=headers, params=params, timeout=20)
+            r = self.session.get(url, headers=headers, params=params, timeout=20)
             if r.status_code == 200:
                 return r.json() or {}
             else:
@@ -761,7 +858,7 @@ class EbayAPI:
                     # Retry with backoff for transient 5xx (esp. 503)
                     backoff = 1.0
                     for attempt in range(1, 6):
-                        resp = requests.post(media_upload_url, headers=headers, data=encoder, timeout=60)
+                        resp = self.session.post(media_upload_url, headers=headers, data=encoder, timeout=60)
                         if resp.status_code == 201:
                             # Prefer JSON body, else fall back to Location header + GET
                             try:
@@ -786,7 +883,7 @@ class EbayAPI:
                                         get_url = loc
                                     else:
                                         get_url = f"https://apim.ebay.com/commerce/media/v1_beta/image/{loc.strip().split('/')[-1]}"
-                                    get_resp = requests.get(get_url, headers=get_headers, timeout=30)
+                                    get_resp = self.session.get(get_url, headers=get_headers, timeout=30)
                                     if get_resp.status_code == 200 and get_resp.json().get("imageUrl"):
                                         return get_resp.json()["imageUrl"]
                                     else:
@@ -825,15 +922,18 @@ class EbayAPI:
                 logger.error(f"[images] Exception during upload: {e}", exc_info=True)
                 return None
 
-    def create_draft_listing(self, listing_data):
+    def create_draft_listing(self, listing_data, inventory_item_done=False):
 
         """
 
         Compatibility wrapper: use Inventory API offer upsert+publish and return a familiar shape.
 
+        Pass inventory_item_done=True when the item was already created by
+        bulk_create_or_replace_inventory_items.
+
         """
 
-        res = self.upsert_offer_and_publish(listing_data)
+        res = self.upsert_offer_and_publish(listing_data, inventory_item_done=inventory_item_done)
 
         if res.get("success"):
 
@@ -841,6 +941,105 @@ class EbayAPI:
 
         return {"success": False, "error": res.get("error")}
 
+    def _build_inventory_item(self, listing_data: dict, image_urls: list) -> dict:
+        """Build the Inventory API inventory item body (condition, product, availability)."""
+        from vinyltool.core.constants import EBAY_INVENTORY_CONDITION_MAP
+
+        media_cond = listing_data.get("media_condition") or "Very Good"
+        sleeve_cond = listing_data.get("sleeve_condition") or "Very Good"
+        title = listing_data.get("title") or "Vinyl Record"
+        # Plain text summary for the inventory item (eBay limit: 4000 chars);
+        # the full HTML goes on the offer
+        plain_summary = re.sub(r'<[^>]+>', ' ', listing_data.get("description") or "Vinyl LP")
+        plain_summary = re.sub(r'\s+', ' ', plain_summary).strip()[:3900]
+        product = {
+            "title": title[:80],
+            "description": plain_summary,
+            "aspects": {
+                "Media Condition": [media_cond],
+                "Sleeve Condition": [sleeve_cond],
+                "Format": [listing_data.get("format", "LP") or "LP"],
+                "Artist": [listing_data.get("artist") or "Unknown Artist"],
+                "Release Title": [listing_data.get("release_title") or listing_data.get("title") or "Unknown Album"],
+                "Release Year": [str(listing_data.get("year") or listing_data.get("release_year") or "Unknown")],
+            },
+        }
+        # Only add imageUrls if we have them
+        if image_urls:
+            product["imageUrls"] = list(image_urls)[:12]
+        return {
+            "condition": EBAY_INVENTORY_CONDITION_MAP.get(media_cond, "USED_GOOD"),
+            "product": product,
+            "availability": {"shipToLocationAvailability": {"quantity": listing_data.get("quantity", 1)}},
+        }
+
+    def bulk_create_or_replace_inventory_items(self, listing_data_list: list[dict]) -> list[dict]:
+        """
+        Create/replace inventory items in batches of 25 via the Inventory API
+        bulkCreateOrReplaceInventoryItem call (one HTTP request per batch).
+
+        Local images are uploaded first when a listing has no eBay URLs yet.
+        Returns one result per SKU: {sku, success, statusCode?, error?}.
+        Follow up with create_draft_listing(..., inventory_item_done=True)
+        for the SKUs that succeeded.
+        """
+        results: list[dict] = []
+        requests_body: list[dict] = []
+        for listing_data in listing_data_list or []:
+            sku = (listing_data or {}).get("sku")
+            if not sku:
+                results.append({"sku": None, "success": False, "error": "Missing SKU"})
+                continue
+            image_urls = listing_data.get("imageUrls") or self._collect_image_urls(listing_data, sku)
+            item = self._build_inventory_item(listing_data, image_urls)
+            item.update(sku=sku, locale="en_GB")
+            requests_body.append(item)
+
+        if not requests_body:
+            return results
+
+        token = self.get_access_token()
+        if not token:
+            return results + [{"sku": r["sku"], "success": False, "error": "No access token"} for r in requests_body]
+
+        url = f"{self.base_url}/sell/inventory/v1/bulk_create_or_replace_inventory_item"
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Accept-Language": "en-GB",
+            "Content-Language": "en-GB",
+        }
+        for start in range(0, len(requests_body), 25):
+            batch = requests_body[start:start + 25]
+            try:
+                resp = self.session.post(url, headers=headers, json={"requests": batch}, timeout=60)
+            except Exception as e:
+                logger.error(f"[inventory] Bulk request failed: {e}")
+                results.extend({"sku": r["sku"], "success": False, "error": str(e)} for r in batch)
+                continue
+            # 200 = all succeeded, 207 = multi-status; anything else failed outright
+            if resp.status_code not in (200, 207):
+                err = resp.text[:500]
+                logger.error(f"[inventory] Bulk request FAILED {resp.status_code}: {err}")
+                results.extend({"sku": r["sku"], "success": False, "statusCode": resp.status_code, "error": err} for r in batch)
+                continue
+            for item in (self._safe_json(resp).get("responses") or []):
+                code = item.get("statusCode")
+                errors = item.get("errors") or []
+                results.append({
+                    "sku": item.get("sku"),
+                    "success": code in (200, 201, 204),
+                    "statusCode": code,
+                    "error": "; ".join(str(e.get("message") or e) for e in errors) if errors else None,
+                })
+            logger.info(f"[inventory] Bulk upserted batch of {len(batch)} items ({resp.status_code})")
+        # Same settle time the per-SKU path allows before offers reference the items,
+        # paid once for the whole run
+        if any(r.get("success") for r in results):
+            time.sleep(1.5)
+        return results
+
 
 # --- appended: robust binder for upsert_offer_and_publish ---
 try:
@@ -860,16 +1059,14 @@ except Exception:
 
 
 # --- appended: robust Inventory API offer upsert + publish (function) ---
-def _eba_upsert_offer_and_publish(self, listing_data: dict) -> dict:
+def _eba_upsert_offer_and_publish(self, listing_data: dict, inventory_item_done: bool = False) -> dict:
     """
     CLEAN VERSION: Create inventory item, upload images, create offer, then publish.
+    With inventory_item_done=True the item already exists (bulk call) and
+    only the offer is created and published.
     Returns: {success: bool, offerId?: str, listingId?: str, error?: str}
     """
     import json, logging, time
-    try:
-        import requests
-    except Exception as e:
-        return {"success": False, "error": f"requests import failed: {e}"}
 
     logger = logging.getLogger("ebay")
 
@@ -911,98 +1108,52 @@ def _eba_upsert_offer_and_publish(self, listing_data: dict) -> dict:
         "Content-Language": "en-GB",
     }
 
-    # ===== STEP 0: HANDLE IMAGES =====
-    ebay_image_urls = []
-    
-    # First check if we already have eBay URLs
-    existing_urls = listing_data.get("imageUrls") or listing_data.get("image_urls") or []
-    if existing_urls:
-        ebay_image_urls = list(existing_urls)
-        logger.info(f"[images] SKU {sku}: Using {len(ebay_image_urls)} existing eBay URLs")
-    else:
-        # Check for local images to upload
-        local_images = listing_data.get("images") or listing_data.get("image_paths") or []
-        if local_images:
-            logger.info(f"[images] SKU {sku}: Uploading {len(local_images)} local images")
-            for img_path in local_images[:12]:
-                try:
-                    if img_path and isinstance(img_path, str) and hasattr(self, 'upload_image'):
-                        uploaded_url = self.upload_image(img_path, sku)
-                        if uploaded_url:
-                            ebay_image_urls.append(uploaded_url)
-                            logger.info(f"[images] Uploaded: {uploaded_url}")
-                except Exception as e:
-                    logger.warning(f"[images] Failed to upload {img_path}: {e}")
-            
-            logger.info(f"[images] SKU {sku}: Successfully uploaded {len(ebay_image_urls)} images")
-
-    # ===== STEP 1: CREATE/UPDATE INVENTORY ITEM =====
     category_id = str(listing_data.get("categoryId") or "176985")
-    media_cond = listing_data.get("media_condition") or "Very Good"
-    sleeve_cond = listing_data.get("sleeve_condition") or "Very Good"
-    
-    from vinyltool.core.constants import EBAY_INVENTORY_CONDITION_MAP
-    condition_enum = EBAY_INVENTORY_CONDITION_MAP.get(media_cond, "USED_GOOD")
-    
     full_html_description = listing_data.get("description") or "Vinyl LP"
-    title = listing_data.get("title") or "Vinyl Record"
-    
-    # Create plain text summary for inventory item (eBay limit: 4000 chars)
-    import re as _re
-    plain_summary = _re.sub(r'<[^>]+>', ' ', full_html_description)
-    plain_summary = _re.sub(r'\s+', ' ', plain_summary).strip()[:3900]
-    
-    # Build product dict
-    product_dict = {
-        "title": title[:80],
-        "description": plain_summary,
-        "aspects": {
-            "Media Condition": [media_cond],
-            "Sleeve Condition": [sleeve_cond],
-            "Format": [listing_data.get("format", "LP") or "LP"],
-            "Artist": [listing_data.get("artist") or "Unknown Artist"],
-            "Release Title": [listing_data.get("release_title") or listing_data.get("title") or "Unknown Album"],
-            "Release Year": [str(listing_data.get("year") or listing_data.get("release_year") or "Unknown")],
-        }
-    }
-    
-    # Only add imageUrls if we have them
-    if ebay_image_urls:
-        product_dict["imageUrls"] = ebay_image_urls
-    
-    inventory_item = {
-            "condition": condition_enum,
-        "product": product_dict,
-        "availability": {
-            "shipToLocationAvailability": {
-                "quantity": listing_data.get("quantity", 1)
-            }
-        }
-    }
-    
-    logger.info(f"[inventory] SKU {sku}: Creating with condition={condition_enum}, images={len(ebay_image_urls)}")
-    
-    try:
-        r_inv = requests.put(
-            f"{base}/inventory_item/{sku}",
-            headers=headers,
-            json=inventory_item,
-            timeout=60
-        )
-        logger.info(f"[inventory] SKU {sku}: Response {r_inv.status_code}")
-        
-        if r_inv.status_code not in (200, 201, 204):
-            err = r_inv.text[:500]
-            logger.error(f"[inventory] SKU {sku}: FAILED {r_inv.status_code}: {err}")
-            return {"success": False, "error": f"Inventory item failed: {err}"}
-        
-        logger.info(f"[inventory] SKU {sku}: Created successfully")
-        
-    except Exception as e:
-        logger.error(f"[inventory] SKU {sku}: Exception: {e}")
-        return {"success": False, "error": f"Inventory exception: {str(e)}"}
-    
-    time.sleep(1.5)
+
+    if not inventory_item_done:
+        # ===== STEP 0: HANDLE IMAGES =====
+        ebay_image_urls = []
+
+        # First check if we already have eBay URLs
+        existing_urls = listing_data.get("imageUrls") or listing_data.get("image_urls") or []
+        if existing_urls:
+            ebay_image_urls = list(existing_urls)
+            logger.info(f"[images] SKU {sku}: Using {len(ebay_image_urls)} existing eBay URLs")
+        else:
+            # Check for local images to upload
+            local_images = listing_data.get("images") or listing_data.get("image_paths") or []
+            if local_images:
+                logger.info(f"[images] SKU {sku}: Uploading {len(local_images)} local images")
+                paths = [p for p in local_images[:12] if p and isinstance(p, str)]
+                ebay_image_urls = self._upload_images(paths, sku)
+                logger.info(f"[images] SKU {sku}: Successfully uploaded {len(ebay_image_urls)} images")
+
+        # ===== STEP 1: CREATE/UPDATE INVENTORY ITEM =====
+        inventory_item = self._build_inventory_item(listing_data, ebay_image_urls)
+        logger.info(f"[inventory] SKU {sku}: Creating with condition={inventory_item['condition']}, images={len(ebay_image_urls)}")
+
+        try:
+            r_inv = self.session.put(
+                f"{base}/inventory_item/{sku}",
+                headers=headers,
+                json=inventory_item,
+                timeout=60
+            )
+            logger.info(f"[inventory] SKU {sku}: Response {r_inv.status_code}")
+
+            if r_inv.status_code not in (200, 201, 204):
+                err = r_inv.text[:500]
+                logger.error(f"[inventory] SKU {sku}: FAILED {r_inv.status_code}: {err}")
+                return {"success": False, "error": f"Inventory item failed: {err}"}
+
+            logger.info(f"[inventory] SKU {sku}: Created successfully")
+
+        except Exception as e:
+            logger.error(f"[inventory] SKU {sku}: Exception: {e}")
+            return {"success": False, "error": f"Inventory exception: {str(e)}"}
+
+        time.sleep(1.5)
 
     # ===== STEP 2: CREATE/UPDATE OFFER =====
     price = listing_data.get("price")
@@ -1036,7 +1187,7 @@ def _eba_upsert_offer_and_publish(self, listing_data: dict) -> dict:
     # Look up and DELETE existing offers to start fresh
     offer_id = None
     try:
-        r = requests.get(f"{base}/offer?sku={sku}", headers=headers, timeout=30)
+        r = self.session.get(f"{base}/offer?sku={sku}", headers=headers, timeout=30)
         if r.status_code == 200:
             offers = r.json().get("offers") or []
             if offers:
@@ -1046,7 +1197,7 @@ def _eba_upsert_offer_and_publish(self, listing_data: dict) -> dict:
                     if old_id:
                         try:
                             logger.info(f"[offer] Deleting old offer {old_id} for fresh start")
-                            requests.delete(f"{base}/offer/{old_id}", headers=headers, timeout=30)
+                            self.session.delete(f"{base}/offer/{old_id}", headers=headers, timeout=30)
                         except Exception as e:
                             logger.warning(f"[offer] Could not delete {old_id}: {e}")
                 # Don't reuse - force creation of new offer
@@ -1058,12 +1209,12 @@ def _eba_upsert_offer_and_publish(self, listing_data: dict) -> dict:
     try:
         if offer_id:
             logger.info(f"[offer] Updating existing offer {offer_id}")
-            pu = requests.put(f"{base}/offer/{offer_id}", headers=headers, json=offer_body, timeout=60)
+            pu = self.session.put(f"{base}/offer/{offer_id}", headers=headers, json=offer_body, timeout=60)
             if pu.status_code not in (200, 201, 204):
                 return {"success": False, "error": f"Offer update failed: {pu.status_code} {pu.text}"}
         else:
             logger.info(f"[offer] Creating new offer")
-            pc = requests.post(f"{base}/offer", headers=headers, json=offer_body, timeout=60)
+            pc = self.session.post(f"{base}/offer", headers=headers, json=offer_body, timeout=60)
             if pc.status_code not in (200, 201):
                 return {"success": False, "error": f"Offer create failed: {pc.status_code} {pc.text}"}
             offer_id = pc.json().get("offerId") or (pc.json().get("offer") or {}).get("offerId")
@@ -1076,7 +1227,7 @@ def _eba_upsert_offer_and_publish(self, listing_data: dict) -> dict:
     # ===== STEP 3: PUBLISH =====
     logger.info(f"[offer] Publishing offer {offer_id}")
     try:
-        pb = requests.post(f"{base}/offer/{offer_id}/publish", headers=headers, timeout=30)
+        pb = self.session.post(f"{base}/offer/{offer_id}/publish", headers=headers, timeout=30)
         if pb.status_code not in (200, 201):
             return {"success": False, "error": f"Publish failed: {pb.status_code} {pb.text}"}
         